@@ -8,7 +8,9 @@ from jinja2 import Environment, select_autoescape, FileSystemLoader, ChoiceLoade
 
 from conans.assets.templates import dict_loader
 from conans.client.cache.editable import EditablePackages
+from conans.client.cache.recipe_index import RecipeIndex
 from conans.client.cache.remote_registry import RemoteRegistry
+from conans.client.cache.update_checks import UpdateChecks
 from conans.client.conf import ConanClientConfigParser, get_default_client_conf, \
     get_default_settings_yml
 from conans.client.conf.detect import detect_defaults_settings
@@ -33,6 +35,8 @@ PROFILES_FOLDER = "profiles"
 HOOKS_FOLDER = "hooks"
 TEMPLATES_FOLDER = "templates"
 GENERATORS_FOLDER = "generators"
+RECIPE_INDEX = ".recipes.db"
+UPDATE_CHECKS = ".update_checks.db"
 
 
 def is_case_insensitive_os():
@@ -73,16 +77,25 @@ class ClientCache(object):
 
         # Caching
         self._no_lock = None
+        self._lock_backend_name = None
         self._config = None
+        self._settings = None  # (stamp of the settings.yml, Settings)
         self.editable_packages = EditablePackages(self.cache_folder)
         # paths
         self._store_folder = self.config.storage_path or self.cache_folder
         # Just call it to make it raise in case of short_paths misconfiguration
         _ = self.config.short_paths_home
 
-    def all_refs(self):
-        subdirs = list_folder_subdirs(basedir=self._store_folder, level=4)
-        return [ConanFileReference.load_dir_repr(folder) for folder in subdirs]
+    def all_refs(self, name=None):
+        return self.recipe_index.refs(name)
+
+    @property
+    def recipe_index(self):
+        return RecipeIndex(join(self.cache_folder, RECIPE_INDEX), self._store_folder)
+
+    @property
+    def update_checks(self):
+        return UpdateChecks(join(self.cache_folder, UPDATE_CHECKS))
 
     @property
     def store(self):
@@ -107,7 +120,9 @@ class ClientCache(object):
             check_ref_case(ref, self.store)
             base_folder = os.path.normpath(os.path.join(self.store, ref.dir_repr()))
             return PackageCacheLayout(base_folder=base_folder, ref=ref,
-                                      short_paths=short_paths, no_lock=self._no_locks())
+                                      short_paths=short_paths, no_lock=self._no_locks(),
+                                      recipe_index=self.recipe_index,
+                                      lock_backend=self._lock_backend())
 
     @property
     def remotes_path(self):
@@ -122,6 +137,11 @@ class ClientCache(object):
             self._no_lock = self.config.cache_no_locks
         return self._no_lock
 
+    def _lock_backend(self):
+        if self._lock_backend_name is None:
+            self._lock_backend_name = self.config.cache_lock_backend
+        return self._lock_backend_name
+
     @property
     def artifacts_properties_path(self):
         return join(self.cache_folder, ARTIFACTS_PROPERTIES_FILE)
@@ -201,8 +221,12 @@ class ClientCache(object):
         """Returns {setting: [value, ...]} defining all the possible
            settings without values"""
         self.initialize_settings()
-        content = load(self.settings_path)
-        return Settings.loads(content)
+        stats = os.stat(self.settings_path)
+        stamp = stats.st_mtime_ns, stats.st_size
+        if self._settings is None or self._settings[0] != stamp:
+            content = load(self.settings_path)
+            self._settings = stamp, Settings.loads(content)
+        return self._settings[1].copy()
 
     @property
     def hooks(self):
@@ -244,6 +268,8 @@ class ClientCache(object):
             conan_folder = os.path.join(self._store_folder, folder)
             Lock.clean(conan_folder)
             shutil.rmtree(os.path.join(conan_folder, "locks"), ignore_errors=True)
+        # The storage has been fully walked, good moment to fix a possibly outdated index
+        self.recipe_index.rebuild(folders)
 
     def get_template(self, template_name, user_overrides=False):
         # TODO: It can be initialized only once together with the Conan app
@@ -0,0 +1,150 @@
+import json
+import os
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+
+from conans.errors import ConanException
+from conans.model.ref import ConanFileReference
+from conans.util.files import list_folder_subdirs
+
+RECIPES_TABLE = "recipes"
+STAMP_TABLE = "stamp"
+
+
+class RecipeIndex(object):
+    """ Persistent index of the recipe references existing in the cache storage, so they can be
+    listed and searched by name without walking the whole storage folder. It is updated by the
+    operations that create or remove recipes in the cache. If the database file doesn't exist
+    (or it was deleted), the index is rebuilt walking the storage folder.
+
+    The index also stores a stamp of the storage (its listing and the modification time of the
+    name folders), and it is rebuilt if the storage has been modified without updating the index,
+    like recipes copied or removed directly in the storage folder. Changes in the deeper levels of
+    an existing version (a new user/channel) are not detected, "conan cache reindex" fixes them
+    """
+
+    def __init__(self, dbfile, store_folder):
+        self._dbfile = dbfile
+        self._store_folder = store_folder
+
+    def _storage_stamp(self):
+        """ {name: mtime} of the first level of the storage, a new or removed recipe changes
+        the listing of the storage or the modification time of its name folder
+        """
+        stamp = {}
+        try:
+            names = os.listdir(self._store_folder)
+        except OSError:
+            return stamp
+        for name in names:
+            try:
+                stamp[name] = os.path.getmtime(os.path.join(self._store_folder, name))
+            except OSError:  # Removed meanwhile
+                pass
+        return stamp
+
+    @staticmethod
+    def _is_stale(connection, stamp, changed_name):
+        try:
+            row = connection.execute("select value from %s" % STAMP_TABLE).fetchone()
+        except sqlite3.Error:  # Index created by a previous version, without stamp
+            return True
+        saved_stamp = json.loads(row[0]) if row else {}
+        saved_stamp.pop(changed_name, None)
+        return saved_stamp != {k: v for k, v in stamp.items() if k != changed_name}
+
+    @staticmethod
+    def _save_stamp(connection, stamp):
+        connection.execute("delete from %s" % STAMP_TABLE)
+        connection.execute("insert into %s values (?)" % STAMP_TABLE, (json.dumps(stamp), ))
+
+    @contextmanager
+    def _connect(self, changed_name=None):
+        """ :param changed_name: The name folder of the storage being modified by the caller, its
+        changes do not make the index stale, and the stamp is updated with them
+        """
+        stamp = self._storage_stamp()
+        if os.path.isfile(self._dbfile):
+            connection = sqlite3.connect(self._dbfile, timeout=60)
+            stale = self._is_stale(connection, stamp, changed_name)
+            connection.close()
+        else:
+            stale = True
+        if stale:
+            self.rebuild()
+        connection = sqlite3.connect(self._dbfile, timeout=60)
+        connection.text_factory = str
+        try:
+            yield connection
+            if changed_name is not None and not stale:
+                self._save_stamp(connection, stamp)
+            connection.commit()
+        except sqlite3.Error as e:
+            raise ConanException("Error accessing the recipes index: %s\n"
+                                 "Try removing '%s' file" % (str(e), self._dbfile))
+        finally:
+            connection.close()
+
+    def rebuild(self, folders=None):
+        """ creates a new database with the references found walking the storage folder and
+        replaces atomically the existing one
+        :param folders: The storage folders of the references, if they have been already listed
+        :return: The number of indexed references
+        """
+        db_folder = os.path.dirname(self._dbfile)
+        if not os.path.exists(db_folder):
+            os.makedirs(db_folder)
+        fd, tmp_dbfile = tempfile.mkstemp(suffix=".tmp", dir=db_folder)
+        os.close(fd)
+        # Before walking, so the changes done meanwhile are detected later
+        stamp = self._storage_stamp()
+        if folders is None:
+            folders = list_folder_subdirs(basedir=self._store_folder, level=4)
+        connection = sqlite3.connect(tmp_dbfile)
+        connection.text_factory = str
+        try:
+            connection.execute("create table %s (value TEXT)" % STAMP_TABLE)
+            self._save_stamp(connection, stamp)
+            connection.execute("create table %s (name TEXT, version TEXT, user TEXT, "
+                               "channel TEXT, UNIQUE(name, version, user, channel))"
+                               % RECIPES_TABLE)
+            connection.execute("create index name_index on %s (name COLLATE NOCASE)"
+                               % RECIPES_TABLE)
+            connection.executemany("insert or ignore into %s values (?, ?, ?, ?)" % RECIPES_TABLE,
+                                   [folder.split("/") for folder in folders])
+            connection.commit()
+        except Exception:
+            connection.close()
+            os.remove(tmp_dbfile)
+            raise
+        connection.close()
+        try:
+            os.replace(tmp_dbfile, self._dbfile)
+        except AttributeError:  # Python 2
+            if os.path.exists(self._dbfile):
+                os.remove(self._dbfile)
+            os.rename(tmp_dbfile, self._dbfile)
+        return len(folders)
+
+    def add(self, ref):
+        with self._connect(ref.name) as connection:
+            connection.execute("insert or ignore into %s values (?, ?, ?, ?)" % RECIPES_TABLE,
+                               ref.dir_repr().split("/"))
+
+    def remove(self, ref):
+        with self._connect(ref.name) as connection:
+            connection.execute("delete from %s where name=? and version=? and user=? "
+                               "and channel=?" % RECIPES_TABLE, ref.dir_repr().split("/"))
+
+    def refs(self, name=None):
+        """ all the references in the index, or only the ones with the given name (case
+        insensitive, as the search of recipes)
+        """
+        with self._connect() as connection:
+            query = "select name, version, user, channel from %s" % RECIPES_TABLE
+            if name is not None:
+                rows = connection.execute(query + " where name=? COLLATE NOCASE", (name, ))
+            else:
+                rows = connection.execute(query)
+            return [ConanFileReference.load_dir_repr("/".join(row)) for row in rows]
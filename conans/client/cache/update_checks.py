@@ -0,0 +1,66 @@
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+from conans.errors import ConanException
+from conans.model.manifest import FileTreeManifest
+
+CHECKS_TABLE = "checks"
+
+
+class UpdateChecks(object):
+    """ Persistent cache of the latest recipe revisions and manifests found in the remotes when
+    checking for updates (--update), shared by all the processes using the same cache. A check
+    is reused while it is younger than the "update_check_ttl" of the conan.conf, so consecutive
+    installs don't request the same references to the remotes again
+    """
+
+    def __init__(self, dbfile):
+        self._dbfile = dbfile
+
+    @contextmanager
+    def _connect(self):
+        db_folder = os.path.dirname(self._dbfile)
+        if not os.path.exists(db_folder):
+            os.makedirs(db_folder)
+        connection = sqlite3.connect(self._dbfile, timeout=60)
+        connection.text_factory = str
+        try:
+            # "revision" is the one requested, if any, "remote_revision" the latest in the remote
+            connection.execute("create table if not exists %s (reference TEXT, revision TEXT, "
+                               "remote TEXT, time REAL, remote_revision TEXT, manifest TEXT, "
+                               "PRIMARY KEY (reference, revision, remote))" % CHECKS_TABLE)
+            yield connection
+            connection.commit()
+        except sqlite3.Error as e:
+            raise ConanException("Error accessing the update checks cache: %s\n"
+                                 "Try removing '%s' file" % (str(e), self._dbfile))
+        finally:
+            connection.close()
+
+    def get(self, ref, remote, ttl):
+        """ The (manifest, ref with revision) of the ref in the remote, if it was checked less
+        than "ttl" seconds ago, otherwise None
+        """
+        with self._connect() as connection:
+            row = connection.execute("select time, remote_revision, manifest from %s where "
+                                     "reference=? and revision=? and remote=?" % CHECKS_TABLE,
+                                     (str(ref), ref.revision or "", remote.url)).fetchone()
+        if row is None:
+            return None
+        checked_time, revision, manifest = row
+        if not (0 <= time.time() - checked_time < ttl):
+            return None
+        return FileTreeManifest.loads(manifest), ref.copy_with_rev(revision)
+
+    def set(self, ref, remote, manifest, remote_ref):
+        with self._connect() as connection:
+            connection.execute("insert or replace into %s values (?, ?, ?, ?, ?, ?)"
+                               % CHECKS_TABLE, (str(ref), ref.revision or "", remote.url,
+                                                time.time(), remote_ref.revision, repr(manifest)))
+
+    def remove(self, ref):
+        """ The checks of the reference in all the remotes, e.g. if it is uploaded """
+        with self._connect() as connection:
+            connection.execute("delete from %s where reference=?" % CHECKS_TABLE, (str(ref), ))
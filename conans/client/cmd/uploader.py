@@ -1,9 +1,11 @@
 import os
 import stat
 import tarfile
+import threading
 import time
 import traceback
 from collections import defaultdict
+from contextlib import contextmanager
 from multiprocessing.pool import ThreadPool
 
 from conans.util import progress_bar
@@ -150,6 +152,44 @@ class _UploadCollecter(object):
         return refs_by_remote
 
 
+class _PackagesPipeline(object):
+    """ compresses the packages of a recipe in the CPU pool ahead of their transfer in the
+    upload (I/O) pool, but never more than "window" packages ahead of the uploaded ones, so the
+    compressed packages do not pile up if the network is the bottleneck (back-pressure)
+    """
+    def __init__(self, pool, prepare, items, window):
+        self._pool = pool
+        self._prepare = prepare
+        self._items = items
+        self._results = {}
+        self._next = 0
+        self._condition = threading.Condition()
+        for _ in range(window):
+            self._submit()
+
+    def _submit(self):
+        with self._condition:
+            if self._next < len(self._items):
+                self._results[self._next] = self._pool.apply_async(self._prepare,
+                                                                   (self._items[self._next],))
+                self._next += 1
+                self._condition.notify_all()
+
+    def get(self, index):
+        """ waits until the item "index" is prepared, returns it or raises its error
+        """
+        with self._condition:
+            while index not in self._results:
+                self._condition.wait()
+            result = self._results.pop(index)
+        return result.get()
+
+    def done(self):
+        """ an item has been consumed, so other can be prepared
+        """
+        self._submit()
+
+
 class CmdUpload(object):
     """ This class is responsible for uploading packages to remotes. The flow is:
     - Collect all the packages to be uploaded with the UploadCollecter
@@ -190,7 +230,21 @@ class CmdUpload(object):
         self._loader = loader
         self._hook_manager = hook_manager
         self._upload_thread_pool = None
+        self._compress_thread_pool = None
         self._exceptions_list = []
+        self._phases_time = defaultdict(float)
+        self._phases_lock = threading.Lock()
+
+    @contextmanager
+    def _phase(self, name):
+        """ accumulates the time spent in each phase of the upload (the time of all the threads)
+        """
+        t1 = time.time()
+        try:
+            yield
+        finally:
+            with self._phases_lock:
+                self._phases_time[name] += time.time() - t1
 
     def upload(self, reference_or_pattern, remotes, upload_recorder, package_id=None,
                all_packages=None, confirm=False, retry=None, retry_wait=None, integrity_check=False,
@@ -203,6 +257,8 @@ class CmdUpload(object):
 
         if parallel_upload:
             self._user_io.disable_input()
+            # The packages are compressed (CPU) and transferred (I/O) in different pools
+            self._compress_thread_pool = ThreadPool(cpu_count())
         self._upload_thread_pool = ThreadPool(
             cpu_count() if parallel_upload else 1)
 
@@ -225,6 +281,19 @@ class CmdUpload(object):
 
         self._upload_thread_pool.close()
         self._upload_thread_pool.join()
+        if self._compress_thread_pool:
+            self._compress_thread_pool.close()
+            self._compress_thread_pool.join()
+
+        duration = time.time() - t1
+        phases = ", ".join("%s %.2fs" % (phase, self._phases_time[phase])
+                           for phase in ("compress", "checksum", "transfer"))
+        logger.debug("UPLOAD: Time of the upload phases: %s" % phases)
+        if parallel_upload:
+            # The threads time of each phase compared with the total time shows if the upload
+            # is limited by the CPU (compression) or by the network (transfer)
+            self._output.info("Upload time %.2fs, phases time of all threads: %s"
+                              % (duration, phases))
 
         if len(self._exceptions_list) > 0:
             for exc, ref, trace, remote in self._exceptions_list:
@@ -257,6 +326,14 @@ class CmdUpload(object):
             total = len(prefs)
             p_remote = recipe_remote
 
+            pipeline = None
+            if self._compress_thread_pool:
+                def prepare_package(pref_):
+                    return self._prepare_package(pref_, integrity_check, p_remote)
+                window = 2 * cpu_count()
+                pipeline = _PackagesPipeline(self._compress_thread_pool, prepare_package, prefs,
+                                             window)
+
             def upload_package_index(index_pref):
                 index, pref = index_pref
                 try:
@@ -264,11 +341,20 @@ class CmdUpload(object):
                                                                         str(pref.id),
                                                                         p_remote.name)
                     self._output.info(left_justify_message(up_msg))
-                    self._upload_package(pref, retry, retry_wait, integrity_check, policy, p_remote)
+                    if pipeline:
+                        the_files, checksums = pipeline.get(index)
+                        self._transfer_package(pref, the_files, checksums, retry, retry_wait,
+                                               policy, p_remote)
+                    else:
+                        self._upload_package(pref, retry, retry_wait, integrity_check, policy,
+                                             p_remote)
                     upload_recorder.add_package(pref, p_remote.name, p_remote.url)
                 except BaseException as pkg_exc:
                     trace = traceback.format_exc()
                     return pkg_exc, pref, trace, p_remote
+                finally:
+                    if pipeline:
+                        pipeline.done()
 
             def upload_package_callback(ret):
                 package_exceptions = [r for r in ret if r is not None]
@@ -281,10 +367,11 @@ class CmdUpload(object):
 
             # This doesn't wait for the packages to end, so the function returns
             # and the "pool entry" for the recipe is released
+            # chunksize=1, so the packages are transferred in the same order they are prepared
             self._upload_thread_pool.map_async(upload_package_index,
                                                [(index, pref) for index, pref
                                                 in enumerate(prefs)],
-                                               callback=upload_package_callback)
+                                               callback=upload_package_callback, chunksize=1)
         else:
             # FIXME: I think it makes no sense to specify a remote to "post_upload"
             # FIXME: because the recipe can have one and the package a different one
@@ -303,10 +390,13 @@ class CmdUpload(object):
                                    reference=ref, remote=remote)
 
         t1 = time.time()
-        cache_files = self._compress_recipe_files(ref)
+        with self._phase("compress"):
+            cache_files = self._compress_recipe_files(ref)
 
+        with self._phase("checksum"):
+            checksums = calc_files_checksum(cache_files)
         with self._cache.package_layout(ref).update_metadata() as metadata:
-            metadata.recipe.checksums = calc_files_checksum(cache_files)
+            metadata.recipe.checksums = checksums
 
         local_manifest = FileTreeManifest.loads(load(cache_files["conanmanifest.txt"]))
 
@@ -327,15 +417,19 @@ class CmdUpload(object):
         if policy == UPLOAD_POLICY_SKIP:
             return ref
 
-        files_to_upload, deleted = self._recipe_files_to_upload(ref, policy, cache_files, remote,
-                                                                remote_manifest, local_manifest)
-
-        if files_to_upload or deleted:
-            self._remote_manager.upload_recipe(ref, files_to_upload, deleted, remote, retry,
-                                               retry_wait)
-            self._upload_recipe_end_msg(ref, remote)
-        else:
-            self._output.info("Recipe is up to date, upload skipped")
+        with self._phase("transfer"):
+            files_to_upload, deleted = self._recipe_files_to_upload(ref, policy, cache_files,
+                                                                    remote, remote_manifest,
+                                                                    local_manifest)
+
+            if files_to_upload or deleted:
+                self._remote_manager.upload_recipe(ref, files_to_upload, deleted, remote, retry,
+                                                   retry_wait)
+                # The latest revision in the remotes changed, check it again the next time
+                self._cache.update_checks.remove(ref)
+                self._upload_recipe_end_msg(ref, remote)
+            else:
+                self._output.info("Recipe is up to date, upload skipped")
         duration = time.time() - t1
         log_recipe_upload(ref, duration, cache_files, remote.name)
         self._hook_manager.execute("post_upload_recipe", conanfile_path=conanfile_path,
@@ -350,7 +444,13 @@ class CmdUpload(object):
 
     def _upload_package(self, pref, retry=None, retry_wait=None, integrity_check=False,
                         policy=None, p_remote=None):
+        the_files, checksums = self._prepare_package(pref, integrity_check, p_remote)
+        return self._transfer_package(pref, the_files, checksums, retry, retry_wait, policy,
+                                      p_remote)
 
+    def _prepare_package(self, pref, integrity_check, p_remote):
+        """ CPU bound part of the upload of a package: compression and checksums
+        """
         assert (pref.revision is not None), "Cannot upload a package without PREV"
         assert (pref.ref.revision is not None), "Cannot upload a package without RREV"
 
@@ -361,19 +461,32 @@ class CmdUpload(object):
                                    package_id=pref.id,
                                    remote=p_remote)
 
-        t1 = time.time()
-        the_files = self._compress_package_files(pkg_layout, pref, integrity_check)
+        with self._phase("compress"):
+            the_files = self._compress_package_files(pkg_layout, pref, integrity_check)
+        with self._phase("checksum"):
+            checksums = calc_files_checksum(the_files)
+        return the_files, checksums
 
+    def _transfer_package(self, pref, the_files, checksums, retry, retry_wait, policy,
+                          p_remote):
+        """ I/O bound part of the upload of a package, the files are already compressed
+        """
         if policy == UPLOAD_POLICY_SKIP:
             return None
-        files_to_upload, deleted = self._package_files_to_upload(pref, policy, the_files, p_remote)
 
-        if files_to_upload or deleted:
-            self._remote_manager.upload_package(pref, files_to_upload, deleted, p_remote, retry,
-                                                retry_wait)
-            logger.debug("UPLOAD: Time upload package: %f" % (time.time() - t1))
-        else:
-            self._output.info("Package is up to date, upload skipped")
+        pkg_layout = self._cache.package_layout(pref.ref)
+        conanfile_path = pkg_layout.conanfile()
+        t1 = time.time()
+        with self._phase("transfer"):
+            files_to_upload, deleted = self._package_files_to_upload(pref, policy, the_files,
+                                                                     p_remote)
+
+            if files_to_upload or deleted:
+                self._remote_manager.upload_package(pref, files_to_upload, deleted, p_remote,
+                                                    retry, retry_wait)
+                logger.debug("UPLOAD: Time upload package: %f" % (time.time() - t1))
+            else:
+                self._output.info("Package is up to date, upload skipped")
 
         duration = time.time() - t1
         log_package_upload(pref, duration, the_files, p_remote)
@@ -383,7 +496,6 @@ class CmdUpload(object):
         logger.debug("UPLOAD: Time uploader upload_package: %f" % (time.time() - t1))
 
         # Update the package metadata
-        checksums = calc_files_checksum(the_files)
         with pkg_layout.update_metadata() as metadata:
             cur_package_remote = metadata.packages[pref.id].remote
             if not cur_package_remote:
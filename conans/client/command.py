@@ -1755,6 +1755,46 @@ class Command(object):
 
         self._conan.export_alias(args.reference, args.target)
 
+    def cache(self, *args):
+        """
+        Manages the Conan cache.
+
+        Use the subcommand 'reindex' to rebuild the index of the recipes in the
+        cache, used to search and resolve version ranges, from the storage folder.
+        Use 'download-stats' and 'download-prune' to show the size of the download
+        cache (storage.download_cache) and remove its least recently used files.
+        """
+        parser = argparse.ArgumentParser(description=self.cache.__doc__,
+                                         prog="conan cache",
+                                         formatter_class=SmartFormatter)
+        subparsers = parser.add_subparsers(dest='subcommand', help='sub-command help')
+        subparsers.required = True
+
+        subparsers.add_parser('reindex', help='Rebuild the index of the recipes in the cache')
+        subparsers.add_parser('download-stats', help='Show the files and size of the download '
+                                                     'cache')
+        prune_parser = subparsers.add_parser('download-prune',
+                                             help='Remove the least recently used files of the '
+                                                  'download cache until it is not larger than '
+                                                  'the maximum size')
+        prune_parser.add_argument("-s", "--max-size", type=float,
+                                  help="Maximum size in MB, by default the "
+                                       "'storage.download_cache_max_size' of the conan.conf")
+        args = parser.parse_args(*args)
+        self._warn_python_version()
+
+        if args.subcommand == "reindex":
+            count = self._conan.cache_reindex()
+            self._out.success("Indexed %s recipes from the cache" % count)
+        elif args.subcommand == "download-stats":
+            files, size = self._conan.download_cache_stats()
+            self._out.info("Download cache: %d files, %.2f MB" % (files, size / (1024.0 * 1024)))
+        elif args.subcommand == "download-prune":
+            max_size = int(args.max_size * 1024 * 1024) if args.max_size is not None else None
+            files, size = self._conan.download_cache_prune(max_size)
+            self._out.success("Removed %d files, %.2f MB from the download cache"
+                              % (files, size / (1024.0 * 1024)))
+
     def workspace(self, *args):
         """
         Manages a workspace (a set of packages consumed from the user workspace that
@@ -1943,7 +1983,8 @@ class Command(object):
                 ("Package development commands", ("source", "build", "package", "editable",
                                                   "workspace")),
                 ("Misc commands", ("profile", "remote", "user", "imports", "copy", "remove",
-                                   "alias", "download", "inspect", "help", "lock", "frogarian"))]
+                                   "alias", "download", "inspect", "help", "lock", "cache",
+                                   "frogarian"))]
 
         def check_all_commands_listed():
             """Keep updated the main directory, raise if don't"""
@@ -2232,9 +2273,10 @@ _help_build_policies = '''Optional, specify which packages to build from source.
 '''
 
 
-def main(args):
+def main(args, conan_api=None):
     """ main entry point of the conan application, using a Command to
-    parse parameters
+    parse parameters. The daemon (conans/client/daemon.py) provides an already
+    initialized conan_api
 
     Exit codes for conan command:
 
@@ -2247,7 +2289,8 @@ def main(args):
         6: Invalid configuration (done)
     """
     try:
-        conan_api, _, _ = Conan.factory()
+        if conan_api is None:
+            conan_api, _, _ = Conan.factory()
     except ConanMigrationError:  # Error migrating
         sys.exit(ERROR_MIGRATION)
     except ConanException as e:
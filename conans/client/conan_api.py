@@ -9,6 +9,7 @@ from six import StringIO
 import conans
 from conans import __version__ as client_version
 from conans.client.cache.cache import ClientCache
+from conans.client.cache.editable import EDITABLE_PACKAGES_FILE
 from conans.client.cmd.build import cmd_build
 from conans.client.cmd.create import create
 from conans.client.cmd.download import download
@@ -45,6 +46,7 @@ from conans.client.remote_manager import RemoteManager
 from conans.client.remover import ConanRemover
 from conans.client.rest.auth_manager import ConanApiAuthManager
 from conans.client.rest.conan_requester import ConanRequester
+from conans.client.rest.download_cache import CachedFileDownloader
 from conans.client.rest.rest_client import RestApiClientFactory
 from conans.client.runner import ConanRunner
 from conans.client.source import config_source_local
@@ -198,7 +200,14 @@ class ConanApp(object):
                                             self.config.generate_run_log_file,
                                             self.config.log_run_to_output,
                                             self.out)
+        self.quiet = quiet_output is not None
+        self._stamp = self._files_stamp()
+        self._init_graph()
 
+    def _init_graph(self):
+        """ The collaborators to load recipes and compute graphs, they keep the python_requires
+        and resolved ranges of a command, so they are created again for every command
+        """
         self.proxy = ConanProxy(self.cache, self.out, self.remote_manager)
         self.range_resolver = RangeResolver(self.cache, self.remote_manager)
         self.generator_manager = GeneratorManager()
@@ -212,6 +221,37 @@ class ConanApp(object):
         self.graph_manager = GraphManager(self.out, self.cache, self.remote_manager, self.loader,
                                           self.proxy, self.range_resolver, self.binaries_analyzer)
 
+    def _files_stamp(self):
+        """ The files of the cache and the environment variables read when the app is created,
+        if they change, the app is outdated
+        """
+        paths = [self.cache.conan_conf_path, self.cache.remotes_path, self.cache.settings_path,
+                 self.cache.artifacts_properties_path, self.cache.hooks_path,
+                 os.path.join(self.cache_folder, EDITABLE_PACKAGES_FILE)]
+        for hook_name in self.config.hooks:
+            if not hook_name.endswith(".py"):
+                hook_name = "%s.py" % hook_name
+            paths.append(os.path.join(self.cache.hooks_path, hook_name))
+        stamp = []
+        for path in paths:
+            try:
+                stats = os.stat(path)
+                stamp.append((path, stats.st_mtime_ns, stats.st_size))
+            except OSError:
+                stamp.append((path, None, None))
+        env_vars = sorted((k, v) for k, v in os.environ.items() if k.startswith("CONAN_"))
+        return stamp, env_vars
+
+    def reuse(self):
+        """ Prepares the app for a new command, returns False if it can't be reused because the
+        configuration changed since it was created
+        """
+        if self.quiet or self._files_stamp() != self._stamp:
+            return False
+        set_global_instances(self.out, self.requester, self.config)
+        self._init_graph()
+        return True
+
     def load_remotes(self, remote_name=None, update=False, check_updates=False):
         remotes = self.cache.registry.load_remotes()
         if remote_name:
@@ -228,7 +268,7 @@ class ConanAPIV1(object):
         return cls(), None, None
 
     def __init__(self, cache_folder=None, output=None, user_io=None, http_requester=None,
-                 runner=None):
+                 runner=None, persistent_app=False):
         self.color = colorama_initialize()
         self.out = output or ConanOutput(sys.stdout, sys.stderr, self.color)
         self.user_io = user_io or UserIO(out=self.out)
@@ -236,6 +276,9 @@ class ConanAPIV1(object):
         self.http_requester = http_requester
         self.runner = runner
         self.app = None  # Api calls will create a new one every call
+        # If True, the app (cache, configuration, remote sessions...) is reused by all the api
+        # calls, while the configuration files of the cache don't change
+        self.persistent_app = persistent_app
         # Migration system
         migrator = ClientMigrator(self.cache_folder, Version(client_version), self.out)
         migrator.migrate()
@@ -245,6 +288,9 @@ class ConanAPIV1(object):
             sys.path.append(os.path.join(self.cache_folder, "python"))
 
     def create_app(self, quiet_output=None):
+        if self.persistent_app and self.app is not None and quiet_output is None:
+            if self.app.reuse():
+                return
         self.app = ConanApp(self.cache_folder, self.user_io, self.http_requester,
                             self.runner, quiet_output=quiet_output)
 
@@ -1093,6 +1139,36 @@ class ConanAPIV1(object):
     def remove_locks(self):
         self.app.cache.remove_locks()
 
+    @api_method
+    def cache_reindex(self):
+        return self.app.cache.recipe_index.rebuild()
+
+    @api_method
+    def download_cache_stats(self):
+        """ (number of files, size in bytes) of the download cache """
+        download_cache = self._download_cache_folder()
+        return CachedFileDownloader.stats(download_cache)
+
+    @api_method
+    def download_cache_prune(self, max_size=None):
+        """ Removes the least recently used files of the download cache until its size is not
+        larger than "max_size" bytes (by default, the configured download_cache_max_size).
+        Returns the (number of files, bytes) removed
+        """
+        download_cache = self._download_cache_folder()
+        if max_size is None:
+            max_size = self.app.config.download_cache_max_size
+            if max_size is None:
+                raise ConanException("Specify the maximum size or define the "
+                                     "'storage.download_cache_max_size' in the conan.conf")
+        return CachedFileDownloader.prune(download_cache, max_size)
+
+    def _download_cache_folder(self):
+        download_cache = self.app.config.download_cache
+        if not download_cache:
+            raise ConanException("There is no 'storage.download_cache' defined in the conan.conf")
+        return download_cache
+
     @api_method
     def profile_list(self):
         return cmd_profile_list(self.app.cache.profiles_path, self.app.out)
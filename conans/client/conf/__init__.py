@@ -132,11 +132,13 @@ _t_default_client_conf = Template(textwrap.dedent("""
     [general]
     default_profile = {{default_profile}}
     compression_level = 9                 # environment CONAN_COMPRESSION_LEVEL
+    # compression_threads = 4             # environment CONAN_COMPRESSION_THREADS
     sysrequires_sudo = True               # environment CONAN_SYSREQUIRES_SUDO
     request_timeout = 60                  # environment CONAN_REQUEST_TIMEOUT (seconds)
     default_package_id_mode = semver_direct_mode # environment CONAN_DEFAULT_PACKAGE_ID_MODE
     # retry = 2                             # environment CONAN_RETRY
     # retry_wait = 5                        # environment CONAN_RETRY_WAIT (seconds)
+    # update_check_ttl = 600              # environment CONAN_UPDATE_CHECK_TTL (seconds the remote revisions checked by --update are reused, 0 to check always)
     # sysrequires_mode = enabled          # environment CONAN_SYSREQUIRES_MODE (allowed modes enabled/verify/disabled)
     # vs_installation_preference = Enterprise, Professional, Community, BuildTools # environment CONAN_VS_INSTALLATION_PREFERENCE
     # verbose_traceback = False           # environment CONAN_VERBOSE_TRACEBACK
@@ -144,6 +146,7 @@ _t_default_client_conf = Template(textwrap.dedent("""
     # bash_path = ""                      # environment CONAN_BASH_PATH (only windows)
     # read_only_cache = True              # environment CONAN_READ_ONLY_CACHE
     # cache_no_locks = True               # environment CONAN_CACHE_NO_LOCKS
+    # cache_lock_backend = fcntl          # environment CONAN_CACHE_LOCK_BACKEND (allowed counter/fcntl)
     # user_home_short = your_path         # environment CONAN_USER_HOME_SHORT
     # use_always_short_paths = False      # environment CONAN_USE_ALWAYS_SHORT_PATHS
     # skip_vs_projects_upgrade = False    # environment CONAN_SKIP_VS_PROJECTS_UPGRADE
@@ -187,6 +190,8 @@ _t_default_client_conf = Template(textwrap.dedent("""
     # path beginning with "~" (if the environment var CONAN_USER_HOME is specified, this directory, even
     # with "~/", will be relative to the conan user home, not to the system user home)
     path = ./data
+    # download_cache = /path/to/my/cache
+    # download_cache_max_size = 10240     # MB, the least recently used files are removed above it
 
     [proxies]
     # Empty (or missing) section will try to use system proxies.
@@ -231,14 +236,17 @@ class ConanClientConfigParser(ConfigParser, object):
         ],
         "general": [
             ("CONAN_COMPRESSION_LEVEL", "compression_level", 9),
+            ("CONAN_COMPRESSION_THREADS", "compression_threads", None),
             ("CONAN_NON_INTERACTIVE", "non_interactive", False),
             ("CONAN_SKIP_BROKEN_SYMLINKS_CHECK", "skip_broken_symlinks_check", False),
             ("CONAN_CACHE_NO_LOCKS", "cache_no_locks", False),
+            ("CONAN_CACHE_LOCK_BACKEND", "cache_lock_backend", None),
             ("CONAN_SYSREQUIRES_SUDO", "sysrequires_sudo", False),
             ("CONAN_SYSREQUIRES_MODE", "sysrequires_mode", None),
             ("CONAN_REQUEST_TIMEOUT", "request_timeout", None),
             ("CONAN_RETRY", "retry", None),
             ("CONAN_RETRY_WAIT", "retry_wait", None),
+            ("CONAN_UPDATE_CHECK_TTL", "update_check_ttl", None),
             ("CONAN_VS_INSTALLATION_PREFERENCE", "vs_installation_preference", None),
             ("CONAN_CPU_COUNT", "cpu_count", None),
             ("CONAN_READ_ONLY_CACHE", "read_only_cache", None),
@@ -401,6 +409,19 @@ class ConanClientConfigParser(ConfigParser, object):
         except ConanException:
             return False
 
+    @property
+    def cache_lock_backend(self):
+        try:
+            backend = get_env("CONAN_CACHE_LOCK_BACKEND")
+            if backend is None:
+                backend = self.get_item("general.cache_lock_backend")
+        except ConanException:
+            return "counter"
+        if backend not in ("counter", "fcntl"):
+            raise ConanException("Invalid 'cache_lock_backend' value '%s', allowed values "
+                                 "are 'counter' or 'fcntl'" % backend)
+        return backend
+
     @property
     def request_timeout(self):
         timeout = os.getenv("CONAN_REQUEST_TIMEOUT")
@@ -415,6 +436,20 @@ class ConanClientConfigParser(ConfigParser, object):
         except ValueError:
             raise ConanException("Specify a numeric parameter for 'request_timeout'")
 
+    @property
+    def update_check_ttl(self):
+        ttl = os.getenv("CONAN_UPDATE_CHECK_TTL")
+        if not ttl:
+            try:
+                ttl = self.get_item("general.update_check_ttl")
+            except ConanException:
+                return None
+
+        try:
+            return float(ttl) if ttl is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'update_check_ttl'")
+
     @property
     def revisions_enabled(self):
         try:
@@ -437,6 +472,21 @@ class ConanClientConfigParser(ConfigParser, object):
         except ValueError:
             raise ConanException("Specify a numeric parameter for 'parallel_download'")
 
+    @property
+    def parallel_build(self):
+        try:
+            parallel = self.get_item("general.parallel_build")
+        except ConanException:
+            return None
+
+        try:
+            parallel = int(parallel) if parallel is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'parallel_build'")
+        if parallel is not None and parallel < 1:
+            raise ConanException("The 'parallel_build' processes must be 1 or more")
+        return parallel
+
     @property
     def download_cache(self):
         try:
@@ -445,6 +495,19 @@ class ConanClientConfigParser(ConfigParser, object):
         except ConanException:
             return None
 
+    @property
+    def download_cache_max_size(self):
+        """ In bytes """
+        try:
+            max_size = self.get_item("storage.download_cache_max_size")
+        except ConanException:
+            return None
+
+        try:
+            return int(float(max_size) * 1024 * 1024) if max_size is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'download_cache_max_size'")
+
     @property
     def scm_to_conandata(self):
         try:
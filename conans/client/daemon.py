@@ -0,0 +1,409 @@
+""" The conan daemon is a process with Conan already imported and initialized, a persistent
+ConanAPIV1 with the configuration of the cache loaded, listening in a unix socket. When the
+CONAN_DAEMON environment variable is defined, the conan command is a thin client that sends its
+arguments, current folder, environment and standard streams to the daemon, that forks a process
+to run the command with them, and returns its exit code:
+
+    CONAN_DAEMON=1 conan info .
+
+The daemon of the cache is started by the first command, and exits after CONAN_DAEMON_TIMEOUT
+seconds (900 by default) without commands, or with:
+
+    python -m conans.client.daemon --stop
+
+The socket is created in a folder only accessible by the user, in XDG_RUNTIME_DIR or in the
+temporary folder, and where available, the daemon and the client check that the other end of the
+connection belongs to the same user before sending anything.
+
+It is only available in systems with unix sockets and fork(). This module is imported by the
+client before the rest of Conan, only the standard library can be imported at module level.
+"""
+import argparse
+import array
+import hashlib
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+
+CONAN_DAEMON_ENVVAR = "CONAN_DAEMON"
+CONAN_DAEMON_TIMEOUT_ENVVAR = "CONAN_DAEMON_TIMEOUT"
+
+_DEFAULT_TIMEOUT = 900  # seconds without commands
+_START_TIMEOUT = 30  # seconds waiting for a new daemon to accept connections
+
+# Every message is a frame: kind, length of the payload and the payload, json encoded
+_HEADER = struct.Struct("!cI")
+_REQUEST = b"r"  # To the daemon: arguments, folder and environment, with the standard streams
+_STOP = b"s"  # To the daemon: exit
+_PID = b"p"  # To the client: the process running the command, to forward it the signals
+_EXIT = b"x"  # To the client: the exit code of the command
+_STD_FDS = [0, 1, 2]
+
+
+def _private_folder():
+    """ The folder of the sockets of the user, only accessible by the user. None if it can't be
+    created, or it exists and other users could access it
+    """
+    runtime_folder = os.getenv("XDG_RUNTIME_DIR")
+    if not runtime_folder or not os.path.isdir(runtime_folder):
+        runtime_folder = tempfile.gettempdir()
+    folder = os.path.join(runtime_folder, "conan-daemon-%s" % os.getuid())
+    try:
+        os.mkdir(folder, 0o700)
+    except FileExistsError:
+        pass
+    except OSError:
+        return None
+    stats = os.lstat(folder)
+    if not stat.S_ISDIR(stats.st_mode) or stats.st_uid != os.getuid():
+        return None
+    if stats.st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+        os.chmod(folder, 0o700)
+    return folder
+
+
+def socket_path(cache_folder):
+    """ There is a daemon for every cache folder, Conan version and python interpreter. None if
+    there isn't a private folder for the socket
+    """
+    from conans import __version__
+    folder = _private_folder()
+    if folder is None:
+        return None
+    key = "%s %s %s" % (cache_folder, __version__, sys.executable)
+    return os.path.join(folder, "%s.sock" % hashlib.sha1(key.encode()).hexdigest()[:16])
+
+
+def _same_user(sock):
+    """ If the process at the other end of the connection belongs to this user, if the system
+    can't tell it, the permissions of the folder of the socket are enough
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True
+    credentials = struct.Struct("3i")  # pid, uid, gid
+    _, uid, _ = credentials.unpack(sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED,
+                                                   credentials.size))
+    return uid == os.getuid()
+
+
+def _cache_socket_path():
+    """ The socket of the cache of the environment, None if the folder is not valid, the
+    command run in the process will report it
+    """
+    user_home = os.path.expanduser(os.getenv("CONAN_USER_HOME", "~"))
+    if not os.path.isabs(user_home):
+        return None
+    return socket_path(os.path.join(os.path.abspath(user_home), ".conan"))
+
+
+def _send(sock, kind, payload, fds=None):
+    data = json.dumps(payload).encode()
+    frame = _HEADER.pack(kind, len(data)) + data
+    if fds:
+        sock.sendmsg([frame], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))])
+    else:
+        sock.sendall(frame)
+
+
+def _recv_exact(sock, size):
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def _recv(sock):
+    """ The (kind, payload, file descriptors) of the next message, kind is None if the
+    connection was closed
+    """
+    fds = array.array("i")
+    header, ancdata, _, _ = sock.recvmsg(_HEADER.size,
+                                         socket.CMSG_SPACE(len(_STD_FDS) * fds.itemsize))
+    for level, type_, data in ancdata:
+        if level == socket.SOL_SOCKET and type_ == socket.SCM_RIGHTS:
+            fds.frombytes(data[:len(data) - (len(data) % fds.itemsize)])
+    if len(header) < _HEADER.size:
+        rest = _recv_exact(sock, _HEADER.size - len(header)) if header else None
+        if rest is None:
+            for fd in fds:
+                os.close(fd)
+            return None, None, []
+        header += rest
+    kind, size = _HEADER.unpack(header)
+    data = _recv_exact(sock, size)
+    if data is None:
+        for fd in fds:
+            os.close(fd)
+        return None, None, []
+    return kind, json.loads(data.decode()), list(fds)
+
+
+def _connect(path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        if not _same_user(sock):
+            raise OSError("The conan daemon socket belongs to other user")
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _start(path, timeout):
+    """ Starts the daemon, and returns a connection to it, None if it couldn't be started """
+    import conans
+    conans_root = os.path.dirname(os.path.dirname(os.path.abspath(conans.__file__)))
+    with open(os.devnull, "r+") as devnull:
+        process = subprocess.Popen([sys.executable, "-m", "conans.client.daemon",
+                                    "--socket", path, "--timeout", str(timeout)],
+                                   cwd=conans_root, stdin=devnull, stdout=devnull, stderr=devnull,
+                                   start_new_session=True)
+    deadline = time.time() + _START_TIMEOUT
+    while time.time() < deadline:
+        sock = _connect(path)
+        if sock is not None:
+            return sock
+        if process.poll() is not None:  # It failed, or other client started it first
+            return _connect(path)
+        time.sleep(0.01)
+    return None
+
+
+def _wait(sock):
+    """ Forwards the signals to the process running the command, until it finishes. None if the
+    daemon closed the connection before running it
+    """
+    pid = []
+
+    def forward_signal(signum, _):
+        if pid:
+            os.kill(pid[0], signum)
+
+    signums = [signal.SIGINT, signal.SIGTERM, signal.SIGHUP]
+    handlers = [signal.signal(signum, forward_signal) for signum in signums]
+    try:
+        while True:
+            kind, payload, _ = _recv(sock)
+            if kind == _PID:
+                pid.append(payload)
+            elif kind == _EXIT:
+                return payload
+            elif kind is None:
+                if not pid:  # e.g. the daemon was exiting, the command didn't start
+                    return None
+                sys.stderr.write("ERROR: The conan daemon process running the command "
+                                 "ended unexpectedly\n")
+                return 1
+    finally:
+        for signum, handler in zip(signums, handlers):
+            signal.signal(signum, handler)
+
+
+def run_client(args):
+    """ Runs the command in the daemon of the cache, starting it if necessary. Returns the exit
+    code, or None if the daemon is not available and the command has to run in this process
+    """
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "fork"):
+        return None
+    try:
+        timeout = int(os.getenv(CONAN_DAEMON_TIMEOUT_ENVVAR, _DEFAULT_TIMEOUT))
+    except ValueError:
+        sys.stderr.write("ERROR: Specify a numeric parameter for '%s'\n"
+                         % CONAN_DAEMON_TIMEOUT_ENVVAR)
+        return 1
+    try:
+        request = {"args": args, "cwd": os.getcwd(), "env": dict(os.environ)}
+    except OSError:  # The current folder doesn't exist
+        return None
+    path = _cache_socket_path()
+    if path is None:
+        return None
+    sock = _connect(path) or _start(path, timeout)
+    if sock is None:
+        return None
+    with sock:
+        try:
+            _send(sock, _REQUEST, request, fds=_STD_FDS)
+        except OSError:  # e.g. some standard stream is closed
+            return None
+        return _wait(sock)
+
+
+def stop(path):
+    """ Stops the daemon listening in the socket, if any, and waits for it """
+    sock = _connect(path) if path is not None else None
+    if sock is None:
+        return False
+    with sock:
+        _send(sock, _STOP, None)
+        _recv(sock)  # Closed when it exits
+    return True
+
+
+def _listen(path):
+    """ The listening socket, None if other daemon is already listening """
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # Only the user can connect
+    try:
+        try:
+            listener.bind(path)
+        except OSError:
+            running = _connect(path)
+            if running is not None:
+                running.close()
+                listener.close()
+                return None
+            os.remove(path)  # Left by a daemon that didn't exit cleanly
+            listener.bind(path)
+    finally:
+        os.umask(old_umask)
+    listener.listen(64)
+    return listener
+
+
+def _run_command(conan_api, connection, request, fds):
+    """ Runs in the forked process, with the standard streams of the client """
+    for fd, std_fd in zip(fds, _STD_FDS):
+        os.dup2(fd, std_fd)
+        os.close(fd)
+    for stream in (sys.stdout, sys.stderr):
+        if stream.isatty() and hasattr(stream, "reconfigure"):
+            stream.reconfigure(line_buffering=True)
+    os.environ.clear()
+    os.environ.update(request["env"])
+    os.chdir(request["cwd"])
+    _send(connection, _PID, os.getpid())
+
+    from conans.client.command import main
+    from conans.client.output import colorama_initialize
+    conan_api.color = conan_api.out._color = colorama_initialize()
+    try:
+        main(request["args"], conan_api)
+        exit_code = 0
+    except SystemExit as exc:
+        exit_code = exc.code if isinstance(exc.code, int) else 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    _send(connection, _EXIT, exit_code)
+
+
+def _prepare_app(conan_api, env):
+    """ The app of the daemon is reused by the command if the configuration didn't change. The
+    environment variables are part of it, they are the ones of the command, not of the daemon
+    """
+    old_env = dict(os.environ)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        conan_api.create_app()
+    except Exception:  # e.g. a wrong conan.conf, the command will create it and report the error
+        conan_api.app = None
+    finally:
+        os.environ.clear()
+        os.environ.update(old_env)
+
+
+def _reap(children):
+    for pid in list(children):
+        try:
+            finished, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            finished = pid
+        if finished:
+            children.discard(pid)
+
+
+def _close(listener, path):
+    if listener.fileno() != -1:
+        listener.close()
+        os.remove(path)
+
+
+def serve(path, timeout):
+    """ Accepts commands until it is stopped or there are no commands in "timeout" seconds """
+    from conans.client.conan_api import ConanAPIV1
+    conan_api = ConanAPIV1(persistent_app=True)
+    conan_api.create_app()
+    conan_api.app.cache.settings  # Parsed and kept by the cache
+
+    listener = _listen(path)
+    if listener is None:
+        return
+    listener.settimeout(timeout)
+    children = set()
+    try:
+        while True:
+            try:
+                connection, _ = listener.accept()
+            except socket.timeout:
+                _reap(children)
+                if children:
+                    continue
+                break
+            _reap(children)
+            with connection:
+                try:
+                    if not _same_user(connection):
+                        continue
+                    connection.settimeout(10)
+                    kind, request, fds = _recv(connection)
+                except (OSError, ValueError):  # Not a conan client
+                    continue
+                if kind == _STOP:
+                    _close(listener, path)  # Before the connection, the client waits for it
+                    break
+                if kind != _REQUEST:
+                    for fd in fds:
+                        os.close(fd)
+                    continue
+                _prepare_app(conan_api, request["env"])
+                pid = os.fork()
+                if pid == 0:
+                    exit_code = 1
+                    try:
+                        listener.close()
+                        connection.settimeout(None)
+                        _run_command(conan_api, connection, request, fds)
+                        exit_code = 0
+                    finally:
+                        os._exit(exit_code)
+                children.add(pid)
+                for fd in fds:
+                    os.close(fd)
+    finally:
+        _close(listener, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="The conan daemon, started by the conan command "
+                                                 "when %s is defined" % CONAN_DAEMON_ENVVAR)
+    parser.add_argument("--socket", help="Unix socket to listen, by default the one of the cache")
+    parser.add_argument("--timeout", type=int, default=_DEFAULT_TIMEOUT,
+                        help="Seconds without commands to exit")
+    parser.add_argument("--stop", action="store_true", help="Stop the running daemon")
+    args = parser.parse_args()
+
+    path = args.socket or _cache_socket_path()
+    if path is None:
+        sys.exit("ERROR: There isn't a private folder for the conan daemon socket")
+    if args.stop:
+        if not stop(path):
+            print("The conan daemon is not running")
+    else:
+        serve(path, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
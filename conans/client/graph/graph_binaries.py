@@ -1,3 +1,6 @@
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
 from conans.client.graph.build_mode import BuildMode
 from conans.client.graph.graph import (BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_MISSING,
                                        BINARY_UPDATE, RECIPE_EDITABLE, BINARY_EDITABLE,
@@ -19,6 +22,9 @@ class GraphBinariesAnalyzer(object):
         # These are the nodes with pref (not including PREV) that have been evaluated
         self._evaluated = {}  # {pref: [nodes]}
         self._fixed_package_id = cache.config.full_transitive_package_id
+        # Number of threads to query concurrently the remotes for the binaries of a graph level
+        self._parallel = cache.config.parallel_download
+        self._prefetched = {}  # {(remote_manager method, pref, remote name): (result, exception)}
 
     @staticmethod
     def _check_update(upstream_manifest, package_folder, output):
@@ -72,7 +78,7 @@ class GraphBinariesAnalyzer(object):
             output = node.conanfile.output
             if remote:
                 try:
-                    tmp = self._remote_manager.get_package_manifest(pref, remote)
+                    tmp = self._remote_call("get_package_manifest", pref, remote)
                     upstream_manifest, pref = tmp
                 except NotFoundException:
                     output.warn("Can't update, no package in remote")
@@ -97,7 +103,7 @@ class GraphBinariesAnalyzer(object):
         remote_info = None
         if remote:
             try:
-                remote_info, pref = self._remote_manager.get_package_info(pref, remote)
+                remote_info, pref = self._remote_call("get_package_info", pref, remote)
             except NotFoundException:
                 pass
             except Exception:
@@ -109,7 +115,7 @@ class GraphBinariesAnalyzer(object):
         if not remote or (not remote_info and self._cache.config.revisions_enabled):
             for r in remotes.values():
                 try:
-                    remote_info, pref = self._remote_manager.get_package_info(pref, r)
+                    remote_info, pref = self._remote_call("get_package_info", pref, r)
                 except NotFoundException:
                     pass
                 else:
@@ -340,20 +346,90 @@ class GraphBinariesAnalyzer(object):
     def evaluate_graph(self, deps_graph, build_mode, update, remotes, nodes_subset=None, root=None):
         default_package_id_mode = self._cache.config.default_package_id_mode
         default_python_requires_id_mode = self._cache.config.default_python_requires_id_mode
-        for node in deps_graph.ordered_iterate(nodes_subset=nodes_subset):
-            self._propagate_options(node)
+        for level in deps_graph.by_levels(nodes_subset):
+            # The nodes of the same level do not depend on each other, their package_ids can be
+            # computed before evaluating their binaries, so the remotes queries can be batched
+            for node in level:
+                self._propagate_options(node)
+                self._compute_package_id(node, default_package_id_mode,
+                                         default_python_requires_id_mode)
+            self._prefetch_remote_pkgs(level, build_mode, update, remotes)
+            for node in level:
+                if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+                    continue
+                if node.package_id == PACKAGE_ID_UNKNOWN:
+                    assert node.binary is None, "Node.binary should be None"
+                    node.binary = BINARY_UNKNOWN
+                    # annotate pattern, so unused patterns in --build are not displayed as errors
+                    build_mode.forced(node.conanfile, node.ref)
+                    continue
+                self._evaluate_node(node, build_mode, update, remotes)
+        self._prefetched.clear()  # Unused results, do not keep them for later evaluations
+        deps_graph.mark_private_skippable(nodes_subset=nodes_subset, root=root)
 
-            self._compute_package_id(node, default_package_id_mode, default_python_requires_id_mode)
-            if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+    def _prefetch_remote_pkgs(self, nodes, build_mode, update, remotes):
+        """ queries concurrently the remotes for the binaries of the given nodes: the package
+        info of the binaries not in the cache, and the manifest of the cached ones if updating.
+        The results (and errors) are consumed later by _remote_call() while evaluating each node
+        sequentially, so the evaluation and its output are the same, just without waiting for
+        each request one after the other
+        """
+        if not self._parallel or build_mode.all:
+            return
+        queries = OrderedDict()  # {(method, pref, remote name): remote}
+        for node in nodes:
+            if (node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL, RECIPE_EDITABLE) or
+                    node.package_id == PACKAGE_ID_UNKNOWN):
                 continue
-            if node.package_id == PACKAGE_ID_UNKNOWN:
-                assert node.binary is None, "Node.binary should be None"
-                node.binary = BINARY_UNKNOWN
-                # annotate pattern, so unused patterns in --build are not displayed as errors
-                build_mode.forced(node.conanfile, node.ref)
+            locked = node.graph_lock_node
+            if locked and locked.package_id and locked.package_id != PACKAGE_ID_UNKNOWN:
+                pref = PackageReference(locked.ref, locked.package_id, locked.prev)
+            else:
+                pref = PackageReference(node.ref, node.package_id)
+            if pref in self._evaluated:
                 continue
-            self._evaluate_node(node, build_mode, update, remotes)
-        deps_graph.mark_private_skippable(nodes_subset=nodes_subset, root=root)
+            layout = self._cache.package_layout(pref.ref, short_paths=node.conanfile.short_paths)
+            remote = remotes.selected
+            try:
+                if not remote:
+                    metadata = layout.load_metadata()
+                    remote_name = metadata.packages[pref.id].remote or metadata.recipe.remote
+                    remote = remotes.get(remote_name)
+                in_cache = layout.package_id_exists(pref.id)
+            except Exception:  # Any issue will be raised by the sequential evaluation
+                continue
+            if not remote or (in_cache and not update):
+                continue
+            method = "get_package_manifest" if in_cache else "get_package_info"
+            key = (method, pref, remote.name)
+            if key not in self._prefetched:
+                queries[key] = remote
+        if len(queries) < 2:
+            return
+
+        def _query(query):
+            (method, pref, _), remote = query
+            try:
+                return getattr(self._remote_manager, method)(pref, remote), None
+            except Exception as e:
+                return None, e
+
+        thread_pool = ThreadPool(min(self._parallel, len(queries)))
+        try:
+            results = thread_pool.map(_query, list(queries.items()))
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+        self._prefetched.update(zip(queries, results))
+
+    def _remote_call(self, method, pref, remote):
+        prefetched = self._prefetched.pop((method, pref, remote.name), None)
+        if prefetched is None:
+            return getattr(self._remote_manager, method)(pref, remote)
+        result, exception = prefetched
+        if exception is not None:
+            raise exception
+        return result
 
     def reevaluate_node(self, node, remotes, build_mode, update):
         """ reevaluate the node is necessary when there is some PACKAGE_ID_UNKNOWN due to
@@ -1,7 +1,9 @@
 import time
+from multiprocessing.pool import ThreadPool
 
 from conans.client.conanfile.configure import run_configure_method
 from conans.client.graph.graph import DepsGraph, Node, RECIPE_EDITABLE, CONTEXT_HOST, CONTEXT_BUILD
+from conans.client.recorder.action_recorder import RecorderCalls
 from conans.errors import (ConanException, ConanExceptionInUserConanfileMethod,
                            conanfile_exception_formatter)
 from conans.model.conan_file import get_env_context_manager
@@ -27,6 +29,7 @@ class DepsGraphBuilder(object):
                     resolve_cached_alias(node.conanfile.requires)     # replace cached alias again
 
             # 2. Process each requires of this node
+            prefetch_recipes(node.conanfile.requires)                 # if parallel_download
             for req in node.conanfile.requires:
                 expand_require(req)
                     if req.name not in graph:                         # New node
@@ -40,12 +43,15 @@ class DepsGraphBuilder(object):
                             expand_node(previous_node)                # recursion
     """
 
-    def __init__(self, proxy, output, loader, resolver, recorder):
+    def __init__(self, proxy, output, loader, resolver, recorder, parallel=None):
         self._proxy = proxy
         self._output = output
         self._loader = loader
         self._resolver = resolver
         self._recorder = recorder
+        # Number of threads to retrieve the recipes of the sibling requirements concurrently
+        self._parallel = parallel
+        self._prefetched = {}  # {ref: (recorder_calls, result, exception)}
 
     def load_graph(self, root_node, check_updates, update, remotes, profile_host, profile_build,
                    graph_lock=None):
@@ -63,9 +69,12 @@ class DepsGraphBuilder(object):
 
         # enter recursive computation
         t1 = time.time()
+        parses_avoided = self._loader.parses_avoided
         self._expand_node(root_node, dep_graph, Requirements(), None, None, check_updates,
                           update, remotes, profile_host, profile_build, graph_lock)
         logger.debug("GRAPH: Time to load deps %s" % (time.time() - t1))
+        logger.debug("GRAPH: Conanfile parses avoided by the loader cache %s"
+                     % (self._loader.parses_avoided - parses_avoided))
         return dep_graph
 
     def extend_build_requires(self, graph, node, build_requires_refs, check_updates, update,
@@ -95,6 +104,9 @@ class DepsGraphBuilder(object):
 
         self._resolve_ranges(graph, build_requires, scope, update, remotes)
 
+        self._prefetch_recipes(node, [(br, br.build_require_context == CONTEXT_BUILD)
+                                      for br in build_requires],
+                               check_updates, update, remotes)
         for br in build_requires:
             context_switch = bool(br.build_require_context == CONTEXT_BUILD)
             populate_settings_target = context_switch  # Avoid 'settings_target' for BR-host
@@ -121,6 +133,9 @@ class DepsGraphBuilder(object):
         new_options, new_reqs = self._get_node_requirements(node, graph, down_ref, down_options,
                                                             down_reqs, graph_lock, update, remotes)
 
+        self._prefetch_recipes(node, [(r, False) for r in node.conanfile.requires.values()
+                                      if not r.override],
+                               check_updates, update, remotes)
         # Expand each one of the current requirements
         for require in node.conanfile.requires.values():
             if require.override:
@@ -129,6 +144,53 @@ class DepsGraphBuilder(object):
                                  profile_build, new_reqs, new_options, graph_lock,
                                  context_switch=False)
 
+    def _prefetch_recipes(self, node, requires, check_updates, update, remotes):
+        """ retrieves concurrently the recipes of the requirements that will be new nodes of the
+        graph, so they are already in the cache when expanded. The graph is still built
+        sequentially, in the same order: the results and errors (and the recorder actions) are
+        consumed in _resolve_recipe() only when each requirement is expanded
+        param requires: list of (requirement, context_switch)
+        """
+        if not self._parallel:
+            return
+        refs = []
+        for require, context_switch in requires:
+            ref = require.ref
+            context = CONTEXT_BUILD if context_switch else node.context
+            if (ref in self._prefetched or ref in refs
+                    or node.public_deps.get(ref.name, context=context)):
+                continue
+            refs.append(ref)
+        if len(refs) < 2:
+            return
+
+        def _get_recipe(ref):
+            recorder = RecorderCalls()
+            try:
+                result = self._proxy.get_recipe(ref, check_updates, update, remotes, recorder)
+                return recorder.calls, result, None
+            except Exception as e:
+                return recorder.calls, None, e
+
+        thread_pool = ThreadPool(min(self._parallel, len(refs)))
+        try:
+            results = thread_pool.map(_get_recipe, refs)
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+        self._prefetched.update(zip(refs, results))
+
+    def _get_recipe(self, ref, check_updates, update, remotes):
+        prefetched = self._prefetched.pop(ref, None)
+        if prefetched is None:
+            return self._proxy.get_recipe(ref, check_updates, update, remotes, self._recorder)
+        recorder_calls, result, exception = prefetched
+        for method, args, kwargs in recorder_calls:
+            getattr(self._recorder, method)(*args, **kwargs)
+        if exception is not None:
+            raise exception
+        return result
+
     def _resolve_ranges(self, graph, requires, consumer, update, remotes):
         for require in requires:
             if require.locked_id:  # if it is locked, nothing to resolved
@@ -356,8 +418,7 @@ class DepsGraphBuilder(object):
     def _resolve_recipe(self, current_node, dep_graph, requirement, check_updates,
                         update, remotes, profile, graph_lock, original_ref=None):
         try:
-            result = self._proxy.get_recipe(requirement.ref, check_updates, update,
-                                            remotes, self._recorder)
+            result = self._get_recipe(requirement.ref, check_updates, update, remotes)
         except ConanException as e:
             if current_node.ref:
                 self._output.error("Failed requirement '%s' from '%s'"
@@ -353,7 +353,7 @@ class GraphManager(object):
         assert isinstance(build_mode, BuildMode)
         profile_host_build_requires = profile_host.build_requires
         builder = DepsGraphBuilder(self._proxy, self._output, self._loader, self._resolver,
-                                   recorder)
+                                   recorder, parallel=self._cache.config.parallel_download)
         graph = builder.load_graph(root_node, check_updates, update, remotes, profile_host,
                                    profile_build, graph_lock)
 
@@ -83,7 +83,7 @@ class ConanProxy(object):
             return conanfile_path, status, None, ref
 
         try:  # get_recipe_manifest can fail, not in server
-            upstream_manifest, ref = self._remote_manager.get_recipe_manifest(ref, selected_remote)
+            upstream_manifest, ref = self._get_recipe_manifest(ref, selected_remote)
         except NotFoundException:
             status = RECIPE_NOT_IN_REMOTE
             ref = ref.copy_with_rev(cur_revision)
@@ -110,6 +110,22 @@ class ConanProxy(object):
         ref = ref.copy_with_rev(cur_revision)
         return conanfile_path, status, selected_remote, ref
 
+    def _get_recipe_manifest(self, ref, remote):
+        """ The result of a previous check of the same reference in the remote is reused if it is
+        younger than the "update_check_ttl" of the conan.conf
+        """
+        ttl = self._cache.config.update_check_ttl
+        if not ttl:
+            return self._remote_manager.get_recipe_manifest(ref, remote)
+
+        update_checks = self._cache.update_checks
+        cached = update_checks.get(ref, remote, ttl)
+        if cached:
+            return cached
+        upstream_manifest, remote_ref = self._remote_manager.get_recipe_manifest(ref, remote)
+        update_checks.set(ref, remote, upstream_manifest, remote_ref)
+        return upstream_manifest, remote_ref
+
     def _download_recipe(self, layout, ref, output, remotes, remote, recorder):
 
         def _retrieve_from_remote(the_remote):
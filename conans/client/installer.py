@@ -1,9 +1,15 @@
+import multiprocessing
 import os
+import pickle
+import select
 import shutil
 import textwrap
 import time
+from collections import OrderedDict
 from multiprocessing.pool import ThreadPool
 
+import six
+
 from conans.client import tools
 from conans.client.conanfile.build import run_build_method
 from conans.client.conanfile.package import run_package_method
@@ -14,14 +20,14 @@ from conans.client.graph.graph import BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOA
 from conans.client.importer import remove_imports, run_imports
 from conans.client.packager import update_package_metadata
 from conans.client.recorder.action_recorder import INSTALL_ERROR_BUILDING, INSTALL_ERROR_MISSING, \
-    INSTALL_ERROR_MISSING_BUILD_FOLDER
+    INSTALL_ERROR_MISSING_BUILD_FOLDER, RecorderCalls
 from conans.client.source import complete_recipe_sources, config_source
 from conans.client.toolchain.base import write_toolchain
 from conans.client.tools.env import no_op
 from conans.client.tools.env import pythonpath
 from conans.errors import (ConanException, ConanExceptionInUserConanfileMethod,
                            conanfile_exception_formatter)
-from conans.model.build_info import CppInfo, DepCppInfo
+from conans.model.build_info import CppInfo, DepCppInfo, DirsCache
 from conans.model.conan_file import ConanFile
 from conans.model.editable_layout import EditableLayout
 from conans.model.env_info import EnvInfo
@@ -278,6 +284,18 @@ def call_system_requirements(conanfile, output):
         raise ConanException("Error in system requirements")
 
 
+def _fork_context():
+    """ parallel builds need to fork, so the built nodes are already in memory and every build
+    has its own current directory and environment
+    """
+    if not hasattr(os, "fork"):
+        return None
+    try:
+        return multiprocessing.get_context("fork")
+    except AttributeError:  # Python 2 always forks in posix
+        return multiprocessing
+
+
 class BinaryInstaller(object):
     """ main responsible of retrieving binary packages or building them from source
     locally in case they are not found in remotes
@@ -290,6 +308,7 @@ class BinaryInstaller(object):
         self._binaries_analyzer = app.binaries_analyzer
         self._hook_manager = app.hook_manager
         self._generator_manager = app.generator_manager
+        self._dirs_cache = None
         # Load custom generators from the cache, generators are part of the binary
         # build and install. Generators loaded here from the cache will have precedence
         # and overwrite possible generators loaded from packages (requires)
@@ -301,6 +320,8 @@ class BinaryInstaller(object):
         nodes_by_level = deps_graph.by_levels()
         root_level = nodes_by_level.pop()
         root_node = root_level[0]
+        # The existing directories of the packages, for the cpp_info paths of this install
+        self._dirs_cache = DirsCache()
         # Get the nodes in order and if we have to build them
         self._out.info("Installing (downloading, building) binaries...")
         self._build(nodes_by_level, keep_build, root_node, graph_info, remotes, build_mode, update)
@@ -407,27 +428,24 @@ class BinaryInstaller(object):
         processed_package_refs = set()
         self._download(downloads, processed_package_refs)
 
-        for level in nodes_by_level:
-            for node in level:
-                ref, conan_file = node.ref, node.conanfile
-                output = conan_file.output
-
-                self._propagate_info(node, using_build_profile)
-                if node.binary == BINARY_EDITABLE:
-                    self._handle_node_editable(node, graph_info)
-                    # Need a temporary package revision for package_revision_mode
-                    # Cannot be PREV_UNKNOWN otherwise the consumers can't compute their packageID
-                    node.prev = "editable"
-                else:
-                    if node.binary == BINARY_SKIP:  # Privates not necessary
-                        continue
-                    assert ref.revision is not None, "Installer should receive RREV always"
-                    if node.binary == BINARY_UNKNOWN:
-                        self._binaries_analyzer.reevaluate_node(node, remotes, build_mode, update)
-                        if node.binary == BINARY_MISSING:
-                            self._raise_missing([node])
-                    _handle_system_requirements(conan_file, node.pref, self._cache, output)
-                    self._handle_node_cache(node, keep_build, processed_package_refs, remotes)
+        parallel = self._cache.config.parallel_build
+        if parallel is not None and _fork_context() is None:
+            self._out.warn("Parallel builds are not supported in this platform, "
+                           "building sequentially")
+            parallel = None
+
+        if parallel is not None:
+            self._out.info("Building binary packages in %s parallel processes" % parallel)
+            self._build_parallel(nodes_by_level, parallel, keep_build, graph_info,
+                                 processed_package_refs, remotes, build_mode, update,
+                                 using_build_profile)
+        else:
+            for level in nodes_by_level:
+                for node in level:
+                    if self._prepare_node(node, graph_info, remotes, build_mode, update,
+                                          using_build_profile):
+                        self._handle_node_cache(node, keep_build, processed_package_refs,
+                                                remotes)
 
         # Finally, propagate information to root node (ref=None)
         self._propagate_info(root_node, using_build_profile)
@@ -473,6 +491,29 @@ class BinaryInstaller(object):
                 copied_files = run_imports(node.conanfile, build_folder)
                 report_copied_files(copied_files, output)
 
+    def _prepare_node(self, node, graph_info, remotes, build_mode, update, using_build_profile):
+        """ propagates the upstream information to the node and processes the cheap, not
+        cache-related steps (editables, package_id re-evaluation, system requirements)
+        :return: True if the node still has to be processed in the cache (built, retrieved...)
+        """
+        ref, conan_file = node.ref, node.conanfile
+        self._propagate_info(node, using_build_profile)
+        if node.binary == BINARY_EDITABLE:
+            self._handle_node_editable(node, graph_info)
+            # Need a temporary package revision for package_revision_mode
+            # Cannot be PREV_UNKNOWN otherwise the consumers can't compute their packageID
+            node.prev = "editable"
+            return False
+        if node.binary == BINARY_SKIP:  # Privates not necessary
+            return False
+        assert ref.revision is not None, "Installer should receive RREV always"
+        if node.binary == BINARY_UNKNOWN:
+            self._binaries_analyzer.reevaluate_node(node, remotes, build_mode, update)
+            if node.binary == BINARY_MISSING:
+                self._raise_missing([node])
+        _handle_system_requirements(conan_file, node.pref, self._cache, conan_file.output)
+        return True
+
     def _handle_node_cache(self, node, keep_build, processed_package_references, remotes):
         pref = node.pref
         assert pref.id, "Package-ID without value"
@@ -486,13 +527,7 @@ class BinaryInstaller(object):
             if pref not in processed_package_references:
                 processed_package_references.add(pref)
                 if node.binary == BINARY_BUILD:
-                    assert node.prev is None, "PREV for %s to be built should be None" % str(pref)
-                    layout.package_remove(pref)
-                    with layout.set_dirty_context_manager(pref):
-                        pref = self._build_package(node, output, keep_build, remotes)
-                    assert node.prev, "Node PREV shouldn't be empty"
-                    assert node.pref.revision, "Node PREF revision shouldn't be empty"
-                    assert pref.revision is not None, "PREV for %s to be built is None" % str(pref)
+                    self._build_node(node, layout, keep_build, remotes)
                 elif node.binary in (BINARY_UPDATE, BINARY_DOWNLOAD):
                     # this can happen after a re-evaluation of packageID with Package_ID_unknown
                     self._download_pkg(layout, node.pref, node)
@@ -502,14 +537,140 @@ class BinaryInstaller(object):
                     log_package_got_from_local_cache(pref)
                     self._recorder.package_fetched_from_cache(pref)
 
-            package_folder = layout.package(pref)
-            if not os.path.isdir(package_folder):
-                raise ConanException("Package '%s' corrupted. Package folder must exist: %s\n"
-                                     "Try removing the package with 'conan remove'"
-                                     % (str(pref), package_folder))
-            # Call the info method
-            self._call_package_info(conanfile, package_folder, ref=pref.ref)
-            self._recorder.package_cpp_info(pref, conanfile.cpp_info)
+            self._handle_node_package_info(node, layout)
+
+    def _build_node(self, node, layout, keep_build, remotes):
+        pref = node.pref
+        assert node.prev is None, "PREV for %s to be built should be None" % str(pref)
+        layout.package_remove(pref)
+        with layout.set_dirty_context_manager(pref):
+            pref = self._build_package(node, node.conanfile.output, keep_build, remotes)
+        assert node.prev, "Node PREV shouldn't be empty"
+        assert node.pref.revision, "Node PREF revision shouldn't be empty"
+        assert pref.revision is not None, "PREV for %s to be built is None" % str(pref)
+
+    def _handle_node_package_info(self, node, layout):
+        pref = node.pref
+        conanfile = node.conanfile
+        package_folder = layout.package(pref)
+        if not os.path.isdir(package_folder):
+            raise ConanException("Package '%s' corrupted. Package folder must exist: %s\n"
+                                 "Try removing the package with 'conan remove'"
+                                 % (str(pref), package_folder))
+        if node.binary in (BINARY_BUILD, BINARY_DOWNLOAD, BINARY_UPDATE):
+            self._dirs_cache.invalidate(package_folder)  # Its contents changed in this install
+        # Call the info method
+        self._call_package_info(conanfile, package_folder, ref=pref.ref)
+        self._recorder.package_cpp_info(pref, conanfile.cpp_info)
+
+    def _build_parallel(self, nodes_by_level, parallel, keep_build, graph_info,
+                        processed_package_refs, remotes, build_mode, update, using_build_profile):
+        """ DAG scheduler: every node is processed as soon as all its dependencies are done, not
+        level by level. The BINARY_BUILD nodes are built in forked processes (builds change the
+        process current dir and environment), at most 'parallel' at the same time, with their
+        output buffered and printed once each build finishes. The rest of nodes (cache, download,
+        editables) and the package_info() calls are processed in this process.
+        """
+        context = _fork_context()
+        nodes = [node for level in nodes_by_level for node in level]
+        pending = OrderedDict((node, set(node.neighbors())) for node in nodes)
+        # Nodes sharing the same pref are processed after the first one, that will build it
+        first_by_pref = {}
+        for node in nodes:
+            if node.binary not in (BINARY_EDITABLE, BINARY_SKIP):
+                first = first_by_pref.setdefault(node.pref, node)
+                if first is not node:
+                    pending[node].add(first)
+
+        done = set()
+        running = {}  # connection: (process, node)
+        error = None
+        try:
+            while pending or running:
+                for node in [n for n, deps in pending.items() if deps.issubset(done)]:
+                    if error is not None:
+                        break
+                    if node.binary in (BINARY_BUILD, BINARY_UNKNOWN) and len(running) >= parallel:
+                        continue
+                    pending.pop(node)
+                    if not self._prepare_node(node, graph_info, remotes, build_mode, update,
+                                              using_build_profile):
+                        done.add(node)
+                    elif node.binary == BINARY_BUILD and node.pref not in processed_package_refs:
+                        processed_package_refs.add(node.pref)
+                        receiver, sender = context.Pipe(duplex=False)
+                        process = context.Process(target=self._build_node_process,
+                                                  args=(node, keep_build, remotes, sender))
+                        process.start()
+                        sender.close()
+                        running[receiver] = process, node
+                    else:
+                        self._handle_node_cache(node, keep_build, processed_package_refs, remotes)
+                        done.add(node)
+
+                if not running:
+                    if error is not None:
+                        break
+                    continue
+
+                ready, _, _ = select.select(list(running.keys()), [], [])
+                for receiver in ready:
+                    process, node = running.pop(receiver)
+                    try:
+                        build_output, recorder_calls, prev, exc = receiver.recv()
+                    except EOFError:
+                        build_output, recorder_calls, prev = "", [], None
+                        exc = ConanException("%s: Build process finished unexpectedly" % node.ref)
+                    receiver.close()
+                    process.join()
+                    self._out.write(build_output)
+                    for method, args, kwargs in recorder_calls:
+                        getattr(self._recorder, method)(*args, **kwargs)
+                    if exc is not None:
+                        error = error or exc
+                        continue
+                    node.prev = prev
+                    if node.graph_lock_node:
+                        node.graph_lock_node.prev = prev
+                    layout = self._cache.package_layout(node.ref, node.conanfile.short_paths)
+                    # FIXME: Is weak to assign here the recipe_hash, as _PackageBuilder does
+                    node.conanfile.info.recipe_hash = layout.recipe_manifest().summary_hash
+                    with layout.package_lock(node.pref):
+                        self._handle_node_package_info(node, layout)
+                    done.add(node)
+        finally:
+            # e.g. a download failed while building, the builds are not left running
+            for receiver, (process, _) in running.items():
+                process.terminate()
+                process.join()
+                receiver.close()
+
+        if error is not None:
+            raise error
+
+    def _build_node_process(self, node, keep_build, remotes, sender):
+        """ Executed in the forked process, builds the node capturing its output and the
+        calls to the recorder, that are sent back to the parent process
+        """
+        build_output = six.StringIO()
+        for output in (self._out, node.conanfile.output):
+            output._stream = output._stream_err = build_output
+        recorder = RecorderCalls()
+        self._recorder = recorder
+        prev, exc = None, None
+        try:
+            layout = self._cache.package_layout(node.ref, node.conanfile.short_paths)
+            with layout.package_lock(node.pref):
+                self._build_node(node, layout, keep_build, remotes)
+            prev = node.prev
+        except Exception as e:
+            try:
+                pickle.loads(pickle.dumps(e))
+                exc = e
+            except Exception:
+                exc = ConanException(str(e))
+        sender.send((build_output.getvalue(), recorder.calls, prev, exc))
+        sender.close()
 
     def _build_package(self, node, output, keep_build, remotes):
         conanfile = node.conanfile
@@ -542,12 +703,12 @@ class BinaryInstaller(object):
         conan_file = node.conanfile
         # FIXME: Not the best place to assign the _conan_using_build_profile
         conan_file._conan_using_build_profile = using_build_profile
-        transitive = [it for it in node.transitive_closure.values()]
+        transitive = set(node.transitive_closure.values())
 
-        br_host = []
+        br_host = set()
         for it in node.dependencies:
             if it.require.build_require_context == CONTEXT_HOST:
-                br_host.extend(it.dst.transitive_closure.values())
+                br_host.update(it.dst.transitive_closure.values())
 
         # Initialize some members if we are using different contexts
         if using_build_profile:
@@ -582,7 +743,7 @@ class BinaryInstaller(object):
         add_env_conaninfo(conan_file, subtree_libnames)
 
     def _call_package_info(self, conanfile, package_folder, ref):
-        conanfile.cpp_info = CppInfo(conanfile.name, package_folder)
+        conanfile.cpp_info = CppInfo(conanfile.name, package_folder, self._dirs_cache)
         conanfile.cpp_info.version = conanfile.version
         conanfile.cpp_info.description = conanfile.description
         conanfile.env_info = EnvInfo()
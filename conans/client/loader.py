@@ -4,6 +4,7 @@ import inspect
 import os
 import sys
 import uuid
+from collections import OrderedDict
 
 import yaml
 
@@ -18,9 +19,16 @@ from conans.model.options import OptionsValues
 from conans.model.ref import ConanFileReference
 from conans.model.settings import Settings
 from conans.model.values import Values
-from conans.paths import DATA_YML
+from conans.paths import CONAN_MANIFEST, DATA_YML
 from conans.util.conan_v2_mode import CONAN_V2_MODE_ENVVAR
-from conans.util.files import load
+from conans.util.files import load, md5sum
+
+# The recipes of the cache already imported in this process, shared by all the loaders, so the
+# same recipe revision is not parsed again. The environment is part of the key, as the recipes
+# can use it at import time {(conanfile_path, manifest md5, environment): module}
+# It is an LRU, so long running processes (the daemon) don't keep every recipe ever loaded
+_parsed_modules = OrderedDict()
+_PARSED_MODULES_MAX = 500
 
 
 class ConanFileLoader(object):
@@ -33,6 +41,7 @@ class ConanFileLoader(object):
         self._python_requires = python_requires
         sys.modules["conans"].python_requires = python_requires
         self._cached_conanfile_classes = {}
+        self.parses_avoided = 0  # Number of loads that didn't need to parse the conanfile.py
 
     def load_basic(self, conanfile_path, lock_python_requires=None, user=None, channel=None,
                    display=""):
@@ -45,17 +54,36 @@ class ConanFileLoader(object):
                           display=""):
         """ loads a conanfile basic object without evaluating anything, returns the module too
         """
+        # Recipes in the cache are identified by their manifest, if it changes, the recipe has
+        # been updated and has to be parsed again
+        manifest_path = os.path.join(os.path.dirname(conanfile_path), CONAN_MANIFEST)
+        manifest = md5sum(manifest_path) if os.path.isfile(manifest_path) else None
+
         cached = self._cached_conanfile_classes.get(conanfile_path)
-        if cached and cached[1] == lock_python_requires:
+        if cached and cached[1] == lock_python_requires and cached[3] == manifest:
+            self.parses_avoided += 1
             return cached[0](self._output, self._runner, display, user, channel), cached[2]
 
         if lock_python_requires is not None:
             self._python_requires.locked_versions = {r.name: r for r in lock_python_requires}
         try:
-            self._python_requires.valid = True
-            module, conanfile = parse_conanfile(conanfile_path, self._python_requires,
-                                                self._generator_manager)
-            self._python_requires.valid = False
+            module_key = (conanfile_path, manifest, hash(frozenset(os.environ.items())))
+            module = _parsed_modules.get(module_key) if manifest else None
+            if module is not None:
+                _parsed_modules.move_to_end(module_key)
+                self.parses_avoided += 1
+                conanfile = _parse_module(module, module.__name__, self._generator_manager)
+            else:
+                self._python_requires.valid = True
+                module, conanfile = parse_conanfile(conanfile_path, self._python_requires,
+                                                    self._generator_manager)
+                self._python_requires.valid = False
+                # The python_requires are resolved and injected in the class, they can be
+                # different for other loaders (remotes, lockfiles)
+                if manifest and not hasattr(conanfile, "python_requires"):
+                    _parsed_modules[module_key] = module
+                    if len(_parsed_modules) > _PARSED_MODULES_MAX:
+                        _parsed_modules.popitem(last=False)
 
             self._python_requires.locked_versions = None
 
@@ -79,7 +107,7 @@ class ConanFileLoader(object):
                     conanfile.scm.update(scm_data)
 
             self._cached_conanfile_classes[conanfile_path] = (conanfile, lock_python_requires,
-                                                              module)
+                                                              module, manifest)
             result = conanfile(self._output, self._runner, display, user, channel)
             if hasattr(result, "init") and callable(result.init):
                 with conanfile_exception_formatter(str(result), "init"):
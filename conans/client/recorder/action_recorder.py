@@ -52,6 +52,19 @@ class Action(namedtuple("Action", "type, full_ref, doc, time")):
         return super(cls, Action).__new__(cls, the_type, full_ref, doc, the_time)
 
 
+class RecorderCalls(object):
+    """ stores the ActionRecorder calls done in a build process or in a background thread,
+    to be replayed later in the real recorder
+    """
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, method):
+        def _record(*args, **kwargs):
+            self.calls.append((method, args, kwargs))
+        return _record
+
+
 class ActionRecorder(object):
 
     def __init__(self):
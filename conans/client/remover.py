@@ -127,6 +127,7 @@ class ConanRemover(object):
 
         if not src and build_ids is None and package_ids is None:
             remover.remove(package_layout, output=self._user_io.out)
+            self._cache.recipe_index.remove(ref)
 
     def remove(self, pattern, remote_name, src=None, build_ids=None, package_ids_filter=None,
                force=False, packages_query=None, outdated=False):
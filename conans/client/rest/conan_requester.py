@@ -6,9 +6,11 @@ import time
 import warnings
 
 import requests
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 from conans import __version__ as client_version
+from conans.client.tools.oss import cpu_count
+from conans.errors import ConanException
 from conans.util.files import save
 from conans.util.tracer import log_client_rest_api_call
 
@@ -21,13 +23,17 @@ logging.captureWarnings(True)
 class ConanRequester(object):
 
     def __init__(self, config, http_requester=None):
+        self._adapter = None
         if http_requester:
             self._http_requester = http_requester
         else:
             self._http_requester = requests.Session()
-            adapter = HTTPAdapter(max_retries=config.retry)
-            self._http_requester.mount("http://", adapter)
-            self._http_requester.mount("https://", adapter)
+            # The connections to each host are kept alive for the parallel downloads and uploads,
+            # instead of discarding the ones that don't fit in the default pool of 10
+            self._adapter = HTTPAdapter(max_retries=config.retry,
+                                        pool_maxsize=_pool_size(config))
+            self._http_requester.mount("http://", self._adapter)
+            self._http_requester.mount("https://", self._adapter)
 
         self._timeout_seconds = config.request_timeout
         self.proxies = config.proxies or {}
@@ -115,9 +121,45 @@ class ConanRequester(object):
             all_kwargs = self._add_kwargs(url, kwargs)
             tmp = getattr(self._http_requester, method)(url, **all_kwargs)
             duration = time.time() - t1
-            log_client_rest_api_call(url, method.upper(), duration, all_kwargs.get("headers"))
+            # Counting the connections of the pools is only worth it if they are traced
+            connections = self._connections() if os.getenv("CONAN_TRACE_FILE") else None
+            log_client_rest_api_call(url, method.upper(), duration, all_kwargs.get("headers"),
+                                     connections)
             return tmp
         finally:
             if popped:
                 os.environ.clear()
                 os.environ.update(old_env)
+
+    def _connections(self):
+        """ The connections opened and the requests sent through them by all the pools of the
+        session, to check how many connections are reused
+        """
+        if self._adapter is None:
+            return None
+        # Other threads can be adding proxy managers and evicting pools meanwhile
+        try:
+            managers = [self._adapter.poolmanager] + list(self._adapter.proxy_manager.values())
+        except RuntimeError:  # dictionary changed size during iteration
+            managers = [self._adapter.poolmanager]
+        pools = []
+        for manager in managers:
+            for key in manager.pools.keys():
+                try:
+                    pools.append(manager.pools[key])
+                except KeyError:
+                    pass
+        return {"opened": sum(pool.num_connections for pool in pools),
+                "requests": sum(pool.num_requests for pool in pools)}
+
+
+def _pool_size(config):
+    """ The maximum connections to the same host, for the threads of the parallel downloads
+    (parallel_download, parallel_build) and uploads (cpu_count)
+    """
+    parallel = [DEFAULT_POOLSIZE, cpu_count()]
+    try:
+        parallel.extend([config.parallel_download or 0, config.parallel_build or 0])
+    except ConanException:  # Invalid values fail where they are used
+        pass
+    return max(parallel)
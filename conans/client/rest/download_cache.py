@@ -1,23 +1,38 @@
 import os
 import shutil
+import uuid
 from threading import Lock
 
 from six.moves.urllib_parse import urlsplit, urlunsplit
 
 from conans.client.tools.files import check_md5, check_sha1, check_sha256
 from conans.errors import ConanException
-from conans.util.files import mkdir
+from conans.util.files import load, mkdir, save, sha256sum
 from conans.util.locks import SimpleLock
+from conans.util.log import logger
 from conans.util.sha import sha256 as sha256_sum
 
+CONTENTS_FOLDER = "contents"  # The files, named by their sha256
+KEYS_FOLDER = "keys"  # The sha256 of the files, by their URL and their known checksums
+LOCKS_FOLDER = "locks"
+
 
 class CachedFileDownloader(object):
+    """ The download cache is content addressed, every downloaded file is stored just once,
+    named by its sha256, no matter the URLs or remotes it was downloaded from. They are found
+    by the checksums of the file, if they are known, or by the URL otherwise. Above "max_size"
+    bytes, the least recently used files are removed.
+
+    The files of the previous layout, named by the hash of their URL in the root of the cache
+    folder, are moved to the new one the first time the cache is used
+    """
     _thread_locks = {}  # Needs to be shared among all instances
 
-    def __init__(self, cache_folder, file_downloader, user_download=False):
+    def __init__(self, cache_folder, file_downloader, user_download=False, max_size=None):
         self._cache_folder = cache_folder
         self._file_downloader = file_downloader
         self._user_download = user_download
+        self._max_size = max_size
 
     @staticmethod
     def _check_checksum(cache_path, md5, sha1, sha256):
@@ -35,48 +50,114 @@ class CachedFileDownloader(object):
         checksum = sha256 or sha1 or md5
         # If it is a user download, it must contain a checksum
         assert (not self._user_download) or (self._user_download and checksum)
-        h = self._get_hash(url, checksum)
-        lock = os.path.join(self._cache_folder, "locks", h)
-        cached_path = os.path.join(self._cache_folder, h)
+        checksums_keys = ["%s_%s" % (name, value.lower())
+                          for name, value in (("sha256", sha256), ("sha1", sha1), ("md5", md5))
+                          if value]
+        url_key = self._get_hash(url, checksum)
+        _migrate_old_layout(self._cache_folder)
+        # The lock of the strongest key, the same file from other URLs uses the same
+        h = checksums_keys[0] if checksums_keys else url_key
+        lock = os.path.join(self._cache_folder, LOCKS_FOLDER, h)
         with SimpleLock(lock):
             # Once the process has access, make sure multithread is locked too
             # as SimpleLock doesn't work multithread
             thread_lock = self._thread_locks.setdefault(lock, Lock())
             thread_lock.acquire()
             try:
-                if not os.path.exists(cached_path):
+                cached_path = self._find(checksums_keys + [url_key], sha256)
+                if cached_path is not None:
                     try:
-                        self._file_downloader.download(url, cached_path, auth, retry, retry_wait,
-                                                       overwrite, headers)
-                        self._check_checksum(cached_path, md5, sha1, sha256)
-                    except Exception:
+                        return self._use_cached(cached_path, file_path, md5, sha1, sha256)
+                    except (IOError, OSError):
+                        # Other process pruning the cache (under the lock of other key) can
+                        # remove it after it was found, it is downloaded again
                         if os.path.exists(cached_path):
-                            os.remove(cached_path)
-                        raise
-                else:
-                    # specific check for corrupted cached files, will raise, but do nothing more
-                    # user can report it or "rm -rf cache_folder/path/to/file"
-                    try:
-                        self._check_checksum(cached_path, md5, sha1, sha256)
-                    except ConanException as e:
-                        raise ConanException("%s\nCached downloaded file corrupted: %s"
-                                             % (str(e), cached_path))
-
-                if file_path is not None:
-                    file_path = os.path.abspath(file_path)
-                    mkdir(os.path.dirname(file_path))
-                    shutil.copy2(cached_path, file_path)
-                else:
-                    with open(cached_path, 'rb') as handle:
-                        tmp = handle.read()
-                    return tmp
+                            raise
+                        logger.debug("DOWNLOAD CACHE: %s removed while used" % cached_path)
+                cached_path = self._download(url, auth, retry, retry_wait, overwrite, headers,
+                                             md5, sha1, sha256, checksums_keys + [url_key])
+                return self._deliver(cached_path, file_path)
             finally:
                 thread_lock.release()
 
+    def _use_cached(self, cached_path, file_path, md5, sha1, sha256):
+        # specific check for corrupted cached files, will raise, but do nothing more
+        # user can report it or "rm -rf cache_folder/path/to/file"
+        try:
+            self._check_checksum(cached_path, md5, sha1, sha256)
+        except ConanException as e:
+            raise ConanException("%s\nCached downloaded file corrupted: %s"
+                                 % (str(e), cached_path))
+        os.utime(cached_path, None)  # Most recently used
+        return self._deliver(cached_path, file_path)
+
+    def _deliver(self, cached_path, file_path):
+        """ copies the cached file to "file_path", or returns its contents if it is None """
+        if file_path is not None:
+            file_path = os.path.abspath(file_path)
+            mkdir(os.path.dirname(file_path))
+            self._copy(cached_path, file_path)
+        else:
+            with open(cached_path, 'rb') as handle:
+                return handle.read()
+
+    def _find(self, keys, sha256=None):
+        """ The path of the cached file of any of the keys, None if it is not cached """
+        if sha256:  # The file itself, even if it was cached by other URL without checksums
+            cached_path = os.path.join(self._cache_folder, CONTENTS_FOLDER, sha256.lower())
+            if os.path.isfile(cached_path):
+                return cached_path
+        for key in keys:
+            key_path = os.path.join(self._cache_folder, KEYS_FOLDER, key)
+            try:
+                cached_path = os.path.join(self._cache_folder, CONTENTS_FOLDER, load(key_path))
+            except (IOError, OSError):
+                continue
+            if os.path.isfile(cached_path):
+                return cached_path
+        return None
+
+    def _download(self, url, auth, retry, retry_wait, overwrite, headers, md5, sha1, sha256,
+                  keys):
+        contents_folder = os.path.join(self._cache_folder, CONTENTS_FOLDER)
+        mkdir(contents_folder)
+        tmp_path = os.path.join(contents_folder, "%s.tmp" % uuid.uuid4().hex)
+        try:
+            self._file_downloader.download(url, tmp_path, auth, retry, retry_wait,
+                                           overwrite, headers)
+            self._check_checksum(tmp_path, md5, sha1, sha256)
+            sha256 = sha256 or sha256sum(tmp_path)
+            cached_path = os.path.join(contents_folder, sha256.lower())
+            # The same file could have been cached from other URL, it is just replaced
+            os.replace(tmp_path, cached_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        for key in keys:
+            save(os.path.join(self._cache_folder, KEYS_FOLDER, key), sha256.lower())
+        if self._max_size is not None:
+            self.prune(self._cache_folder, self._max_size, keep=cached_path)
+        return cached_path
+
+    def _copy(self, cached_path, file_path):
+        """ The compressed artifacts are hard linked if possible, they are extracted and removed
+        later, so the cached file is never modified through the link
+        """
+        if not self._user_download and file_path.endswith(".tgz"):
+            try:
+                if os.path.lexists(file_path):
+                    os.remove(file_path)
+                os.link(cached_path, file_path)
+                return
+            except (OSError, AttributeError):  # Other filesystem, not supported...
+                logger.debug("DOWNLOAD CACHE: Couldn't link %s, copying it" % cached_path)
+        shutil.copy2(cached_path, file_path)
+
     def _get_hash(self, url, checksum=None):
         """ For Api V2, the cached downloads always have recipe and package REVISIONS in the URL,
         making them immutable, and perfect for cached downloads of artifacts. For V2 checksum
-        will always be None.
+        is the one of the file list of the server, if it provides them.
         For ApiV1, the checksum is obtained from the server via "get_snapshot()" methods, but
         the URL in the apiV1 contains the signature=xxx for signed urls, but that can change,
         so better strip it from the URL before the hash
@@ -89,3 +170,76 @@ class CachedFileDownloader(object):
             url += checksum
         h = sha256_sum(url.encode())
         return h
+
+    @staticmethod
+    def stats(cache_folder):
+        """ The (number of files, total size in bytes) of the download cache """
+        _migrate_old_layout(cache_folder)
+        files = _cached_files(cache_folder)
+        return len(files), sum(size for _, _, size in files)
+
+    @staticmethod
+    def prune(cache_folder, max_size, keep=None):
+        """ Removes the least recently used files until the size of the download cache is not
+        larger than "max_size" bytes. Returns the (number of files, bytes) removed
+        """
+        _migrate_old_layout(cache_folder)
+        files = _cached_files(cache_folder)
+        total_size = sum(size for _, _, size in files)
+        removed_files = removed_size = 0
+        for _, path, size in sorted(files):
+            if total_size - removed_size <= max_size:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError as e:  # e.g. used by another process in Windows, removed later
+                logger.debug("DOWNLOAD CACHE: Couldn't remove %s: %s" % (path, e))
+                continue
+            removed_files += 1
+            removed_size += size
+        if removed_files:
+            # The keys of the removed files are not valid anymore
+            keys_folder = os.path.join(cache_folder, KEYS_FOLDER)
+            existing = set(os.listdir(os.path.join(cache_folder, CONTENTS_FOLDER)))
+            for key in os.listdir(keys_folder):
+                key_path = os.path.join(keys_folder, key)
+                try:
+                    if load(key_path) not in existing:
+                        os.remove(key_path)
+                except (IOError, OSError):
+                    pass
+        return removed_files, removed_size
+
+
+def _cached_files(cache_folder):
+    """ [(last used time, path, size)] of the files of the download cache """
+    contents_folder = os.path.join(cache_folder, CONTENTS_FOLDER)
+    if not os.path.isdir(contents_folder):
+        return []
+    ret = []
+    for entry in os.scandir(contents_folder):
+        if entry.is_file() and not entry.name.endswith(".tmp"):
+            stats = entry.stat()
+            ret.append((stats.st_mtime, entry.path, stats.st_size))
+    return ret
+
+
+def _migrate_old_layout(cache_folder):
+    """ The files of the previous layout, "<cache_folder>/<sha256 of the URL>", are moved to the
+    contents folder, and their URL hash is kept as a key, so they are still found and pruned
+    """
+    try:
+        entries = [entry for entry in os.scandir(cache_folder)
+                   if entry.is_file() and len(entry.name) == 64]
+    except OSError:  # The cache folder doesn't exist yet
+        return
+    for entry in entries:
+        try:
+            sha256 = sha256sum(entry.path)
+            mkdir(os.path.join(cache_folder, CONTENTS_FOLDER))
+            os.replace(entry.path, os.path.join(cache_folder, CONTENTS_FOLDER, sha256))
+        except (IOError, OSError):  # Migrated meanwhile by other process
+            continue
+        save(os.path.join(cache_folder, KEYS_FOLDER, entry.name), sha256)
@@ -44,12 +44,15 @@ class FileDownloader(object):
         return _call_with_retry(self._output, retry, retry_wait, self._download_file, url, auth,
                                 headers, file_path)
 
-    def _download_file(self, url, auth, headers, file_path, try_resume=False):
+    def _download_file(self, url, auth, headers, file_path, try_resume=False, etag=None):
         t1 = time.time()
         if try_resume and file_path and os.path.exists(file_path):
             range_start = os.path.getsize(file_path)
             headers = headers.copy() if headers else {}
             headers["range"] = "bytes={}-".format(range_start)
+            if etag:
+                # The server sends the whole file if it has changed since the first part
+                headers["If-Range"] = etag
         else:
             range_start = 0
 
@@ -71,6 +74,9 @@ class FileDownloader(object):
                 raise AuthenticationException()
             raise ConanException("Error %d downloading file %s" % (response.status_code, url))
 
+        if range_start and response.status_code == 200 and "If-Range" in headers:
+            range_start = 0  # The file changed, it is downloaded again from the beginning
+
         def read_response(size):
             for chunk in response.iter_content(size):
                 yield chunk
@@ -126,8 +132,10 @@ class FileDownloader(object):
             if total_downloaded_size != total_length and not gzip:
                 if (file_path and total_length > total_downloaded_size > range_start
                         and response.headers.get("Accept-Ranges") == "bytes"):
+                    etag = response.headers.get("ETag")
+                    etag = etag if etag and not etag.startswith("W/") else None
                     written_chunks = self._download_file(url, auth, headers, file_path,
-                                                         try_resume=True)
+                                                         try_resume=True, etag=etag)
                 else:
                     raise ConanException("Transfer interrupted before complete: %s < %s"
                                          % (total_downloaded_size, total_length))
@@ -48,7 +48,8 @@ class RestV1Methods(RestCommonMethods):
         download_cache = self._config.download_cache
         if download_cache:
             assert snapshot_md5 is not None, "if download_cache is set, we need the file checksums"
-            downloader = CachedFileDownloader(download_cache, downloader)
+            downloader = CachedFileDownloader(download_cache, downloader,
+                                              max_size=self._config.download_cache_max_size)
         # Take advantage of filenames ordering, so that conan_package.tgz and conan_export.tgz
         # can be < conanfile, conaninfo, and sent always the last, so smaller files go first
         for filename, resource_url in sorted(file_urls.items(), reverse=True):
@@ -192,7 +193,8 @@ class RestV1Methods(RestCommonMethods):
         download_cache = self._config.download_cache
         if download_cache:
             assert snapshot_md5 is not None, "if download_cache is set, we need the file checksums"
-            downloader = CachedFileDownloader(download_cache, downloader)
+            downloader = CachedFileDownloader(download_cache, downloader,
+                                              max_size=self._config.download_cache_max_size)
 
         ret = {}
         # Take advantage of filenames ordering, so that conan_package.tgz and conan_export.tgz
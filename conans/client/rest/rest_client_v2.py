@@ -35,7 +35,9 @@ class RestV2Methods(RestCommonMethods):
 
     def _get_file_list_json(self, url):
         data = self.get_json(url)
-        # Discarding (.keys()) still empty metadata for files
+        # The metadata of the files are their checksums, if the server provides them
+        data["checksums"] = {filename: metadata for filename, metadata in data["files"].items()
+                             if metadata}
         data["files"] = list(data["files"].keys())
         return data
 
@@ -43,7 +45,8 @@ class RestV2Methods(RestCommonMethods):
         # We don't want traces in output of these downloads, they are ugly in output
         downloader = FileDownloader(self.requester, None, self.verify_ssl, self._config)
         if use_cache and self._config.download_cache:
-            downloader = CachedFileDownloader(self._config.download_cache, downloader)
+            downloader = CachedFileDownloader(self._config.download_cache, downloader,
+                                              max_size=self._config.download_cache_max_size)
         contents = downloader.download(url, auth=self.auth)
         return contents
 
@@ -94,7 +97,8 @@ class RestV2Methods(RestCommonMethods):
         # If we didn't indicated reference, server got the latest, use absolute now, it's safer
         urls = {fn: self.router.recipe_file(ref, fn) for fn in files}
         cache = (ref.revision != DEFAULT_REVISION_V1)
-        self._download_and_save_files(urls, dest_folder, files, use_cache=cache)
+        self._download_and_save_files(urls, dest_folder, files, use_cache=cache,
+                                      checksums=data["checksums"])
         ret = {fn: os.path.join(dest_folder, fn) for fn in files}
         return ret
 
@@ -113,7 +117,8 @@ class RestV2Methods(RestCommonMethods):
         # If we didn't indicated reference, server got the latest, use absolute now, it's safer
         urls = {fn: self.router.recipe_file(ref, fn) for fn in files}
         cache = (ref.revision != DEFAULT_REVISION_V1)
-        self._download_and_save_files(urls, dest_folder, files, use_cache=cache)
+        self._download_and_save_files(urls, dest_folder, files, use_cache=cache,
+                                      checksums=data["checksums"])
         ret = {fn: os.path.join(dest_folder, fn) for fn in files}
         return ret
 
@@ -125,7 +130,8 @@ class RestV2Methods(RestCommonMethods):
         # If we didn't indicated reference, server got the latest, use absolute now, it's safer
         urls = {fn: self.router.package_file(pref, fn) for fn in files}
         cache = (pref.revision != DEFAULT_REVISION_V1)
-        self._download_and_save_files(urls, dest_folder, files, use_cache=cache)
+        self._download_and_save_files(urls, dest_folder, files, use_cache=cache,
+                                      checksums=data["checksums"])
         ret = {fn: os.path.join(dest_folder, fn) for fn in files}
         return ret
 
@@ -215,10 +221,12 @@ class RestV2Methods(RestCommonMethods):
         else:
             logger.debug("\nUPLOAD: All uploaded! Total time: %s\n" % str(time.time() - t1))
 
-    def _download_and_save_files(self, urls, dest_folder, files, use_cache):
+    def _download_and_save_files(self, urls, dest_folder, files, use_cache, checksums=None):
         downloader = FileDownloader(self.requester, self._output, self.verify_ssl, self._config)
-        if use_cache and self._config.download_cache:
-            downloader = CachedFileDownloader(self._config.download_cache, downloader)
+        cached = use_cache and self._config.download_cache
+        if cached:
+            downloader = CachedFileDownloader(self._config.download_cache, downloader,
+                                              max_size=self._config.download_cache_max_size)
         # Take advantage of filenames ordering, so that conan_package.tgz and conan_export.tgz
         # can be < conanfile, conaninfo, and sent always the last, so smaller files go first
         for filename in sorted(files, reverse=True):
@@ -226,7 +234,14 @@ class RestV2Methods(RestCommonMethods):
                 self._output.writeln("Downloading %s" % filename)
             resource_url = urls[filename]
             abs_path = os.path.join(dest_folder, filename)
-            downloader.download(resource_url, abs_path, auth=self.auth)
+            if cached:
+                # The same file is found in the download cache even from other remotes or URLs
+                file_checksums = (checksums or {}).get(filename, {})
+                downloader.download(resource_url, abs_path, auth=self.auth,
+                                    md5=file_checksums.get("md5"), sha1=file_checksums.get("sha1"),
+                                    sha256=file_checksums.get("sha256"))
+            else:
+                downloader.download(resource_url, abs_path, auth=self.auth)
 
     def _remove_conanfile_files(self, ref, files):
         # V2 === revisions, do not remove files, it will create a new revision if the files changed
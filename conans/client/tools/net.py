@@ -1,6 +1,5 @@
 import os
 
-from conans.client.rest.download_cache import CachedFileDownloader
 from conans.client.rest.file_downloader import FileDownloader
 from conans.client.tools.files import check_md5, check_sha1, check_sha256, unzip
 from conans.errors import ConanException
@@ -80,6 +79,8 @@ def download(url, filename, verify=True, out=None, retry=None, retry_wait=None,
     out = default_output(out, 'conans.client.tools.net.download')
     requester = default_requester(requester, 'conans.client.tools.net.download')
     from conans.tools import _global_config as config
+    # The download cache uses the checksum tools, it can't be imported with them
+    from conans.client.rest.download_cache import CachedFileDownloader
 
     # It might be possible that users provide their own requester
     retry = retry if retry is not None else config.retry
@@ -91,7 +92,8 @@ def download(url, filename, verify=True, out=None, retry=None, retry_wait=None,
 
     downloader = FileDownloader(requester=requester, output=out, verify=verify, config=config)
     if config and config.download_cache and checksum:
-        downloader = CachedFileDownloader(config.download_cache, downloader, user_download=True)
+        downloader = CachedFileDownloader(config.download_cache, downloader, user_download=True,
+                                          max_size=config.download_cache_max_size)
 
     def _download_file(file_url):
         # The download cache is only used if a checksum is provided, otherwise, a normal download
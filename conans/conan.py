@@ -1,13 +1,19 @@
 import sys
 import os
 
-if os.getenv("CONAN_V2_CLI"):
-    from conans.cli.cli import main
-else:
-    from conans.client.command import main
-
 
 def run():
+    if os.getenv("CONAN_DAEMON") and not os.getenv("CONAN_V2_CLI"):
+        # Before importing the rest of conan, the daemon has it already imported
+        from conans.client.daemon import run_client
+        exit_code = run_client(sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    if os.getenv("CONAN_V2_CLI"):
+        from conans.cli.cli import main
+    else:
+        from conans.client.command import main
     main(sys.argv[1:])
 
 
@@ -7,8 +7,10 @@ def run():
     parser = argparse.ArgumentParser(description='Launch the server')
     parser.add_argument('--migrate', default=False, action='store_true',
                         help='Run the pending migrations')
+    parser.add_argument('--rebuild-index', default=False, action='store_true',
+                        help='Index again all the storage for the searches, and exit')
     args = parser.parse_args()
-    launcher = ServerLauncher(force_migration=args.migrate)
+    launcher = ServerLauncher(force_migration=args.migrate, rebuild_index=args.rebuild_index)
     launcher.launch()
 
 
@@ -35,6 +35,52 @@ class DefaultOrderedDict(OrderedDict):
         return the_copy
 
 
+class DirsCache(object):
+    """ The existing directories of the packages, for the _CppInfo paths. Every folder is listed
+    just once, with a single scandir(), instead of an isdir() per path of every package,
+    component and config, which is slow in network filesystems. The folders of a package have
+    to be invalidated when it is (re)built or downloaded
+    """
+
+    def __init__(self):
+        self._dirs = {}  # {folder: (names of the subdirectories, lowercase names) or None}
+
+    def _scan(self, folder):
+        try:
+            with os.scandir(folder) as entries:
+                names = [entry.name for entry in entries if entry.is_dir()]
+        except (IOError, OSError):
+            if os.path.exists(folder):  # e.g. not readable, but could be traversed
+                return None
+            names = []
+        return set(names), set(name.lower() for name in names)
+
+    def isdir(self, path):
+        folder, name = os.path.split(os.path.normpath(path))
+        if not name:
+            return os.path.isdir(path)
+        try:
+            dirs = self._dirs[folder]
+        except KeyError:
+            dirs = self._dirs[folder] = self._scan(folder)
+        if dirs is None:
+            return os.path.isdir(path)
+        names, lower_names = dirs
+        if name in names:
+            return True
+        if name.lower() not in lower_names:
+            return False
+        # Only the case is different, it depends on the filesystem
+        return os.path.isdir(path)
+
+    def invalidate(self, folder):
+        folder = os.path.normpath(folder)
+        prefix = os.path.join(folder, "")
+        for cached in list(self._dirs):
+            if cached == folder or cached.startswith(prefix):
+                self._dirs.pop(cached, None)
+
+
 class _CppInfo(object):
     """ Object that stores all the necessary information to build in C/C++.
     It is intended to be system independent, translation to
@@ -77,12 +123,14 @@ class _CppInfo(object):
         self.description = None  # Description of the conan package
         # When package is editable, filter_empty=False, so empty dirs are maintained
         self.filter_empty = True
+        self._dirs_cache = None  # DirsCache of the package folders, if any
 
     def _filter_paths(self, paths):
         abs_paths = [os.path.join(self.rootpath, p)
                      if not os.path.isabs(p) else p for p in paths]
         if self.filter_empty:
-            return [p for p in abs_paths if os.path.isdir(p)]
+            isdir = self._dirs_cache.isdir if self._dirs_cache is not None else os.path.isdir
+            return [p for p in abs_paths if isdir(p)]
         else:
             return abs_paths
 
@@ -167,8 +215,9 @@ class _CppInfo(object):
 
 class Component(_CppInfo):
 
-    def __init__(self, rootpath, version):
+    def __init__(self, rootpath, version, dirs_cache=None):
         super(Component, self).__init__()
+        self._dirs_cache = dirs_cache
         self.rootpath = rootpath
         self.includedirs.append(DEFAULT_INCLUDE)
         self.libdirs.append(DEFAULT_LIB)
@@ -187,8 +236,9 @@ class CppInfo(_CppInfo):
     Defined in user CONANFILE, directories are relative at user definition time
     """
 
-    def __init__(self, ref_name, root_folder):
+    def __init__(self, ref_name, root_folder, dirs_cache=None):
         super(CppInfo, self).__init__()
+        self._dirs_cache = dirs_cache
         self._ref_name = ref_name
         self._name = ref_name
         self.rootpath = root_folder  # the full path of the package in which the conans is found
@@ -198,7 +248,8 @@ class CppInfo(_CppInfo):
         self.resdirs.append(DEFAULT_RES)
         self.builddirs.append(DEFAULT_BUILD)
         self.frameworkdirs.append(DEFAULT_FRAMEWORK)
-        self.components = DefaultOrderedDict(lambda: Component(self.rootpath, self.version))
+        self.components = DefaultOrderedDict(lambda: Component(self.rootpath, self.version,
+                                                               self._dirs_cache))
         # public_deps is needed to accumulate list of deps for cmake targets
         self.public_deps = []
         self._configs = {}
@@ -229,6 +280,7 @@ class CppInfo(_CppInfo):
         def _get_cpp_info():
             result = _CppInfo()
             result.filter_empty = self.filter_empty
+            result._dirs_cache = self._dirs_cache
             result.rootpath = self.rootpath
             result.sysroot = self.sysroot
             result.includedirs.append(DEFAULT_INCLUDE)
@@ -315,34 +367,95 @@ class CppInfo(_CppInfo):
             _check_components_requires_instersection(self.requires)
 
 
+class _MergedList(object):
+    """ A list field of the _BaseDepsCppInfo, the values of every dependency are stored when it is
+    updated, and merged only when the field is read, in just one pass:
+    - "reverse=False": the values of the new dependency are appended, and the previous
+      occurrences of them removed: [s for s in current if s not in new] + new
+    - "reverse=True": the values of the new dependency not already in the list are prepended:
+      [s for s in new if s not in current] + current
+    The merged list is the one returned and stored, so it can be modified in place
+    """
+
+    def __init__(self, name, reverse=False):
+        self._name = name
+        self._reverse = reverse
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        chunks = obj.__dict__["_chunks"][self._name]
+        if len(chunks) > 1:
+            chunks[:] = [self._merge(chunks)]
+        return chunks[0]
+
+    def __set__(self, obj, value):
+        obj.__dict__.setdefault("_chunks", {})[self._name] = [value]
+
+    def _merge(self, chunks):
+        seen = set()
+        parts = []
+        if self._reverse:
+            # Every chunk without the values of the previous ones, and prepended
+            for chunk in chunks:
+                parts.append([s for s in chunk if s not in seen])
+                seen.update(chunk)
+        else:
+            # Every chunk without the values of the next ones, and appended
+            for chunk in reversed(chunks):
+                parts.append([s for s in chunk if s not in seen])
+                seen.update(chunk)
+        return [s for part in reversed(parts) for s in part]
+
+
 class _BaseDepsCppInfo(_CppInfo):
+    system_libs = _MergedList("system_libs")
+    includedirs = _MergedList("includedirs")
+    srcdirs = _MergedList("srcdirs")
+    libdirs = _MergedList("libdirs")
+    bindirs = _MergedList("bindirs")
+    resdirs = _MergedList("resdirs")
+    builddirs = _MergedList("builddirs")
+    frameworkdirs = _MergedList("frameworkdirs")
+    libs = _MergedList("libs")
+    frameworks = _MergedList("frameworks")
+    build_modules = _MergedList("build_modules")
+    requires = _MergedList("requires")
+    # Note these are in reverse order
+    defines = _MergedList("defines", reverse=True)
+    cxxflags = _MergedList("cxxflags", reverse=True)
+    cflags = _MergedList("cflags", reverse=True)
+    sharedlinkflags = _MergedList("sharedlinkflags", reverse=True)
+    exelinkflags = _MergedList("exelinkflags", reverse=True)
+
     def __init__(self):
         super(_BaseDepsCppInfo, self).__init__()
 
     def update(self, dep_cpp_info):
-        def merge_lists(seq1, seq2):
-            return [s for s in seq1 if s not in seq2] + seq2
-
-        self.system_libs = merge_lists(self.system_libs, dep_cpp_info.system_libs)
-        self.includedirs = merge_lists(self.includedirs, dep_cpp_info.include_paths)
-        self.srcdirs = merge_lists(self.srcdirs, dep_cpp_info.src_paths)
-        self.libdirs = merge_lists(self.libdirs, dep_cpp_info.lib_paths)
-        self.bindirs = merge_lists(self.bindirs, dep_cpp_info.bin_paths)
-        self.resdirs = merge_lists(self.resdirs, dep_cpp_info.res_paths)
-        self.builddirs = merge_lists(self.builddirs, dep_cpp_info.build_paths)
-        self.frameworkdirs = merge_lists(self.frameworkdirs, dep_cpp_info.framework_paths)
-        self.libs = merge_lists(self.libs, dep_cpp_info.libs)
-        self.frameworks = merge_lists(self.frameworks, dep_cpp_info.frameworks)
-        self.build_modules = merge_lists(self.build_modules, dep_cpp_info.build_modules_paths)
-        self.requires = merge_lists(self.requires, dep_cpp_info.requires)
+        """ The values are merged only when they are read, not for every added dependency
+        """
+        def merge_lists(field, values):
+            self._chunks[field].append(values)
+
+        merge_lists("system_libs", dep_cpp_info.system_libs)
+        merge_lists("includedirs", dep_cpp_info.include_paths)
+        merge_lists("srcdirs", dep_cpp_info.src_paths)
+        merge_lists("libdirs", dep_cpp_info.lib_paths)
+        merge_lists("bindirs", dep_cpp_info.bin_paths)
+        merge_lists("resdirs", dep_cpp_info.res_paths)
+        merge_lists("builddirs", dep_cpp_info.build_paths)
+        merge_lists("frameworkdirs", dep_cpp_info.framework_paths)
+        merge_lists("libs", dep_cpp_info.libs)
+        merge_lists("frameworks", dep_cpp_info.frameworks)
+        merge_lists("build_modules", dep_cpp_info.build_modules_paths)
+        merge_lists("requires", dep_cpp_info.requires)
         self.rootpaths.append(dep_cpp_info.rootpath)
 
-        # Note these are in reverse order
-        self.defines = merge_lists(dep_cpp_info.defines, self.defines)
-        self.cxxflags = merge_lists(dep_cpp_info.cxxflags, self.cxxflags)
-        self.cflags = merge_lists(dep_cpp_info.cflags, self.cflags)
-        self.sharedlinkflags = merge_lists(dep_cpp_info.sharedlinkflags, self.sharedlinkflags)
-        self.exelinkflags = merge_lists(dep_cpp_info.exelinkflags, self.exelinkflags)
+        merge_lists("defines", dep_cpp_info.defines)
+        merge_lists("cxxflags", dep_cpp_info.cxxflags)
+        merge_lists("cflags", dep_cpp_info.cflags)
+        merge_lists("sharedlinkflags", dep_cpp_info.sharedlinkflags)
+        merge_lists("exelinkflags", dep_cpp_info.exelinkflags)
 
         if not self.sysroot:
             self.sysroot = dep_cpp_info.sysroot
@@ -415,18 +528,24 @@ class DepCppInfo(object):
             attr = self._cpp_info.__getattr__(item)
         return attr
 
-    @staticmethod
-    def _merge_lists(seq1, seq2):
-        return seq1 + [s for s in seq2 if s not in seq1]
+    def _merge_components(self, values, item):
+        """ The values of the components not already in "values", appended in order
+        """
+        if not self._cpp_info.components:
+            return values
+        values = list(values)
+        seen = set(values)
+        for component in self._get_sorted_components().values():
+            new_values = [s for s in getattr(component, item) if s not in seen]
+            values.extend(new_values)
+            seen.update(new_values)
+        return values
 
     def _aggregated_values(self, item):
         values = getattr(self, "_%s" % item)
         if values is not None:
             return values
-        values = getattr(self._cpp_info, item)
-        if self._cpp_info.components:
-            for component in self._get_sorted_components().values():
-                values = self._merge_lists(values, getattr(component, item))
+        values = self._merge_components(getattr(self._cpp_info, item), item)
         setattr(self, "_%s" % item, values)
         return values
 
@@ -434,10 +553,8 @@ class DepCppInfo(object):
         paths = getattr(self, "_%s_paths" % item)
         if paths is not None:
             return paths
-        paths = getattr(self._cpp_info, "%s_paths" % item)
-        if self._cpp_info.components:
-            for component in self._get_sorted_components().values():
-                paths = self._merge_lists(paths, getattr(component, "%s_paths" % item))
+        paths = self._merge_components(getattr(self._cpp_info, "%s_paths" % item),
+                                       "%s_paths" % item)
         setattr(self, "_%s_paths" % item, paths)
         return paths
 
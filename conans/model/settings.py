@@ -31,10 +31,14 @@ class SettingsItem(object):
     - "ANY", as string to accept any value
     - List ["None", "ANY"] to accept None or any value
     - A dict {subsetting: definition}, e.g. {version: [], runtime: []} for VS
+
+    The copies share the definition, until the copy or the original modify it (copy-on-write),
+    so copying the settings of every node of the graph doesn't copy the whole settings.yml tree
     """
     def __init__(self, definition, name):
         self._name = name  # settings.compiler
         self._value = None  # gcc
+        self._shared = False  # The _definition is shared with other copies, don't modify it
         if isinstance(definition, dict):
             self._definition = {}
             # recursive
@@ -51,16 +55,25 @@ class SettingsItem(object):
         return value in (self._value or "")
 
     def copy(self):
-        """ deepcopy, recursive
+        """ deepcopy, the definition is copied only when it is modified
         """
         result = SettingsItem({}, name=self._name)
         result._value = self._value
-        if self.is_final:
-            result._definition = self._definition[:]
-        else:
-            result._definition = {k: v.copy() for k, v in self._definition.items()}
+        result._definition = self._definition
+        self._shared = result._shared = True
         return result
 
+    def _own_definition(self):
+        """ The definition to be modified, copied first if it is shared
+        """
+        if self._shared:
+            if self.is_final:
+                self._definition = self._definition[:]  # [:] also for "ANY"
+            else:
+                self._definition = {k: v.copy() for k, v in self._definition.items()}
+            self._shared = False
+        return self._definition
+
     def copy_values(self):
         if self._value is None and "None" not in self._definition:
             return None
@@ -68,7 +81,8 @@ class SettingsItem(object):
         result = SettingsItem({}, name=self._name)
         result._value = self._value
         if self.is_final:
-            result._definition = self._definition[:]
+            result._definition = self._definition
+            self._shared = result._shared = True
         else:
             result._definition = {k: v.copy_values() for k, v in self._definition.items()}
         return result
@@ -117,12 +131,13 @@ class SettingsItem(object):
         for v in values:
             v = str(v)
             if isinstance(self._definition, dict):
-                self._definition.pop(v, None)
+                self._own_definition().pop(v, None)
             elif self._definition == "ANY":
                 if v == "ANY":
                     self._definition = []
+                    self._shared = False
             elif v in self._definition:
-                self._definition.remove(v)
+                self._own_definition().remove(v)
 
         if self._value is not None and self._value not in self._definition and self._not_any():
             raise ConanException(bad_value_msg(self._name, self._value, self.values_range))
@@ -132,7 +147,7 @@ class SettingsItem(object):
             raise undefined_field(self._name, item, None, self._value)
         if self._value is None:
             raise undefined_value(self._name)
-        return self._definition[self._value]
+        return self._own_definition()[self._value]
 
     def __getattr__(self, item):
         item = str(item)
@@ -150,7 +165,7 @@ class SettingsItem(object):
     def __getitem__(self, value):
         value = str(value)
         try:
-            return self._definition[value]
+            return self._own_definition()[value]
         except Exception:
             raise ConanException(bad_value_msg(self._name, value, self.values_range))
 
@@ -201,6 +216,7 @@ class Settings(object):
         self._parent_value = parent_value  # gcc, x86
         self._data = {str(k): SettingsItem(v, "%s.%s" % (name, k))
                       for k, v in definition.items()}
+        self._shared = False  # The _data is shared with other copies, don't modify it
 
     def get_safe(self, name, default=None):
         try:
@@ -214,13 +230,21 @@ class Settings(object):
         return default
 
     def copy(self):
-        """ deepcopy, recursive
+        """ deepcopy, every level is copied only when it is accessed to be modified
         """
         result = Settings({}, name=self._name, parent_value=self._parent_value)
-        for k, v in self._data.items():
-            result._data[k] = v.copy()
+        result._data = self._data
+        self._shared = result._shared = True
         return result
 
+    def _own_data(self):
+        """ The items to be modified, copied first if they are shared
+        """
+        if self._shared:
+            self._data = {k: v.copy() for k, v in self._data.items()}
+            self._shared = False
+        return self._data
+
     def copy_values(self):
         """ deepcopy, recursive
         """
@@ -252,10 +276,11 @@ class Settings(object):
             item = [item]
         for it in item:
             it = str(it)
-            self._data.pop(it, None)
+            self._own_data().pop(it, None)
 
     def clear(self):
         self._data = {}
+        self._shared = False
 
     def _check_field(self, field):
         if field not in self._data:
@@ -264,19 +289,19 @@ class Settings(object):
     def __getattr__(self, field):
         assert field[0] != "_", "ERROR %s" % field
         self._check_field(field)
-        return self._data[field]
+        return self._own_data()[field]
 
     def __delattr__(self, field):
         assert field[0] != "_", "ERROR %s" % field
         self._check_field(field)
-        del self._data[field]
+        del self._own_data()[field]
 
     def __setattr__(self, field, value):
         if field[0] == "_" or field.startswith("values"):
             return super(Settings, self).__setattr__(field, value)
 
         self._check_field(field)
-        self._data[field].value = value
+        self._own_data()[field].value = value
 
     @property
     def values(self):
@@ -325,7 +350,7 @@ class Settings(object):
             constraint_def = {str(k): v for k, v in constraint_def.items()}
 
         fields_to_remove = []
-        for field, config_item in self._data.items():
+        for field, config_item in self._own_data().items():
             if field not in constraint_def:
                 fields_to_remove.append(field)
                 continue
@@ -48,6 +48,7 @@ EXPORT_SOURCES_DIR_OLD = ".c_src"
 RUN_LOG_NAME = "conan_run.log"
 DEFAULT_PROFILE_NAME = "default"
 PACKAGE_METADATA = "metadata.json"
+BINARIES_INDEX = "binaries.json"
 CACERT_FILE = "cacert.pem"  # Server authorities file
 DATA_YML = "conandata.yml"
 
@@ -1,5 +1,6 @@
 # coding=utf-8
 
+import json
 import os
 import platform
 import threading
@@ -16,9 +17,11 @@ from conans.model.package_metadata import PackageMetadata
 from conans.model.ref import ConanFileReference
 from conans.model.ref import PackageReference
 from conans.paths import CONANFILE, SYSTEM_REQS, EXPORT_FOLDER, EXPORT_SRC_FOLDER, SRC_FOLDER, \
-    BUILD_FOLDER, PACKAGES_FOLDER, SYSTEM_REQS_FOLDER, PACKAGE_METADATA, SCM_SRC_FOLDER, rm_conandir
+    BUILD_FOLDER, PACKAGES_FOLDER, SYSTEM_REQS_FOLDER, PACKAGE_METADATA, SCM_SRC_FOLDER, \
+    BINARIES_INDEX, rm_conandir
 from conans.util.files import load, save, rmdir, set_dirty, clean_dirty, is_dirty
-from conans.util.locks import Lock, NoLock, ReadLock, SimpleLock, WriteLock
+from conans.util.locks import FcntlReadLock, FcntlWriteLock, Lock, NoLock, ReadLock, SimpleLock, \
+    WriteLock, fcntl
 from conans.util.log import logger
 
 
@@ -38,12 +41,16 @@ def short_path(func):
 class PackageCacheLayout(object):
     """ This is the package layout for Conan cache """
 
-    def __init__(self, base_folder, ref, short_paths, no_lock):
+    def __init__(self, base_folder, ref, short_paths, no_lock, recipe_index=None,
+                 lock_backend=None):
         assert isinstance(ref, ConanFileReference)
         self._ref = ref
         self._base_folder = os.path.normpath(base_folder)
         self._short_paths = short_paths
         self._no_lock = no_lock
+        self._recipe_index = recipe_index
+        # The fcntl backend is not available in Windows, the counter one is used instead
+        self._fcntl_locks = lock_backend == "fcntl" and fcntl is not None
 
     @property
     def ref(self):
@@ -138,12 +145,19 @@ class PackageCacheLayout(object):
             raise ConanException("%s\n\nFolder: %s\n"
                                  "Couldn't remove folder, might be busy or open\n"
                                  "Close any app using it, and retry" % (pkg_folder, str(e)))
+        # Every new binary replaces a removed one, so this keeps the index of binaries updated
+        if os.path.exists(self.binaries_index()):
+            with self.update_binaries_index() as index:
+                index.pop(pref.id, None)
         if is_dirty(pkg_folder):
             clean_dirty(pkg_folder)
 
     def package_metadata(self):
         return os.path.join(self._base_folder, PACKAGE_METADATA)
 
+    def binaries_index(self):
+        return os.path.join(self._base_folder, BINARIES_INDEX)
+
     def recipe_manifest(self):
         return FileTreeManifest.load(self.export())
 
@@ -208,38 +222,76 @@ class PackageCacheLayout(object):
     _metadata_locks = {}  # Needs to be shared among all instances
 
     @contextmanager
-    def update_metadata(self):
-        metadata_path = self.package_metadata()
-        lockfile = metadata_path + ".lock"
-        with fasteners.InterProcessLock(lockfile, logger=logger):
-            lock_name = self.package_metadata()  # The path is the thing that defines mutex
-            thread_lock = PackageCacheLayout._metadata_locks.setdefault(lock_name, threading.Lock())
+    def _file_lock(self, path):
+        with fasteners.InterProcessLock(path + ".lock", logger=logger):
+            # The path is the thing that defines mutex
+            thread_lock = PackageCacheLayout._metadata_locks.setdefault(path, threading.Lock())
             thread_lock.acquire()
             try:
-                try:
-                    metadata = self.load_metadata()
-                except RecipeNotFoundException:
-                    metadata = PackageMetadata()
-                yield metadata
-                save(metadata_path, metadata.dumps())
+                yield
             finally:
                 thread_lock.release()
 
+    @contextmanager
+    def update_metadata(self):
+        metadata_path = self.package_metadata()
+        with self._file_lock(metadata_path):
+            try:
+                metadata = self.load_metadata()
+                new_recipe = False
+            except RecipeNotFoundException:
+                metadata = PackageMetadata()
+                new_recipe = True
+            yield metadata
+            save(metadata_path, metadata.dumps())
+            # The metadata is created for every recipe that enters the cache
+            if new_recipe and self._recipe_index is not None:
+                self._recipe_index.add(self._ref)
+
+    # Binaries index
+    def load_binaries_index(self):
+        """ The binaries of the recipe already indexed, as a dict
+        {package_id: {"info": ConanInfo.serialize_min(), "recipe_revision": rrev}}
+        """
+        try:
+            index = json.loads(load(self.binaries_index()))
+        except (IOError, ValueError):  # Not created yet, or corrupted, it will be recreated
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    @contextmanager
+    def update_binaries_index(self):
+        index_path = self.binaries_index()
+        with self._file_lock(index_path):
+            index = self.load_binaries_index()
+            yield index
+            # Atomic replace, the index is read without locking
+            tmp_path = index_path + ".tmp"
+            save(tmp_path, json.dumps(index))
+            try:
+                os.replace(tmp_path, index_path)
+            except AttributeError:  # Python 2
+                if os.path.exists(index_path):
+                    os.remove(index_path)
+                os.rename(tmp_path, index_path)
+
     # Locks
     def conanfile_read_lock(self, output):
         if self._no_lock:
             return NoLock()
-        return ReadLock(self._base_folder, self._ref, output)
+        lock_class = FcntlReadLock if self._fcntl_locks else ReadLock
+        return lock_class(self._base_folder, self._ref, output)
 
     def conanfile_write_lock(self, output):
         if self._no_lock:
             return NoLock()
-        return WriteLock(self._base_folder, self._ref, output)
+        lock_class = FcntlWriteLock if self._fcntl_locks else WriteLock
+        return lock_class(self._base_folder, self._ref, output)
 
     def conanfile_lock_files(self, output):
         if self._no_lock:
             return ()
-        return WriteLock(self._base_folder, self._ref, output).files
+        return self.conanfile_write_lock(output).files
 
     def package_lock(self, pref):
         if self._no_lock:
@@ -94,13 +94,17 @@ def _evaluate(prop_name, prop_value, conan_vars_info):
 
 def search_recipes(cache, pattern=None, ignorecase=True):
     # Conan references in main storage
+    name = None
     if pattern:
         if isinstance(pattern, ConanFileReference):
+            # The index of the cache can return directly the references with a given name
+            if not any(c in pattern.name for c in "*?["):
+                name = pattern.name
             pattern = repr(pattern)
         pattern = translate(pattern)
         pattern = re.compile(pattern, re.IGNORECASE) if ignorecase else re.compile(pattern)
 
-    refs = cache.all_refs()
+    refs = cache.all_refs(name)
     refs.extend(cache.editable_packages.edited_refs.keys())
     if pattern:
         refs = [r for r in refs if _partial_match(pattern, repr(r))]
@@ -140,25 +144,56 @@ def search_packages(package_layout, query):
 
 
 def _get_local_infos_min(package_layout):
+    """ The serialized min ConanInfo of the binaries is read from the index of binaries of the
+    recipe, only the binaries not indexed yet have their conaninfo.txt parsed, and are added to it
+    """
     result = OrderedDict()
-
+    index = package_layout.load_binaries_index()
+    new_entries = {}
+    metadata = []  # Lazy loaded, only if there are binaries not indexed
     package_ids = package_layout.package_ids()
     for package_id in package_ids:
-        # Read conaninfo
-        pref = PackageReference(package_layout.ref, package_id)
-        info_path = os.path.join(package_layout.package(pref), CONANINFO)
-        if not os.path.exists(info_path):
-            logger.error("There is no ConanInfo: %s" % str(info_path))
-            continue
-        conan_info_content = load(info_path)
-
-        info = ConanInfo.loads(conan_info_content)
+        entry = index.get(package_id)
+        if entry is None:
+            if not metadata:
+                metadata.append(_load_metadata(package_layout))
+            entry = _load_binary_entry(package_layout, package_id, metadata[0])
+            if entry is None:
+                continue
+            new_entries[package_id] = entry
         if package_layout.ref.revision:
-            metadata = package_layout.load_metadata()
-            recipe_revision = metadata.packages[package_id].recipe_revision
+            recipe_revision = entry["recipe_revision"]
             if recipe_revision and recipe_revision != package_layout.ref.revision:
                 continue
-        conan_vars_info = info.serialize_min()
-        result[package_id] = conan_vars_info
+        result[package_id] = entry["info"]
 
+    if new_entries or len(index) != len(package_ids):
+        try:
+            with package_layout.update_binaries_index() as index:
+                index.update(new_entries)
+                for package_id in set(index).difference(package_ids):  # Removed externally
+                    del index[package_id]
+        except (IOError, OSError) as e:  # Not a problem, read-only cache
+            logger.debug("SEARCH: Cannot save the index of binaries of %s: %s"
+                         % (str(package_layout.ref), str(e)))
     return result
+
+
+def _load_metadata(package_layout):
+    try:
+        return package_layout.load_metadata()
+    except RecipeNotFoundException:
+        return None
+
+
+def _load_binary_entry(package_layout, package_id, metadata):
+    pref = PackageReference(package_layout.ref, package_id)
+    info_path = os.path.join(package_layout.package(pref), CONANINFO)
+    if not os.path.exists(info_path):
+        logger.error("There is no ConanInfo: %s" % str(info_path))
+        return None
+    conan_info_content = load(info_path)
+
+    info = ConanInfo.loads(conan_info_content)
+    recipe_revision = metadata.packages[package_id].recipe_revision if metadata else None
+    return {"info": info.serialize_min(), "recipe_revision": recipe_revision}
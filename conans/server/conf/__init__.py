@@ -14,7 +14,9 @@ from conans.client import tools
 from conans.errors import ConanException
 from conans.paths import conan_expand_user
 from conans.server.conf.default_server_conf import default_server_conf
+from conans.server.rest.workers_server import WORKERS_MODES
 from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.server.store.search_index import SEARCH_INDEX_FILE, SearchIndex
 from conans.server.store.server_store import ServerStore
 from conans.util.env_reader import get_env
 from conans.util.files import mkdir, save
@@ -49,6 +51,12 @@ class ConanServerConfigParser(ConfigParser):
                            "public_port": get_env("CONAN_SERVER_PUBLIC_PORT", None, environment),
                            "host_name": get_env("CONAN_HOST_NAME", None, environment),
                            "custom_authenticator": get_env("CONAN_CUSTOM_AUTHENTICATOR", None, environment),
+                           "workers_mode": get_env("CONAN_SERVER_WORKERS_MODE", None, environment),
+                           "workers": get_env("CONAN_SERVER_WORKERS", None, environment),
+                           "threads": get_env("CONAN_SERVER_THREADS", None, environment),
+                           "keep_alive_timeout": get_env("CONAN_SERVER_KEEP_ALIVE_TIMEOUT", None,
+                                                         environment),
+                           "search_index": get_env("CONAN_SERVER_SEARCH_INDEX", None, environment),
                            # "user:pass,user2:pass2"
                            "users": get_env("CONAN_SERVER_USERS", None, environment)}
 
@@ -103,6 +111,46 @@ class ConanServerConfigParser(ConfigParser):
         except ConanException:
             return self.port
 
+    @property
+    def workers_mode(self):
+        try:
+            workers_mode = self._get_conf_server_string("workers_mode")
+        except ConanException:
+            return None
+        if workers_mode not in WORKERS_MODES:
+            raise ConanException("Invalid 'workers_mode' value '%s', allowed values: %s"
+                                 % (workers_mode, ", ".join(WORKERS_MODES)))
+        return workers_mode
+
+    @property
+    def workers(self):
+        try:
+            return int(self._get_conf_server_string("workers"))
+        except ConanException:
+            return None
+
+    @property
+    def threads(self):
+        try:
+            return int(self._get_conf_server_string("threads"))
+        except ConanException:
+            return None
+
+    @property
+    def keep_alive_timeout(self):
+        try:
+            return float(self._get_conf_server_string("keep_alive_timeout"))
+        except ConanException:
+            return None
+
+    @property
+    def search_index(self):
+        try:
+            search_index = self._get_conf_server_string("search_index").lower()
+            return search_index == "true" or search_index == "1"
+        except ConanException:
+            return False
+
     @property
     def host_name(self):
         try:
@@ -220,9 +268,21 @@ class ConanServerConfigParser(ConfigParser):
         return timedelta(minutes=float(self._get_conf_server_string("jwt_expire_minutes")))
 
 
-def get_server_store(disk_storage_path, public_url, updown_auth_manager):
+def get_search_index(disk_storage_path):
+    return SearchIndex.create(os.path.join(disk_storage_path, SEARCH_INDEX_FILE))
+
+
+def get_server_store(disk_storage_path, public_url, updown_auth_manager, search_index=False):
     disk_controller_url = "%s/%s" % (public_url, "files")
     if not updown_auth_manager:
         raise Exception("Updown auth manager needed for disk controller (not s3)")
     adapter = ServerDiskAdapter(disk_controller_url, disk_storage_path, updown_auth_manager)
-    return ServerStore(adapter)
+    if not search_index:
+        return ServerStore(adapter)
+
+    # The first time, the existing storage is indexed
+    build_index = not os.path.exists(os.path.join(disk_storage_path, SEARCH_INDEX_FILE))
+    server_store = ServerStore(adapter, get_search_index(disk_storage_path))
+    if build_index:
+        server_store.search_index.rebuild(server_store)
+    return server_store
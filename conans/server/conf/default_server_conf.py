@@ -11,6 +11,20 @@ port: 9300
 public_port:
 host_name: localhost
 
+# Production serving mode, with a pool of "threads" or "processes" (not in Windows) serving
+# the clients concurrently. If empty, a single threaded server is used, only one client at once
+# workers_mode: threads
+# workers: 8
+# Threads of every process, only for the "processes" mode
+# threads: 4
+# Seconds an idle connection is kept open for the next request of the client
+# keep_alive_timeout: 30
+
+# Index of the recipes and binaries of the storage (a sqlite database in disk_storage_path), to
+# search without walking all the storage. Run "conan_server --rebuild-index" if the storage
+# is modified without the server (e.g. restored from a backup)
+# search_index: True
+
 # Authorize timeout are seconds the client has to upload/download files until authorization expires
 authorize_timeout: 1800
 
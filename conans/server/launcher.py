@@ -3,7 +3,7 @@ import os
 
 from conans import SERVER_CAPABILITIES, REVISIONS
 from conans.paths import conan_expand_user
-from conans.server.conf import get_server_store
+from conans.server.conf import get_search_index, get_server_store
 
 from conans.server.crypto.jwt.jwt_credentials_manager import JWTCredentialsManager
 from conans.server.crypto.jwt.jwt_updown_manager import JWTUpDownAuthManager
@@ -15,8 +15,9 @@ from conans.server.service.authorize import BasicAuthorizer, BasicAuthenticator
 
 
 class ServerLauncher(object):
-    def __init__(self, force_migration=False):
+    def __init__(self, force_migration=False, rebuild_index=False):
         self.force_migration = force_migration
+        self.rebuild_index = rebuild_index
         user_folder = conan_expand_user("~")
         server_folder = os.path.join(user_folder, '.conan_server')
 
@@ -35,24 +36,43 @@ class ServerLauncher(object):
         updown_auth_manager = JWTUpDownAuthManager(server_config.updown_secret,
                                                    server_config.authorize_timeout)
 
+        if rebuild_index:  # Created first, so get_server_store() doesn't build it too
+            search_index = get_search_index(server_config.disk_storage_path)
         server_store = get_server_store(server_config.disk_storage_path,
                                         server_config.public_url,
-                                        updown_auth_manager=updown_auth_manager)
+                                        updown_auth_manager=updown_auth_manager,
+                                        search_index=server_config.search_index)
+        if rebuild_index:
+            recipes, packages = search_index.rebuild(server_store)
+            print("Search index of %s rebuilt: %d recipe revisions, %d binaries"
+                  % (server_config.disk_storage_path, recipes, packages))
+            if not server_config.search_index:
+                print("The index is not used, enable it with 'search_index: True' in %s"
+                      % server_config.config_filename)
 
         server_capabilities = SERVER_CAPABILITIES
         server_capabilities.append(REVISIONS)
 
+        self._workers_mode = server_config.workers_mode
+        self._workers = server_config.workers
+        self._threads = server_config.threads
+        self._keep_alive_timeout = server_config.keep_alive_timeout
+
         self.server = ConanServer(server_config.port, credentials_manager, updown_auth_manager,
                                   authorizer, authenticator, server_store,
                                   server_capabilities)
-        if not self.force_migration:
+        if not self.force_migration and not self.rebuild_index:
             print("***********************")
             print("Using config: %s" % server_config.config_filename)
             print("Storage: %s" % server_config.disk_storage_path)
             print("Public URL: %s" % server_config.public_url)
             print("PORT: %s" % server_config.port)
+            if self._workers_mode:
+                print("Workers: %s %s" % (self._workers, self._workers_mode))
             print("***********************")
 
     def launch(self):
-        if not self.force_migration:
-            self.server.run(host="0.0.0.0")
+        if not self.force_migration and not self.rebuild_index:
+            self.server.run(host="0.0.0.0", workers_mode=self._workers_mode,
+                            workers=self._workers, threads=self._threads,
+                            keep_alive_timeout=self._keep_alive_timeout)
@@ -2,6 +2,7 @@ import bottle
 
 from conans.server.rest.api_v1 import ApiV1
 from conans.server.rest.api_v2 import ApiV2
+from conans.server.rest.workers_server import WorkersServer
 
 
 class ConanServer(object):
@@ -12,6 +13,7 @@ class ConanServer(object):
     """
     store = None
     root_app = None
+    workers_server = None
 
     def __init__(self, run_port, credentials_manager,
                  updown_auth_manager, authorizer, authenticator,
@@ -42,5 +44,16 @@ class ConanServer(object):
         port = kwargs.pop("port", self.run_port)
         debug_set = kwargs.pop("debug", False)
         host = kwargs.pop("host", "localhost")
-        bottle.Bottle.run(self.root_app, host=host,
+        quiet = kwargs.pop("quiet", False)
+        # Without workers, the single threaded development server of bottle is used
+        workers_mode = kwargs.pop("workers_mode", None)
+        if workers_mode:
+            server = WorkersServer(host=host, port=port, mode=workers_mode,
+                                   workers=kwargs.pop("workers", None),
+                                   threads=kwargs.pop("threads", None),
+                                   keep_alive_timeout=kwargs.pop("keep_alive_timeout", None))
+            self.workers_server = server
+        else:
+            server = "wsgiref"
+        bottle.Bottle.run(self.root_app, server=server, host=host, quiet=quiet,
                           port=port, debug=debug_set, reloader=False)
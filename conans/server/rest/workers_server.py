@@ -0,0 +1,328 @@
+import os
+import selectors
+import signal
+import socket
+import threading
+import time
+from wsgiref.simple_server import ServerHandler, WSGIRequestHandler, WSGIServer
+
+import bottle
+from six.moves import queue
+
+from conans.errors import ConanException
+
+WORKERS_MODES = ("threads", "processes")
+
+
+class _KeepAliveServerHandler(ServerHandler):
+    """ Answers HTTP/1.1, keeping the connection open for the next request if the response length
+    is known. Otherwise, as the responses are not chunked, the connection is closed to end it
+    """
+    http_version = "1.1"
+
+    def cleanup_headers(self):
+        ServerHandler.cleanup_headers(self)
+        request_handler = self.request_handler
+        if "Content-Length" not in self.headers or request_handler.server.stopping:
+            request_handler.close_connection = True
+        if request_handler.close_connection:
+            self.headers["Connection"] = "close"
+
+    def sendfile(self):
+        """ The files returned by the application (wrapped with "wsgi.file_wrapper") are sent
+        with the zero-copy socket.sendfile(), the Content-Length bytes from the current position
+        """
+        filelike = self.result.filelike
+        length = self.headers.get("Content-Length")
+        try:
+            offset = filelike.tell()
+            filelike.fileno()
+        except (AttributeError, OSError, ValueError):
+            return False
+        if length is None:
+            return False
+        if not self.headers_sent:
+            self.send_headers()
+        self._flush()
+        self.bytes_sent += self.request_handler.connection.sendfile(filelike, offset,
+                                                                    int(length))
+        return True
+
+
+class _KeepAliveRequestHandler(WSGIRequestHandler):
+    """ Unlike the socketserver handlers, the instance doesn't handle the connection when
+    created, the server decides when to handle every request of the connection
+    """
+    protocol_version = "HTTP/1.1"
+
+    def __init__(self, request, client_address, server):
+        self.request = request
+        self.client_address = client_address
+        self.server = server
+        self.close_connection = False
+        self.timeout = server.timeout
+        self.setup()
+
+    def address_string(self):  # Prevent reverse DNS lookups
+        return self.client_address[0]
+
+    def log_request(self, *args, **kwargs):
+        if not self.server.quiet:
+            WSGIRequestHandler.log_request(self, *args, **kwargs)
+
+    def handle_one_request(self):
+        try:
+            self.raw_requestline = self.rfile.readline(65537)
+        except socket.timeout:
+            self.raw_requestline = None
+        if not self.raw_requestline:  # Closed by the client
+            self.close_connection = True
+            return
+        if len(self.raw_requestline) > 65536:
+            self.requestline = ''
+            self.request_version = ''
+            self.command = ''
+            self.send_error(414)
+            self.close_connection = True
+            return
+        if not self.parse_request():  # An error code has been sent, just exit
+            self.close_connection = True
+            return
+        # The application might not read the whole body of a request, (e.g. an unauthorized
+        # upload), then the next request couldn't be read from the connection
+        if self.headers.get("Content-Length", "0") != "0" or \
+                self.headers.get("Transfer-Encoding"):
+            self.close_connection = True
+
+        handler = _KeepAliveServerHandler(self.rfile, self.wfile, self.get_stderr(),
+                                          self.get_environ(),
+                                          multithread=self.server.multithread,
+                                          multiprocess=self.server.multiprocess)
+        handler.request_handler = self
+        handler.run(self.server.get_app())
+
+
+class WorkersWSGIServer(WSGIServer):
+    """ WSGI server whose requests are served by a fixed pool of threads. The HTTP/1.1
+    connections are kept alive, and between requests they don't use a thread: they are watched
+    by a selector and queued again to the pool when the next request arrives, or closed after
+    being idle "keep_alive_timeout" seconds. stop() shuts it down gracefully: the accepted
+    requests are finished and the idle connections closed.
+    In the "processes" mode, every forked process serves the shared listening socket with its
+    own pool of threads, started by serve_forever()
+    """
+    request_queue_size = 128  # Listen backlog, the default 5 is too small for many clients
+
+    def __init__(self, server_address, keep_alive_timeout, quiet, threads, multiprocess=False):
+        self.keep_alive_timeout = keep_alive_timeout
+        self.timeout = max(keep_alive_timeout, 60)  # Of the sockets, for stalled transfers
+        self.quiet = quiet
+        self.multithread = threads > 1
+        self.multiprocess = multiprocess
+        self.stopping = False
+        self.parent_pid = None
+        self._workers = threads
+        self._threads = []
+        self._lock = threading.Lock()
+        self._requests = queue.Queue()
+        self._idle = []  # The connections to be watched by the selector
+        self._wakeup_read = self._wakeup_write = None
+        WSGIServer.__init__(self, server_address, _KeepAliveRequestHandler)
+
+    def serve_forever(self, poll_interval=0.5):
+        self._wakeup_read, self._wakeup_write = socket.socketpair()
+        self._threads = [threading.Thread(target=self._watch_idle_connections)]
+        self._threads.extend(threading.Thread(target=self._serve_requests)
+                             for _ in range(self._workers))
+        for thread in self._threads:
+            thread.daemon = True
+            thread.start()
+        WSGIServer.serve_forever(self, poll_interval)
+
+    def service_actions(self):
+        # The worker processes are not left alive if the main process dies
+        if self.parent_pid is not None and os.getppid() != self.parent_pid:
+            self.stop()
+
+    def process_request(self, request, client_address):
+        handler = self.RequestHandlerClass(request, client_address, self)
+        self._requests.put(handler)
+
+    def _serve_requests(self):
+        while True:
+            handler = self._requests.get()
+            if handler is None:
+                return
+            try:
+                handler.handle_one_request()
+            except Exception:
+                self.handle_error(handler.request, handler.client_address)
+                handler.close_connection = True
+            if handler.close_connection or self.stopping:
+                self._close(handler)
+            else:
+                with self._lock:
+                    self._idle.append(handler)
+                self._wakeup()
+
+    def _close(self, handler):
+        try:
+            handler.finish()
+        except Exception:
+            pass
+        self.shutdown_request(handler.request)
+
+    def _wakeup(self):
+        try:
+            self._wakeup_write.send(b"\0")
+        except (OSError, AttributeError):  # Already closed
+            pass
+
+    def _watch_idle_connections(self):
+        selector = selectors.DefaultSelector()
+        selector.register(self._wakeup_read, selectors.EVENT_READ)
+        idle_since = {}
+        while True:
+            for key, _ in selector.select(timeout=1):
+                if key.fileobj is self._wakeup_read:
+                    self._wakeup_read.recv(4096)
+                else:
+                    selector.unregister(key.fileobj)
+                    del idle_since[key.data]
+                    self._requests.put(key.data)  # The next request has arrived
+            with self._lock:
+                idle, self._idle = self._idle, []
+                stopping = self.stopping
+            now = time.time()
+            for handler in idle:
+                selector.register(handler.request, selectors.EVENT_READ, handler)
+                idle_since[handler] = now
+            for handler, since in list(idle_since.items()):
+                if stopping or now - since > self.keep_alive_timeout:
+                    selector.unregister(handler.request)
+                    del idle_since[handler]
+                    self._close(handler)
+            if stopping:
+                selector.close()
+                return
+
+    def stop(self):
+        with self._lock:
+            self.stopping = True
+        self._wakeup()
+        # shutdown() waits for serve_forever() to finish, it could be this thread
+        thread = threading.Thread(target=self.shutdown)
+        thread.daemon = True
+        thread.start()
+
+    def server_close(self):
+        WSGIServer.server_close(self)
+        if not self._threads:  # Not serving, the main process of the "processes" mode
+            return
+        with self._lock:
+            self.stopping = True
+        self._wakeup()
+        # The already accepted connections are served before finishing
+        for _ in self._threads:
+            self._requests.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._wakeup_read.close()
+        self._wakeup_write.close()
+
+
+def _install_stop_handlers(stop):
+    if threading.current_thread() is not threading.main_thread():  # Signals only in main thread
+        return
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop())
+    signal.signal(signal.SIGINT, lambda signum, frame: stop())
+
+
+def _serve(server):
+    _install_stop_handlers(server.stop)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+def _serve_processes(server, workers, adapter):
+    """ pre-fork model: all the worker processes accept the connections of the same listening
+    socket. The workers that die are replaced, and all of them are stopped gracefully with
+    SIGTERM or SIGINT of the main process, or adapter.stop()
+    """
+    children = set()
+    stopping = []
+    server.parent_pid = os.getpid()
+
+    def spawn_worker():
+        pid = os.fork()
+        if pid == 0:
+            try:
+                # Ctrl+C is received by all the process group, let the main process decide
+                signal.signal(signal.SIGINT, signal.SIG_IGN)
+                signal.signal(signal.SIGTERM, lambda signum, frame: server.stop())
+                server.serve_forever()
+                server.server_close()
+            finally:
+                os._exit(0)
+        children.add(pid)
+
+    def stop():
+        if not stopping:
+            stopping.append(True)
+            for child in children:
+                os.kill(child, signal.SIGTERM)
+
+    for _ in range(workers):
+        spawn_worker()
+    adapter._stop = stop
+    _install_stop_handlers(stop)
+    try:
+        while children:
+            pid, _ = os.wait()
+            children.discard(pid)
+            if not stopping:
+                spawn_worker()
+    finally:
+        stop()
+        server.server_close()
+
+
+class WorkersServer(bottle.ServerAdapter):
+    """ Production server for bottle, with a pool of "workers" threads or processes ("mode")
+    serving the requests concurrently, HTTP keep-alive and graceful shutdown. Every process of the
+    "processes" mode serves the requests with "threads" threads
+    """
+    _stop = None
+
+    def stop(self):
+        """ Stops the running server gracefully, as SIGTERM does. For the servers that don't run
+        in the main thread, where the signal handlers can't be installed
+        """
+        if self._stop is not None:
+            self._stop()
+
+    def run(self, app):
+        mode = self.options.get("mode") or "threads"
+        workers = self.options.get("workers") or 8
+        threads = self.options.get("threads") or 4
+        keep_alive_timeout = self.options.get("keep_alive_timeout") or 30
+        if mode not in WORKERS_MODES:
+            raise ConanException("Invalid workers mode '%s', allowed values: %s"
+                                 % (mode, ", ".join(WORKERS_MODES)))
+        if mode == "processes" and not hasattr(os, "fork"):
+            raise ConanException("The 'processes' workers mode is not available in this "
+                                 "platform, use 'threads'")
+
+        address = (self.host, self.port)
+        if mode == "threads":
+            server = WorkersWSGIServer(address, keep_alive_timeout, self.quiet, workers)
+            server.set_app(app)
+            self._stop = server.stop
+            _serve(server)
+        else:
+            server = WorkersWSGIServer(address, keep_alive_timeout, self.quiet, threads,
+                                       multiprocess=True)
+            server.set_app(app)
+            _serve_processes(server, workers, self)
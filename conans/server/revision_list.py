@@ -1,6 +1,6 @@
 import json
 import time
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
 from conans.util.dates import from_timestamp_to_iso8601
 
@@ -8,15 +8,29 @@ _RevisionEntry = namedtuple("RevisionEntry", "revision time")
 
 
 class RevisionList(object):
+    """ The revisions of a reference, ordered from the oldest to the latest one. Indexed by
+    revision, adding, removing or getting the latest one doesn't traverse the whole list
+    """
 
     def __init__(self):
-        self._data = []
+        self._data = OrderedDict()  # {revision: time}
 
     @staticmethod
-    def loads(contents):
+    def loads(contents, log=None):
+        """ "contents" is the JSON of dumps(), "log" the lines of dumps_entry() appended to it
+        afterwards, if any
+        """
         ret = RevisionList()
-        ret._data = [_RevisionEntry(e["revision"], RevisionList._fix_timestamp(e["time"]))
-                     for e in json.loads(contents)["revisions"]]
+        for e in json.loads(contents)["revisions"]:
+            ret._data[e["revision"]] = RevisionList._fix_timestamp(e["time"])
+        for line in (log or "").splitlines():
+            try:
+                e = json.loads(line)
+                revision, the_time = e["revision"], e["time"]
+            except (ValueError, KeyError, TypeError):
+                continue  # A line of an interrupted write
+            ret._data.pop(revision, None)
+            ret._data[revision] = RevisionList._fix_timestamp(the_time)
         return ret
 
     @staticmethod
@@ -31,19 +45,26 @@ class RevisionList(object):
             return from_timestamp_to_iso8601(the_time)
 
     def dumps(self):
-        return json.dumps({"revisions": [{"revision": e.revision,
-                                          "time": e.time} for e in self._data]})
+        return json.dumps({"revisions": [{"revision": revision,
+                                          "time": the_time}
+                                         for revision, the_time in self._data.items()]})
+
+    @staticmethod
+    def dumps_entry(entry):
+        """ The line of the log of the loads() for a new latest revision """
+        return json.dumps({"revision": entry.revision, "time": entry.time}) + "\n"
 
     def add_revision(self, revision_id):
+        """ Returns the new entry, None if it was already the latest revision
+        """
         lt = self.latest_revision()
         if lt and lt.revision == revision_id:
             # Each uploaded file calls to update the revision
-            return
-        index = self._find_revision_index(revision_id)
-        if index:
-            self._data.pop(index)
-
-        self._data.append(_RevisionEntry(revision_id, self._now()))
+            return None
+        self._data.pop(revision_id, None)
+        the_time = self._fix_timestamp(self._now())
+        self._data[revision_id] = the_time
+        return _RevisionEntry(revision_id, the_time)
 
     @staticmethod
     def _now():
@@ -52,28 +73,23 @@ class RevisionList(object):
     def latest_revision(self):
         if not self._data:
             return None
-        return self._data[-1]
+        revision = next(reversed(self._data))
+        return _RevisionEntry(revision, self._data[revision])
 
     def get_time(self, revision):
-        tmp = self._find_revision_index(revision)
-        if tmp is None:
-            return None
-        return self._data[tmp].time
+        return self._data.get(revision)
 
     def as_list(self):
-        return list(reversed(self._data))
+        return [_RevisionEntry(revision, the_time)
+                for revision, the_time in reversed(self._data.items())]
 
     def remove_revision(self, revision_id):
-        index = self._find_revision_index(revision_id)
-        if index is None:
-            return
-        self._data.pop(index)
-
-    def _find_revision_index(self, revision_id):
-        for i, rev in enumerate(self._data):
-            if rev.revision == revision_id:
-                return i
-        return None
+        self._data.pop(revision_id, None)
+
+    def copy(self):
+        ret = RevisionList()
+        ret._data = self._data.copy()
+        return ret
 
     def __eq__(self, other):
         return self.dumps() == other.dumps()
@@ -9,13 +9,18 @@ Replace this module with other that keeps the interface or super class.
 
 '''
 
+import heapq
 from abc import ABCMeta, abstractmethod
+from collections import defaultdict
+from functools import lru_cache
 
 import six
 
 from conans.errors import AuthenticationException, ForbiddenException, InternalErrorException
 from conans.model.ref import ConanFileReference
 
+PERMISSIONS_CACHE_SIZE = 10000
+
 
 #  ############################################
 #  ############ ABSTRACT CLASSES ##############
@@ -110,6 +115,23 @@ class BasicAuthorizer(Authorizer):
         self.read_permissions = read_permissions
         self.write_permissions = write_permissions
 
+    @property
+    def read_permissions(self):
+        return self._read_rules.rules
+
+    @read_permissions.setter
+    def read_permissions(self, read_permissions):
+        # Compiled again (and the cached checks discarded) when the configuration changes
+        self._read_rules = _PermissionRules(read_permissions)
+
+    @property
+    def write_permissions(self):
+        return self._write_rules.rules
+
+    @write_permissions.setter
+    def write_permissions(self, write_permissions):
+        self._write_rules = _PermissionRules(write_permissions)
+
     def check_read_conan(self, username, ref):
         """
         username: User that request to read the conans
@@ -118,7 +140,7 @@ class BasicAuthorizer(Authorizer):
         if ref.user == username:
             return
 
-        self._check_any_rule_ok(username, self.read_permissions, ref)
+        self._read_rules.check(username, ref)
 
     def check_write_conan(self, username, ref):
         """
@@ -128,7 +150,7 @@ class BasicAuthorizer(Authorizer):
         if ref.user == username:
             return True
 
-        self._check_any_rule_ok(username, self.write_permissions, ref)
+        self._write_rules.check(username, ref)
 
     def check_delete_conan(self, username, ref):
         """
@@ -158,51 +180,71 @@ class BasicAuthorizer(Authorizer):
         """
         self.check_write_package(username, pref)
 
-    def _check_any_rule_ok(self, username, rules, *args, **kwargs):
-        for rule in rules:
-            # raises if don't
-            ret = self._check_rule_ok(username, rule, *args, **kwargs)
-            if ret:  # A rule is applied ok, if not apply keep looking
-                return True
-        if username:
-            raise ForbiddenException("Permission denied")
-        else:
-            raise AuthenticationException()
-
-    def _check_rule_ok(self, username, rule, ref):
-        """Checks if a rule specified in config file applies to current conans
-        reference and current user"""
-        try:
-            rule_ref = ConanFileReference.loads(rule[0])
-        except Exception:
-            # TODO: Log error
-            raise InternalErrorException("Invalid server configuration. "
-                                         "Contact the administrator.")
-        authorized_users = [_.strip() for _ in rule[1].split(",")]
-        if len(authorized_users) < 1:
-            raise InternalErrorException("Invalid server configuration. "
-                                         "Contact the administrator.")
-
-        # Check if rule apply ref
-        if self._check_ref_apply_for_rule(rule_ref, ref):
-            if authorized_users[0] == "*" or username in authorized_users:
-                return True  # Ok, applies and match username
+
+_INVALID_CONFIGURATION = "Invalid server configuration. Contact the administrator."
+
+
+class _PermissionRules(object):
+    """ The rules of the [read_permissions] or [write_permissions], parsed once and indexed by
+    the name of their reference, so only the rules of the name of a reference and the "*" ones
+    are evaluated. The result of the last checked users and references is cached
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        self._rules_by_name = defaultdict(list)  # {name: [(position, rule_ref, users)]}
+        self._any_name_rules = []  # The "*" ones and the invalid ones, that fail when reached
+        for position, rule in enumerate(rules):
+            try:
+                rule_ref = ConanFileReference.loads(rule[0])
+                authorized_users = [_.strip() for _ in rule[1].split(",")]
+            except Exception:
+                # TODO: Log error
+                self._any_name_rules.append((position, None, None))
+                continue
+            if rule_ref.name == "*":
+                self._any_name_rules.append((position, rule_ref, authorized_users))
             else:
-                if username:
-                    if authorized_users[0] == "?":
-                        return True  # Ok, applies and match any authenticated username
-                    else:
-                        raise ForbiddenException("Permission denied")
-                else:
-                    raise AuthenticationException()
-
-        return False
-
-    def _check_ref_apply_for_rule(self, rule_ref, ref):
-        """Checks if a conans reference specified in config file applies to current conans
-        reference"""
-        name, version, user, channel, _ = rule_ref
-        return not((name != "*" and name != ref.name) or
-                   (version != "*" and version != ref.version) or
-                   (user != "*" and user != ref.user) or
-                   (channel != "*" and channel != ref.channel))
+                self._rules_by_name[rule_ref.name].append((position, rule_ref, authorized_users))
+        self._evaluate = lru_cache(maxsize=PERMISSIONS_CACHE_SIZE)(self._evaluate)
+
+    def check(self, username, ref):
+        """ Raises if the user cannot access the reference """
+        error = self._evaluate(username, ref.name, ref.version, ref.user, ref.channel)
+        if error:
+            exception_type, args = error
+            raise exception_type(*args)
+
+    def _evaluate(self, username, name, version, user, channel):
+        """ None if the first rule that applies to the reference allows the user, otherwise the
+        (exception type, args) to raise. The exceptions are not cached, to raise a new one every
+        time
+        """
+        # The rules are evaluated in the order of the configuration
+        rules = heapq.merge(self._rules_by_name.get(name, []), self._any_name_rules,
+                            key=lambda r: r[0])
+        for _, rule_ref, authorized_users in rules:
+            if rule_ref is None:
+                return InternalErrorException, (_INVALID_CONFIGURATION, )
+            if not _rule_applies(rule_ref, name, version, user, channel):
+                continue
+            if authorized_users[0] == "*" or username in authorized_users:
+                return None  # Ok, applies and match username
+            if username:
+                if authorized_users[0] == "?":
+                    return None  # Ok, applies and match any authenticated username
+                return ForbiddenException, ("Permission denied", )
+            return AuthenticationException, ()
+
+        if username:
+            return ForbiddenException, ("Permission denied", )
+        return AuthenticationException, ()
+
+
+def _rule_applies(rule_ref, name, version, user, channel):
+    """Checks if a conans reference specified in config file applies to current conans
+    reference"""
+    return not((rule_ref.name != "*" and rule_ref.name != name) or
+               (rule_ref.version != "*" and rule_ref.version != version) or
+               (rule_ref.user != "*" and rule_ref.user != user) or
+               (rule_ref.channel != "*" and rule_ref.channel != channel))
@@ -8,11 +8,35 @@ from conans.model.info import ConanInfo
 from conans.model.ref import PackageReference, ConanFileReference
 from conans.paths import CONANINFO
 from conans.search.search import filter_packages, _partial_match
+from conans.server.store.search_index import load_package_info
 from conans.util.files import list_folder_subdirs
 from conans.util.log import logger
 
 
+def _get_index_infos_min(server_store, ref, look_in_all_rrevs):
+    search_index = server_store.search_index
+    result = {}
+    rrevs = server_store.get_recipe_revisions(ref) if look_in_all_rrevs else [None]
+
+    for rrev in rrevs:
+        new_ref = ref.copy_with_rev(rrev.revision) if rrev else ref
+        for package_id, (prev, info_stamp, info) in search_index.packages(new_ref).items():
+            if package_id in result:
+                continue
+            pref = PackageReference(new_ref, package_id, prev)
+            try:
+                result[package_id] = load_package_info(server_store, search_index, pref,
+                                                       info_stamp, info)
+            except Exception as exc:  # FIXME: Too wide
+                logger.error("Package %s has no ConanInfo file" % str(pref))
+                if str(exc):
+                    logger.error(str(exc))
+    return result
+
+
 def _get_local_infos_min(server_store, ref, look_in_all_rrevs):
+    if server_store.search_index:
+        return _get_index_infos_min(server_store, ref, look_in_all_rrevs)
 
     result = {}
     rrevs = server_store.get_recipe_revisions(ref) if look_in_all_rrevs else [None]
@@ -78,19 +102,24 @@ class SearchService(object):
         info = search_packages(self._server_store, reference, query, look_in_all_rrevs)
         return info
 
-    def _search_recipes(self, pattern=None, ignorecase=True):
+    def _recipe_revisions(self):
+        search_index = self._server_store.search_index
+        if search_index:
+            return search_index.recipe_revisions()
         subdirs = list_folder_subdirs(basedir=self._server_store.store, level=5)
+        return [ConanFileReference(*folder.split("/")) for folder in subdirs]
+
+    def _search_recipes(self, pattern=None, ignorecase=True):
+        refs = self._recipe_revisions()
         if not pattern:
-            return sorted([ConanFileReference(*folder.split("/")).copy_clear_rev()
-                           for folder in subdirs])
+            return sorted([ref.copy_clear_rev() for ref in refs])
         else:
             # Conan references in main storage
             pattern = str(pattern)
             b_pattern = translate(pattern)
             b_pattern = re.compile(b_pattern, re.IGNORECASE) if ignorecase else re.compile(b_pattern)
             ret = set()
-            for subdir in subdirs:
-                new_ref = ConanFileReference(*subdir.split("/"))
+            for new_ref in refs:
                 if _partial_match(b_pattern, repr(new_ref)):
                     ret.add(new_ref.copy_clear_rev())
 
@@ -0,0 +1,116 @@
+import mimetypes
+import os
+import time
+
+from bottle import HTTPError, HTTPResponse, parse_date, parse_range_header, request
+
+
+class FileRange(object):
+    """ File object limited to "length" bytes from "offset". The descriptor of the file is at
+    "offset" too, so servers sending files with sendfile(), from the current position of the
+    file and with the response Content-Length, serve just the range
+    """
+
+    def __init__(self, fileobj, offset, length):
+        self._fileobj = fileobj
+        self._fileobj.seek(offset)
+        self._remaining = length
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._fileobj.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self._fileobj.fileno()
+
+    def tell(self):
+        return self._fileobj.tell()
+
+    def seek(self, offset):
+        self._remaining -= offset - self._fileobj.tell()
+        self._fileobj.seek(offset)
+
+    def close(self):
+        self._fileobj.close()
+
+
+def file_etag(stats):
+    """ strong ETag of a file, changes with every new upload of the file
+    """
+    return '"%x-%x"' % (int(stats.st_mtime * 1000000), stats.st_size)
+
+
+def _http_date(seconds):
+    return time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(seconds))
+
+
+def _etag_matches(etags_header, etag):
+    return any(tag.strip() in (etag, "*") for tag in etags_header.split(","))
+
+
+def static_file(path, mimetype):
+    """ Like bottle.static_file(), but the responses have a strong ETag, the conditional
+    requests If-None-Match and If-Range are supported, and the body is the file (or a FileRange
+    of it) for ranges too, so servers supporting "wsgi.file_wrapper" can send it with sendfile()
+    """
+    if not os.path.isfile(path):
+        return HTTPError(404, "File does not exist.")
+    if not os.access(path, os.R_OK):
+        return HTTPError(403, "You do not have permission to access this file.")
+
+    stats = os.stat(path)
+    etag = file_etag(stats)
+    headers = {"Content-Length": str(stats.st_size),
+               "Last-Modified": _http_date(stats.st_mtime),
+               "ETag": etag,
+               "Accept-Ranges": "bytes"}
+    if mimetype == "auto":
+        mimetype, encoding = mimetypes.guess_type(path)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+    if mimetype:
+        if mimetype.startswith("text/") and "charset" not in mimetype:
+            mimetype += "; charset=UTF-8"
+        headers["Content-Type"] = mimetype
+
+    if_none_match = request.environ.get("HTTP_IF_NONE_MATCH")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, etag)
+    else:
+        ims = request.environ.get("HTTP_IF_MODIFIED_SINCE")
+        ims = parse_date(ims.split(";")[0].strip()) if ims else None
+        not_modified = ims is not None and ims >= int(stats.st_mtime)
+    if not_modified:
+        headers.pop("Content-Length")
+        headers["Date"] = _http_date(time.time())
+        return HTTPResponse(status=304, **headers)
+
+    range_header = request.environ.get("HTTP_RANGE")
+    if_range = request.environ.get("HTTP_IF_RANGE")
+    if range_header and if_range:
+        # The range of a file that has changed since the client got the first part is useless,
+        # the whole file is sent instead
+        if if_range.startswith('"') or if_range.startswith("W/"):
+            range_valid = if_range == etag
+        else:
+            date = parse_date(if_range)
+            range_valid = date is not None and date >= int(stats.st_mtime)
+        if not range_valid:
+            range_header = None
+
+    if range_header:
+        ranges = list(parse_range_header(range_header, stats.st_size))
+        if not ranges:
+            return HTTPResponse(status=416, **{"Content-Range": "bytes */%d" % stats.st_size})
+        offset, end = ranges[0]
+        headers["Content-Range"] = "bytes %d-%d/%d" % (offset, end - 1, stats.st_size)
+        headers["Content-Length"] = str(end - offset)
+        body = "" if request.method == "HEAD" else FileRange(open(path, "rb"), offset,
+                                                             end - offset)
+        return HTTPResponse(body, status=206, **headers)
+
+    body = "" if request.method == "HEAD" else open(path, "rb")
+    return HTTPResponse(body, **headers)
@@ -0,0 +1,88 @@
+import os
+import uuid
+
+from bottle import request
+
+from conans.errors import RequestErrorException
+from conans.server.store.checksums import CHECKSUM_ALGORITHMS, ChecksumsComputer, \
+    checksums_folder, save_checksums
+from conans.util.files import mkdir
+
+CHUNK_SIZE = 65536
+
+
+class _BodyReader(object):
+    """ Reads exactly "length" bytes of the request from the connection, an incomplete body is
+    an error, not the end of the file
+    """
+
+    def __init__(self, stream, length):
+        self._stream = stream
+        self._remaining = length
+
+    def read(self, size):
+        if not self._remaining:
+            return b""
+        data = self._stream.read(min(size, self._remaining))
+        if not data:
+            raise RequestErrorException("Incomplete upload, %d bytes missing" % self._remaining)
+        self._remaining -= len(data)
+        return data
+
+
+def request_body():
+    """ The body of the current request, read directly from the connection if its length is
+    known, instead of the copy of request.body (in memory or in a temporary file) of bottle
+    """
+    length = request.content_length
+    if length < 0 or "chunked" in request.headers.get("Transfer-Encoding", "").lower():
+        return request.body
+    return _BodyReader(request.environ["wsgi.input"], length)
+
+
+def expected_checksums(headers):
+    """ {algorithm: checksum} of the X-Checksum-Md5, X-Checksum-Sha1 and X-Checksum-Sha256
+    headers of the upload
+    """
+    ret = {}
+    for name in CHECKSUM_ALGORITHMS:
+        value = headers.get("X-Checksum-%s" % name.capitalize())
+        if value:
+            ret[name] = value.strip().lower()
+    return ret
+
+
+def save_upload(body, store_folder, path, checksums=None):
+    """ Saves the body in chunks to a temporary file, computing its checksums at the same time.
+    If they match the expected "checksums", the file is moved to "path", so the incomplete or
+    wrong uploads are never visible there
+    """
+    folder = checksums_folder(store_folder, os.path.dirname(path))  # Not in the file lists
+    mkdir(folder)
+    # Not mkstemp(), the file keeps the permissions of the umask as the other stored files
+    tmp_path = os.path.join(folder, "%s.%s.upload" % (os.path.basename(path), uuid.uuid4().hex))
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0),
+                 0o666)
+    try:
+        computer = ChecksumsComputer()
+        with os.fdopen(fd, "wb") as handle:
+            while True:
+                data = body.read(CHUNK_SIZE)
+                if not data:
+                    break
+                computer.update(data)
+                handle.write(data)
+        computed = computer.checksums()
+        for name, value in (checksums or {}).items():
+            if value != computed[name]:
+                raise RequestErrorException("The %s checksum of the uploaded file '%s' doesn't "
+                                            "match: expected %s, got %s"
+                                            % (name, os.path.basename(path), value,
+                                               computed[name]))
+        mkdir(os.path.dirname(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    save_checksums(store_folder, path, computed)
@@ -3,6 +3,7 @@ import os
 import jwt
 
 from conans.errors import NotFoundException, RequestErrorException
+from conans.server.store.checksums import save_checksums
 from conans.util.log import logger
 from conans.util.files import mkdir
 
@@ -45,6 +46,7 @@ class FileUploadDownloadService(object):
             if os.path.exists(abs_filepath):
                 os.remove(abs_filepath)
             file_saver.save(os.path.dirname(abs_filepath))
+            save_checksums(self.base_store_folder, abs_filepath)
 
         except (jwt.ExpiredSignature, jwt.DecodeError, AttributeError):
             raise NotFoundException("File not found")
@@ -1,12 +1,11 @@
 import os
 
-from bottle import FileUpload, static_file
-
 from conans.errors import RecipeNotFoundException, PackageNotFoundException, NotFoundException
 from conans.server.service.common.common import CommonService
 from conans.server.service.mime import get_mime_type
+from conans.server.service.static_file import static_file
+from conans.server.service.upload_file import expected_checksums, save_upload
 from conans.server.store.server_store import ServerStore
-from conans.util.files import mkdir
 
 
 class ConanServiceV2(CommonService):
@@ -20,20 +19,19 @@ class ConanServiceV2(CommonService):
     def get_recipe_file_list(self, ref,  auth_user):
         self._authorizer.check_read_conan(auth_user, ref)
         try:
-            file_list = self._server_store.get_recipe_file_list(ref)
+            file_checksums = self._server_store.get_recipe_file_checksums(ref)
         except NotFoundException:
             raise RecipeNotFoundException(ref)
-        if not file_list:
+        if not file_checksums:
             raise RecipeNotFoundException(ref, print_rev=True)
 
-        # Send speculative metadata (empty) for files (non breaking future changes)
-        return {"files": {key: {} for key in file_list}}
+        # The metadata of the files are their checksums
+        return {"files": file_checksums}
 
     def get_conanfile_file(self, reference, filename, auth_user):
         self._authorizer.check_read_conan(auth_user, reference)
         path = self._server_store.get_conanfile_file_path(reference, filename)
-        return static_file(os.path.basename(path), root=os.path.dirname(path),
-                           mimetype=get_mime_type(path))
+        return static_file(path, mimetype=get_mime_type(path))
 
     def upload_recipe_file(self, body, headers, reference, filename, auth_user):
         self._authorizer.check_write_conan(auth_user, reference)
@@ -77,17 +75,16 @@ class ConanServiceV2(CommonService):
     # PACKAGE METHODS
     def get_package_file_list(self, pref, auth_user):
         self._authorizer.check_read_conan(auth_user, pref.ref)
-        file_list = self._server_store.get_package_file_list(pref)
-        if not file_list:
+        file_checksums = self._server_store.get_package_file_checksums(pref)
+        if not file_checksums:
             raise PackageNotFoundException(pref, print_rev=True)
-        # Send speculative metadata (empty) for files (non breaking future changes)
-        return {"files": {key: {} for key in file_list}}
+        # The metadata of the files are their checksums
+        return {"files": file_checksums}
 
     def get_package_file(self, pref, filename, auth_user):
         self._authorizer.check_read_conan(auth_user, pref.ref)
         path = self._server_store.get_package_file_path(pref, filename)
-        return static_file(os.path.basename(path), root=os.path.dirname(path),
-                           mimetype=get_mime_type(path))
+        return static_file(path, mimetype=get_mime_type(path))
 
     def upload_package_file(self, body, headers, pref, filename, auth_user):
         self._authorizer.check_write_conan(auth_user, pref.ref)
@@ -104,13 +101,5 @@ class ConanServiceV2(CommonService):
         self._server_store.update_last_package_revision(pref)
 
     # Misc
-    @staticmethod
-    def _upload_to_path(body, headers, path):
-        file_saver = FileUpload(body, None,
-                                filename=os.path.basename(path),
-                                headers=headers)
-        if os.path.exists(path):
-            os.unlink(path)
-        if not os.path.exists(os.path.dirname(path)):
-            mkdir(os.path.dirname(path))
-        file_saver.save(os.path.dirname(path))
+    def _upload_to_path(self, body, headers, path):
+        save_upload(body, self._server_store.store, path, expected_checksums(headers))
@@ -0,0 +1,106 @@
+""" Checksums of the files of the server storage, computed once (when the files are uploaded) and
+saved in a CHECKSUMS_FOLDER of their recipe revision folder, not to read the files again for
+every snapshot request
+"""
+import hashlib
+import json
+import os
+
+from conans.util.files import mkdir, save
+from conans.util.log import logger
+
+CHECKSUMS_FOLDER = ".checksums"
+CHECKSUM_ALGORITHMS = ("md5", "sha1", "sha256")
+
+
+def _new_hash(algorithm_name):
+    try:
+        return hashlib.new(algorithm_name)
+    except ValueError:  # FIPS error https://github.com/conan-io/conan/issues/7800
+        return hashlib.new(algorithm_name, usedforsecurity=False)
+
+
+class ChecksumsComputer(object):
+    """ Computes all the CHECKSUM_ALGORITHMS of some data in just one pass, with update()
+    """
+
+    def __init__(self):
+        self._hashes = [(name, _new_hash(name)) for name in CHECKSUM_ALGORITHMS]
+
+    def update(self, data):
+        for _, hash_ in self._hashes:
+            hash_.update(data)
+
+    def checksums(self):
+        return {name: hash_.hexdigest() for name, hash_ in self._hashes}
+
+
+def file_checksums(path):
+    computer = ChecksumsComputer()
+    with open(path, "rb") as handle:
+        while True:
+            data = handle.read(65536)
+            if not data:
+                break
+            computer.update(data)
+    return computer.checksums()
+
+
+def checksums_folder(store_folder, folder):
+    """ The folder of the checksums of the files of "folder". It is in the CHECKSUMS_FOLDER of the
+    recipe revision folder (name/version/user/channel/revision), out of the export and package
+    folders, whose files are listed and downloaded
+    """
+    relative = os.path.relpath(folder, store_folder).split(os.sep)
+    return os.path.join(store_folder, *(relative[:5] + [CHECKSUMS_FOLDER] + relative[5:]))
+
+
+def _checksums_path(store_folder, path):
+    folder, filename = os.path.split(path)
+    return os.path.join(checksums_folder(store_folder, folder), filename + ".json")
+
+
+def _stamp(path):
+    stats = os.stat(path)
+    return {"size": stats.st_size, "mtime": stats.st_mtime_ns}
+
+
+def save_checksums(store_folder, path, checksums=None):
+    """ Saves the checksums of the file, computed if not given. Returns them
+    """
+    checksums = checksums or file_checksums(path)
+    contents = dict(checksums)
+    contents.update(_stamp(path))
+    checksums_path = _checksums_path(store_folder, path)
+    mkdir(os.path.dirname(checksums_path))
+    # Atomic, for the concurrent readers
+    tmp_path = "%s.%d.tmp" % (checksums_path, os.getpid())
+    save(tmp_path, json.dumps(contents))
+    os.replace(tmp_path, checksums_path)
+    return checksums
+
+
+def load_checksums(store_folder, path):
+    """ The saved checksums of the file, if the file didn't change since they were saved.
+    Otherwise, (e.g. files of previous server versions) they are computed and saved now
+    """
+    try:
+        with open(_checksums_path(store_folder, path)) as handle:
+            contents = json.load(handle)
+        if {key: contents.get(key) for key in ("size", "mtime")} == _stamp(path):
+            return {name: contents[name] for name in CHECKSUM_ALGORITHMS}
+    except (IOError, OSError, ValueError, KeyError):
+        pass
+    try:
+        return save_checksums(store_folder, path)
+    except (IOError, OSError) as exc:  # e.g. read only storage
+        logger.warning("Couldn't save the checksums of %s: %s" % (path, exc))
+        return file_checksums(path)
+
+
+def remove_checksums(store_folder, path):
+    try:
+        os.remove(_checksums_path(store_folder, path))
+    except OSError:
+        pass
+
@@ -4,7 +4,8 @@ import fasteners
 
 from conans.client.tools.env import no_op
 from conans.errors import NotFoundException
-from conans.util.files import decode_text, md5sum, path_exists, relative_dirs, rmdir
+from conans.server.store.checksums import checksums_folder, load_checksums, remove_checksums
+from conans.util.files import decode_text, path_exists, relative_dirs, rmdir
 
 
 class ServerDiskAdapter(object):
@@ -68,7 +69,13 @@ class ServerDiskAdapter(object):
     def get_snapshot(self, absolute_path="", files_subset=None):
         """returns a dict with the filepaths and md5"""
         abs_paths = self._get_paths(absolute_path, files_subset)
-        return {filepath: md5sum(filepath) for filepath in abs_paths}
+        return {filepath: load_checksums(self._store_folder, filepath)["md5"]
+                for filepath in abs_paths}
+
+    def get_checksums(self, absolute_path="", files_subset=None):
+        """returns a dict with the filepaths and a dict of their md5, sha1 and sha256"""
+        abs_paths = self._get_paths(absolute_path, files_subset)
+        return {filepath: load_checksums(self._store_folder, filepath) for filepath in abs_paths}
 
     def get_file_list(self, absolute_path="", files_subset=None):
         abs_paths = self._get_paths(absolute_path, files_subset)
@@ -79,16 +86,29 @@ class ServerDiskAdapter(object):
         if not path_exists(path, self._store_folder):
             raise NotFoundException("")
         rmdir(path)
+        rmdir(checksums_folder(self._store_folder, path))
 
     def delete_file(self, path):
         """Delete files from bucket. Path already contains base dir"""
         if not path_exists(path, self._store_folder):
             raise NotFoundException("")
         os.remove(path)
+        remove_checksums(self._store_folder, path)
 
     def path_exists(self, path):
         return os.path.exists(path)
 
+    def lock(self, lock_file):
+        return fasteners.InterProcessLock(lock_file)
+
+    def file_stamp(self, path):
+        """ Changes if the file is modified, None if it doesn't exist """
+        try:
+            stats = os.stat(path)
+        except OSError:
+            return None
+        return stats.st_mtime_ns, stats.st_size
+
     def read_file(self, path, lock_file):
         with fasteners.InterProcessLock(lock_file) if lock_file else no_op():
             with open(path) as f:
@@ -99,5 +119,10 @@ class ServerDiskAdapter(object):
             with open(path, "w") as f:
                 f.write(contents)
 
+    def append_file(self, path, contents, lock_file):
+        with fasteners.InterProcessLock(lock_file) if lock_file else no_op():
+            with open(path, "a") as f:
+                f.write(contents)
+
     def base_storage_folder(self):
         return self._store_folder
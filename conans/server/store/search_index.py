@@ -0,0 +1,179 @@
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from conans.errors import ConanException
+from conans.model.info import ConanInfo
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import CONANINFO
+from conans.util.files import list_folder_subdirs, load, mkdir
+from conans.util.log import logger
+
+SEARCH_INDEX_FILE = "search_index.db"
+
+
+class SearchIndex(object):
+    """ sqlite index of the recipe revisions and the binaries (the latest package revision of
+    every package ID) of a server storage, so the searches don't walk the storage. It is updated
+    by the ServerStore with every upload and removal. The minimal info of the binaries is cached
+    too, validated with the mtime and size of its conaninfo.txt
+    """
+
+    def __init__(self, dbfile):
+        self.dbfile = dbfile
+
+    @staticmethod
+    def create(dbfile):
+        mkdir(os.path.dirname(dbfile))
+        connection = sqlite3.connect(dbfile)
+        try:
+            # Concurrent readers while writing, for the multi process servers
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("create table if not exists recipes "
+                               "(reference TEXT, revision TEXT, "
+                               "PRIMARY KEY (reference, revision))")
+            connection.execute("create table if not exists packages "
+                               "(reference TEXT, revision TEXT, package_id TEXT, "
+                               "package_revision TEXT, info_stamp TEXT, info TEXT, "
+                               "PRIMARY KEY (reference, revision, package_id))")
+            connection.commit()
+        except Exception as e:
+            raise ConanException("Could not initialize the search index '%s': %s" % (dbfile, e))
+        finally:
+            connection.close()
+        return SearchIndex(dbfile)
+
+    @contextmanager
+    def _connect(self):
+        if not os.path.exists(self.dbfile):
+            logger.warning("The search index %s was removed, the storage should be indexed again "
+                           "with 'conan_server --rebuild-index'" % self.dbfile)
+            SearchIndex.create(self.dbfile)
+        # A new connection every time, as it is used from the threads of the server
+        connection = sqlite3.connect(self.dbfile, timeout=60)
+        try:
+            with connection:  # Commits, or rollbacks if failed
+                yield connection
+        finally:
+            connection.close()
+
+    def recipe_revisions(self):
+        """ The ConanFileReference (with revision) of all the recipe revisions """
+        with self._connect() as connection:
+            rows = connection.execute("select reference, revision from recipes").fetchall()
+        return [ConanFileReference(*reference.split("/"), revision=revision, validate=False)
+                for reference, revision in rows]
+
+    def add_recipe_revision(self, ref):
+        with self._connect() as connection:
+            connection.execute("insert or ignore into recipes values (?, ?)",
+                               (ref.dir_repr(), ref.revision))
+
+    def remove_recipe(self, ref):
+        """ Of the revision of the reference, or all of them if it has no revision """
+        where, params = _where(ref)
+        with self._connect() as connection:
+            connection.execute("delete from recipes" + where, params)
+            connection.execute("delete from packages" + where, params)
+
+    def packages(self, ref):
+        """ {package_id: (package_revision, info_stamp, info)} of the recipe revision """
+        with self._connect() as connection:
+            rows = connection.execute("select package_id, package_revision, info_stamp, info "
+                                      "from packages where reference=? and revision=?",
+                                      (ref.dir_repr(), ref.revision)).fetchall()
+        return {row[0]: (row[1], row[2], row[3]) for row in rows}
+
+    def set_package_revision(self, pref):
+        """ The latest package revision of the package ID, its info is loaded when searched """
+        with self._connect() as connection:
+            connection.execute("insert or replace into packages values (?, ?, ?, ?, NULL, NULL)",
+                               (pref.ref.dir_repr(), pref.ref.revision, pref.id, pref.revision))
+
+    def set_package_info(self, pref, info_stamp, info):
+        with self._connect() as connection:
+            connection.execute("update packages set info_stamp=?, info=? where reference=? and "
+                               "revision=? and package_id=? and package_revision=?",
+                               (info_stamp, json.dumps(info), pref.ref.dir_repr(),
+                                pref.ref.revision, pref.id, pref.revision))
+
+    def remove_packages(self, ref, package_ids=None):
+        """ All the packages of the recipe revision, or just the package_ids ones """
+        with self._connect() as connection:
+            if package_ids is None:
+                connection.execute("delete from packages where reference=? and revision=?",
+                                   (ref.dir_repr(), ref.revision))
+            else:
+                connection.executemany("delete from packages where reference=? and revision=? "
+                                       "and package_id=?",
+                                       [(ref.dir_repr(), ref.revision, package_id)
+                                        for package_id in package_ids])
+
+    def rebuild(self, server_store):
+        """ Indexes again all the storage of the server_store, for existing storages or
+        storages modified without the server (e.g. restored from a backup)
+        """
+        recipes = []
+        packages = []
+        for folder in list_folder_subdirs(server_store.store, level=5):
+            ref = ConanFileReference(*folder.split("/"))
+            recipes.append((ref.dir_repr(), ref.revision))
+            packages_folder = server_store.packages(ref)
+            if not os.path.isdir(packages_folder):
+                continue
+            for package_id in list_folder_subdirs(packages_folder, level=1):
+                revision_entry = server_store.get_last_package_revision(
+                    PackageReference(ref, package_id))
+                if not revision_entry:
+                    continue
+                pref = PackageReference(ref, package_id, revision_entry.revision)
+                try:
+                    info_stamp, info = _load_info(server_store, pref)
+                    info = json.dumps(info)
+                except Exception as exc:  # It will be retried when searched
+                    logger.error("Package %s has no ConanInfo file: %s" % (str(pref), exc))
+                    info_stamp = info = None
+                packages.append((ref.dir_repr(), ref.revision, package_id, pref.revision,
+                                 info_stamp, info))
+
+        with self._connect() as connection:
+            connection.execute("delete from recipes")
+            connection.execute("delete from packages")
+            connection.executemany("insert or ignore into recipes values (?, ?)", recipes)
+            connection.executemany("insert or replace into packages values (?, ?, ?, ?, ?, ?)",
+                                   packages)
+        return len(recipes), len(packages)
+
+
+def _where(ref):
+    if ref.revision:
+        return " where reference=? and revision=?", (ref.dir_repr(), ref.revision)
+    return " where reference=?", (ref.dir_repr(), )
+
+
+def _info_stamp(info_path):
+    stats = os.stat(info_path)
+    return "%d-%d" % (stats.st_mtime_ns, stats.st_size)
+
+
+def _load_info(server_store, pref):
+    info_path = os.path.join(server_store.package(pref), CONANINFO)
+    info_stamp = _info_stamp(info_path)
+    return info_stamp, ConanInfo.loads(load(info_path)).serialize_min()
+
+
+def load_package_info(server_store, search_index, pref, info_stamp=None, info=None):
+    """ The minimal info of the package revision, from the index if its conaninfo.txt didn't
+    change since it was indexed. Raises IOError/OSError if the conaninfo.txt doesn't exist
+    """
+    if info is not None:
+        info_path = os.path.join(server_store.package(pref), CONANINFO)
+        if _info_stamp(info_path) == info_stamp:
+            return json.loads(info)
+    info_stamp, info_min = _load_info(server_store, pref)
+    try:
+        search_index.set_package_info(pref, info_stamp, info_min)
+    except sqlite3.Error as exc:  # The search works without updating the index
+        logger.error("Couldn't update the search index for %s: %s" % (pref.full_str(), exc))
+    return info_min
@@ -1,4 +1,6 @@
 import os
+import threading
+from collections import OrderedDict
 from os.path import join, normpath, relpath
 
 from conans import DEFAULT_REVISION_V1
@@ -8,18 +10,30 @@ from conans.paths import EXPORT_FOLDER, PACKAGES_FOLDER
 from conans.server.revision_list import RevisionList
 
 REVISIONS_FILE = "revisions.txt"
+# The new latest revisions are appended to it, until it is compacted into the REVISIONS_FILE
+REVISIONS_LOG_FILE = "revisions.log"
+REVISIONS_LOG_MAX_ENTRIES = 100
+_REVISIONS_CACHE_SIZE = 1000
 
 
 class ServerStore(object):
 
-    def __init__(self, storage_adapter):
+    def __init__(self, storage_adapter, search_index=None):
         self._storage_adapter = storage_adapter
         self._store_folder = storage_adapter._store_folder
+        self._search_index = search_index
+        # {revisions file: (stamp of the files, RevisionList, log entries)}, the latest used ones
+        self._revisions_cache = OrderedDict()
+        self._revisions_cache_lock = threading.Lock()
 
     @property
     def store(self):
         return self._store_folder
 
+    @property
+    def search_index(self):
+        return self._search_index
+
     def base_folder(self, ref):
         assert ref.revision is not None, "BUG: server store needs RREV to get recipe reference"
         tmp = normpath(join(self.store, ref.dir_repr()))
@@ -94,17 +108,31 @@ class ServerStore(object):
         file_list = [relpath(old_key, relative_path) for old_key in file_list]
         return file_list
 
+    # ############ FILE CHECKSUMS (APIv2)
+    def get_recipe_file_checksums(self, ref):
+        """Returns a {filepath: {"md5": md5, "sha1": sha1, "sha256": sha256}} """
+        assert isinstance(ref, ConanFileReference)
+        path = self.export(ref)
+        return self._relativize_keys(self._storage_adapter.get_checksums(path), path)
+
+    def get_package_file_checksums(self, pref):
+        """Returns a {filepath: {"md5": md5, "sha1": sha1, "sha256": sha256}} """
+        assert isinstance(pref, PackageReference)
+        path = self.package(pref)
+        return self._relativize_keys(self._storage_adapter.get_checksums(path), path)
+
     def _delete_empty_dirs(self, ref):
-        lock_files = set([REVISIONS_FILE, "%s.lock" % REVISIONS_FILE])
+        revision_files = set([REVISIONS_FILE, REVISIONS_LOG_FILE, "%s.lock" % REVISIONS_FILE])
 
         ref_path = normpath(join(self.store, ref.dir_repr()))
         if ref.revision:
             ref_path = join(ref_path, ref.revision)
         for _ in range(4 if not ref.revision else 5):
             if os.path.exists(ref_path):
-                if set(os.listdir(ref_path)) == lock_files:
-                    for lock_file in lock_files:
-                        os.unlink(os.path.join(ref_path, lock_file))
+                files = set(os.listdir(ref_path))
+                if files and files.issubset(revision_files):
+                    for revision_file in files:
+                        os.unlink(os.path.join(ref_path, revision_file))
                 try:  # Take advantage that os.rmdir does not delete non-empty dirs
                     os.rmdir(ref_path)
                 except OSError:
@@ -119,6 +147,8 @@ class ServerStore(object):
         else:
             self._storage_adapter.delete_folder(self.base_folder(ref))
             self._remove_revision_from_index(ref)
+        if self._search_index:
+            self._search_index.remove_recipe(ref)
         self._delete_empty_dirs(ref)
 
     def remove_packages(self, ref, package_ids_filter):
@@ -134,6 +164,8 @@ class ServerStore(object):
                 # Remove all package revisions
                 package_folder = self.package_revisions_root(pref)
                 self._storage_adapter.delete_folder(package_folder)
+        if self._search_index:
+            self._search_index.remove_packages(ref, package_ids_filter or None)
         self._delete_empty_dirs(ref)
 
     def remove_package(self, pref):
@@ -143,12 +175,22 @@ class ServerStore(object):
         package_folder = self.package(pref)
         self._storage_adapter.delete_folder(package_folder)
         self._remove_package_revision_from_index(pref)
+        if self._search_index:
+            # The package ID is indexed with its new latest revision, if any
+            revision_entry = self.get_last_package_revision(pref.copy_clear_prev())
+            if revision_entry:
+                self._search_index.set_package_revision(pref.copy_with_revs(
+                    pref.ref.revision, revision_entry.revision))
+            else:
+                self._search_index.remove_packages(pref.ref, [pref.id])
 
     def remove_all_packages(self, ref):
         assert ref.revision is not None, "BUG: server store needs RREV remove_all_packages"
         assert isinstance(ref, ConanFileReference)
         packages_folder = self.packages(ref)
         self._storage_adapter.delete_folder(packages_folder)
+        if self._search_index:
+            self._search_index.remove_packages(ref)
 
     def remove_conanfile_files(self, ref, files):
         subpath = self.export(ref)
@@ -198,8 +240,8 @@ class ServerStore(object):
         """Get the download urls for the whole relative_path or just
         for a subset of files. files_subset has to be a list with paths
         relative to relative_path"""
-        relative_snap = self._storage_adapter.get_snapshot(relative_path, files_subset)
-        urls = self._storage_adapter.get_download_urls(list(relative_snap.keys()), user)
+        paths = self._storage_adapter.get_file_list(relative_path, files_subset)
+        urls = self._storage_adapter.get_download_urls(paths, user)
         urls = self._relativize_keys(urls, relative_path)
         return urls
 
@@ -247,24 +289,33 @@ class ServerStore(object):
         assert(isinstance(ref, ConanFileReference))
         rev_file_path = self._recipe_revisions_file(ref)
         self._update_last_revision(rev_file_path, ref)
+        if self._search_index:
+            self._search_index.add_recipe_revision(ref)
 
     def update_last_package_revision(self, pref):
         assert(isinstance(pref, PackageReference))
         rev_file_path = self._package_revisions_file(pref)
         self._update_last_revision(rev_file_path, pref)
+        if self._search_index:
+            self._search_index.set_package_revision(pref)
 
     def _update_last_revision(self, rev_file_path, ref):
-        if self._storage_adapter.path_exists(rev_file_path):
-            rev_file = self._storage_adapter.read_file(rev_file_path,
-                                                       lock_file=rev_file_path + ".lock")
-            rev_list = RevisionList.loads(rev_file)
-        else:
-            rev_list = RevisionList()
         if ref.revision is None:
             raise ConanException("Invalid revision for: %s" % ref.full_str())
-        rev_list.add_revision(ref.revision)
-        self._storage_adapter.write_file(rev_file_path, rev_list.dumps(),
-                                         lock_file=rev_file_path + ".lock")
+        with self._storage_adapter.lock(rev_file_path + ".lock"):
+            rev_list, log_entries = self._read_revisions(rev_file_path)
+            latest = rev_list.latest_revision()
+            if latest and latest.revision == ref.revision:
+                # Each uploaded file calls to update the revision, nothing to write
+                return
+            if log_entries + 1 >= REVISIONS_LOG_MAX_ENTRIES:
+                rev_list = rev_list.copy()
+                rev_list.add_revision(ref.revision)
+                self._write_revisions(rev_file_path, rev_list)
+            else:
+                entry = rev_list.copy().add_revision(ref.revision)
+                self._storage_adapter.append_file(self._revisions_log_file(rev_file_path),
+                                                  RevisionList.dumps_entry(entry), lock_file=None)
 
     def get_package_revisions(self, pref):
         """Returns a RevisionList"""
@@ -281,13 +332,57 @@ class ServerStore(object):
         return ret
 
     def _get_revisions_list(self, rev_file_path):
-        if self._storage_adapter.path_exists(rev_file_path):
-            rev_file = self._storage_adapter.read_file(rev_file_path,
-                                                       lock_file=rev_file_path + ".lock")
-            rev_list = RevisionList.loads(rev_file)
-            return rev_list
-        else:
+        """ The returned RevisionList can be cached, it must not be modified
+        """
+        if not self._revisions_exist(rev_file_path):
             return RevisionList()
+        with self._storage_adapter.lock(rev_file_path + ".lock"):
+            rev_list, _ = self._read_revisions(rev_file_path)
+        return rev_list
+
+    @staticmethod
+    def _revisions_log_file(rev_file_path):
+        return join(os.path.dirname(rev_file_path), REVISIONS_LOG_FILE)
+
+    def _revisions_exist(self, rev_file_path):
+        return (self._storage_adapter.path_exists(rev_file_path) or
+                self._storage_adapter.path_exists(self._revisions_log_file(rev_file_path)))
+
+    def _read_revisions(self, rev_file_path):
+        """ The RevisionList of the REVISIONS_FILE and its log, and the number of entries of the
+        log. They are parsed again only if the files changed, as they are read for every request
+        """
+        log_file_path = self._revisions_log_file(rev_file_path)
+        stamp = (self._storage_adapter.file_stamp(rev_file_path),
+                 self._storage_adapter.file_stamp(log_file_path))
+        with self._revisions_cache_lock:
+            cached = self._revisions_cache.get(rev_file_path)
+            if cached and cached[0] == stamp:
+                self._revisions_cache.move_to_end(rev_file_path)
+                return cached[1], cached[2]
+
+        if stamp == (None, None):
+            return RevisionList(), 0
+        contents = self._storage_adapter.read_file(rev_file_path, lock_file=None) \
+            if stamp[0] else RevisionList().dumps()
+        log = self._storage_adapter.read_file(log_file_path, lock_file=None) if stamp[1] else ""
+        rev_list = RevisionList.loads(contents, log)
+        log_entries = len(log.splitlines())
+        with self._revisions_cache_lock:
+            self._revisions_cache[rev_file_path] = (stamp, rev_list, log_entries)
+            self._revisions_cache.move_to_end(rev_file_path)
+            if len(self._revisions_cache) > _REVISIONS_CACHE_SIZE:
+                self._revisions_cache.popitem(last=False)
+        return rev_list, log_entries
+
+    def _write_revisions(self, rev_file_path, rev_list):
+        """ Compacts the log, writing all the revisions to the REVISIONS_FILE. Called with the
+        lock of the revisions acquired
+        """
+        self._storage_adapter.write_file(rev_file_path, rev_list.dumps(), lock_file=None)
+        log_file_path = self._revisions_log_file(rev_file_path)
+        if self._storage_adapter.path_exists(log_file_path):
+            self._storage_adapter.delete_file(log_file_path)
 
     def _get_latest_revision(self, rev_file_path):
         rev_list = self._get_revisions_list(rev_file_path)
@@ -315,44 +410,24 @@ class ServerStore(object):
         return join(p_folder, REVISIONS_FILE)
 
     def get_revision_time(self, ref):
-        try:
-            rev_list = self._load_revision_list(ref)
-        except IOError:
-            return None
+        rev_list = self._get_revisions_list(self._recipe_revisions_file(ref))
         return rev_list.get_time(ref.revision)
 
     def get_package_revision_time(self, pref):
-        try:
-            rev_list = self._load_package_revision_list(pref)
-        except (IOError, OSError):
-            return None
-
+        rev_list = self._get_revisions_list(self._package_revisions_file(pref))
         return rev_list.get_time(pref.revision)
 
     def _remove_revision_from_index(self, ref):
-        rev_list = self._load_revision_list(ref)
-        rev_list.remove_revision(ref.revision)
-        self._save_revision_list(rev_list, ref)
+        self._remove_revision(self._recipe_revisions_file(ref), ref.revision)
 
     def _remove_package_revision_from_index(self, pref):
-        rev_list = self._load_package_revision_list(pref)
-        rev_list.remove_revision(pref.revision)
-        self._save_package_revision_list(rev_list, pref)
-
-    def _load_revision_list(self, ref):
-        path = self._recipe_revisions_file(ref)
-        rev_file = self._storage_adapter.read_file(path, lock_file=path + ".lock")
-        return RevisionList.loads(rev_file)
-
-    def _save_revision_list(self, rev_list, ref):
-        path = self._recipe_revisions_file(ref)
-        self._storage_adapter.write_file(path, rev_list.dumps(), lock_file=path + ".lock")
-
-    def _save_package_revision_list(self, rev_list, pref):
-        path = self._package_revisions_file(pref)
-        self._storage_adapter.write_file(path, rev_list.dumps(), lock_file=path + ".lock")
-
-    def _load_package_revision_list(self, pref):
-        path = self._package_revisions_file(pref)
-        rev_file = self._storage_adapter.read_file(path, lock_file=path + ".lock")
-        return RevisionList.loads(rev_file)
+        self._remove_revision(self._package_revisions_file(pref), pref.revision)
+
+    def _remove_revision(self, rev_file_path, revision):
+        if not self._revisions_exist(rev_file_path):
+            return
+        with self._storage_adapter.lock(rev_file_path + ".lock"):
+            rev_list, _ = self._read_revisions(rev_file_path)
+            rev_list = rev_list.copy()
+            rev_list.remove_revision(revision)
+            self._write_revisions(rev_file_path, rev_list)
@@ -6,8 +6,9 @@ from collections import Counter
 from threading import Thread
 
 from bottle import static_file, request
+from mock import patch
 
-from conans.client.rest.download_cache import CachedFileDownloader
+from conans.client.rest.download_cache import CachedFileDownloader, CONTENTS_FOLDER
 from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import TestClient, StoppableThreadBottle
 from conans.util.env_reader import get_env
@@ -37,8 +38,10 @@ class DownloadCacheTest(unittest.TestCase):
         client.run("install mypkg/0.1@user/testing")
         content = load(log_trace_file)
         self.assertEqual(6, content.count('"_action": "DOWNLOAD"'))
-        # 6 files cached, plus "locks" folder = 7
-        self.assertEqual(7, len(os.listdir(cache_folder)))
+        # 6 files cached
+        self.assertEqual(6, len(os.listdir(os.path.join(cache_folder, CONTENTS_FOLDER))))
+        client.run("cache download-stats")
+        self.assertIn("Download cache: 6 files", client.out)
 
         os.remove(log_trace_file)
         client.run("remove * -f")
@@ -66,6 +69,12 @@ class DownloadCacheTest(unittest.TestCase):
         content = load(log_trace_file)
         self.assertEqual(0, content.count('"_action": "DOWNLOAD"'))
 
+        client.run("cache download-prune", assert_error=True)
+        self.assertIn("Specify the maximum size", client.out)
+        client.run("cache download-prune --max-size=0")
+        self.assertIn("Removed 6 files", client.out)
+        self.assertEqual(0, len(os.listdir(os.path.join(cache_folder, CONTENTS_FOLDER))))
+
     @unittest.skipIf(get_env("TESTING_REVISIONS_ENABLED", False), "No sense with revs")
     def test_corrupted_cache(self):
         # This test only works without revisions, because v1 has md5 file checksums, but v2 nop
@@ -85,10 +94,9 @@ class DownloadCacheTest(unittest.TestCase):
         client.run('config set storage.download_cache="%s"' % cache_folder)
         client.run("remove * -f")
         client.run("install mypkg/0.1@user/testing")
-        for f in os.listdir(cache_folder):
-            f = os.path.join(cache_folder, f)
-            if not os.path.isfile(f):
-                continue
+        contents_folder = os.path.join(cache_folder, CONTENTS_FOLDER)
+        for f in os.listdir(contents_folder):
+            f = os.path.join(contents_folder, f)
             save(f, load(f) + "a")
         client.run("remove * -f")
         client.run("install mypkg/0.1@user/testing", assert_error=True)
@@ -125,7 +133,8 @@ class DownloadCacheTest(unittest.TestCase):
         self.assertIn("ConanException: md5 signature failed for", client.out)
         self.assertIn("Provided signature: kk", client.out)
         self.assertIn("Computed signature: 9893532233caff98cd083a116b013c0b", client.out)
-        self.assertEqual(1, len(os.listdir(cache_folder)))  # Nothing was cached
+        contents_folder = os.path.join(cache_folder, CONTENTS_FOLDER)
+        self.assertEqual(0, len(os.listdir(contents_folder)))  # Nothing was cached
 
         # This is the right checksum
         conanfile = textwrap.dedent("""
@@ -146,8 +155,8 @@ class DownloadCacheTest(unittest.TestCase):
         self.assertTrue(os.path.exists(local_path2))
         self.assertEqual("some query", client.load("myfile2.txt"))
 
-        # 2 files cached, plus "locks" folder = 3
-        self.assertEqual(3, len(os.listdir(cache_folder)))
+        # 2 files cached
+        self.assertEqual(2, len(os.listdir(contents_folder)))
 
         # remove remote file
         os.remove(file_path)
@@ -206,7 +215,7 @@ class DownloadCacheTest(unittest.TestCase):
 
 class CachedDownloaderUnitTest(unittest.TestCase):
     def setUp(self):
-        cache_folder = temp_folder()
+        self.cache_folder = temp_folder()
 
         class FakeFileDownloader(object):
             def __init__(self):
@@ -222,7 +231,7 @@ class CachedDownloaderUnitTest(unittest.TestCase):
                     return url
 
         self.file_downloader = FakeFileDownloader()
-        self.cached_downloader = CachedFileDownloader(cache_folder, self.file_downloader)
+        self.cached_downloader = CachedFileDownloader(self.cache_folder, self.file_downloader)
 
     def test_concurrent_locks(self):
         folder = temp_folder()
@@ -284,3 +293,90 @@ class CachedDownloaderUnitTest(unittest.TestCase):
         self.cached_downloader.download("testurl", file_path)
         self.assertEqual(self.file_downloader.calls["testurl"], 1)
         self.assertEqual("testurl", load(file_path))
+
+    def test_same_checksum_other_url(self):
+        folder = temp_folder()
+        file_path = os.path.join(folder, "myfile.txt")
+        md5 = "49ac542f5119512682b72f1d44e6fe81"  # md5 of "testurl"
+        self.cached_downloader.download("testurl", file_path, md5=md5)
+        self.assertEqual(self.file_downloader.calls["testurl"], 1)
+        # The same file in other URL is not downloaded again
+        file_path = os.path.join(folder, "myfile2.txt")
+        self.cached_downloader.download("other_testurl", file_path, md5=md5)
+        self.assertEqual(self.file_downloader.calls["other_testurl"], 0)
+        self.assertEqual("testurl", load(file_path))
+        self.assertEqual((1, len("testurl")), CachedFileDownloader.stats(self.cache_folder))
+
+    def test_prune(self):
+        folder = temp_folder()
+        for i, url in enumerate(("testurl1", "testurl2", "testurl3")):
+            self.cached_downloader.download(url, os.path.join(folder, "myfile.txt"))
+            # The oldest files are removed first, don't depend on the filesystem time resolution
+            cached = self.cached_downloader._find([self.cached_downloader._get_hash(url)])
+            os.utime(cached, (1000 + i, 1000 + i))
+        self.assertEqual((3, 3 * len("testurl1")), CachedFileDownloader.stats(self.cache_folder))
+
+        # Using a file makes it the most recently used
+        self.cached_downloader.download("testurl1", os.path.join(folder, "myfile.txt"))
+        removed = CachedFileDownloader.prune(self.cache_folder, 2 * len("testurl1"))
+        self.assertEqual((1, len("testurl2")), removed)
+        self.cached_downloader.download("testurl1", os.path.join(folder, "myfile.txt"))
+        self.cached_downloader.download("testurl3", os.path.join(folder, "myfile.txt"))
+        self.assertEqual(self.file_downloader.calls["testurl1"], 1)
+        self.assertEqual(self.file_downloader.calls["testurl3"], 1)
+        # The removed one is downloaded again
+        self.cached_downloader.download("testurl2", os.path.join(folder, "myfile.txt"))
+        self.assertEqual(self.file_downloader.calls["testurl2"], 2)
+
+    def test_max_size(self):
+        cached_downloader = CachedFileDownloader(self.cache_folder, self.file_downloader,
+                                                 max_size=len("testurl1"))
+        folder = temp_folder()
+        cached_downloader.download("testurl1", os.path.join(folder, "myfile.txt"))
+        cached_downloader.download("testurl2", os.path.join(folder, "myfile.txt"))
+        # The last downloaded file is always kept
+        self.assertEqual((1, len("testurl2")), CachedFileDownloader.stats(self.cache_folder))
+        self.assertEqual("testurl2", load(os.path.join(folder, "myfile.txt")))
+        cached_downloader.download("testurl1", os.path.join(folder, "myfile.txt"))
+        self.assertEqual(self.file_downloader.calls["testurl1"], 2)
+
+    def test_link_tgz(self):
+        folder = temp_folder()
+        file_path = os.path.join(folder, "conan_package.tgz")
+        self.cached_downloader.download("testurl", file_path)
+        cached = self.cached_downloader._find([self.cached_downloader._get_hash("testurl")])
+        self.assertTrue(os.path.samefile(cached, file_path))
+        # Other files are copied, they could be modified
+        file_path = os.path.join(folder, "conanfile.py")
+        self.cached_downloader.download("testurl", file_path)
+        self.assertFalse(os.path.samefile(cached, file_path))
+
+    def test_removed_while_used(self):
+        folder = temp_folder()
+        self.cached_downloader.download("testurl", os.path.join(folder, "myfile.txt"))
+        find = self.cached_downloader._find
+
+        def find_and_prune(*args):
+            # Other process prunes the cache just after the file was found
+            cached = find(*args)
+            CachedFileDownloader.prune(self.cache_folder, 0)
+            return cached
+
+        with patch.object(self.cached_downloader, "_find", side_effect=find_and_prune):
+            self.cached_downloader.download("testurl", os.path.join(folder, "myfile2.txt"))
+        self.assertEqual(self.file_downloader.calls["testurl"], 2)
+        self.assertEqual("testurl", load(os.path.join(folder, "myfile2.txt")))
+
+    def test_old_layout_migrated(self):
+        # Files of the previous layout, named by the hash of the URL in the cache folder
+        url_key = self.cached_downloader._get_hash("testurl")
+        save(os.path.join(self.cache_folder, url_key), "testurl")
+        save(os.path.join(self.cache_folder, self.cached_downloader._get_hash("other")), "other")
+        self.assertEqual((2, len("testurl") + len("other")),
+                         CachedFileDownloader.stats(self.cache_folder))
+        self.assertEqual(sorted(os.listdir(self.cache_folder)), [CONTENTS_FOLDER, "keys"])
+
+        content = self.cached_downloader.download("testurl")
+        self.assertEqual(content.decode("utf-8"), "testurl")
+        self.assertEqual(self.file_downloader.calls["testurl"], 0)
+        self.assertEqual((1, len("other")), CachedFileDownloader.prune(self.cache_folder, 7))
@@ -0,0 +1,111 @@
+import os
+import platform
+import stat
+import subprocess
+import sys
+import textwrap
+import unittest
+
+import conans
+from conans.client import daemon
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import GenConanfile
+from conans.util.files import save
+
+
+@unittest.skipIf(platform.system() == "Windows", "Unix sockets and fork() in NIX systems only")
+class DaemonTest(unittest.TestCase):
+
+    def setUp(self):
+        self.user_home = temp_folder()
+        self.current_folder = temp_folder()
+        self.socket = daemon.socket_path(os.path.join(self.user_home, ".conan"))
+        conans_root = os.path.dirname(os.path.dirname(os.path.abspath(conans.__file__)))
+        self.env = dict(os.environ)
+        self.env.update({"CONAN_USER_HOME": self.user_home,
+                         "CONAN_DAEMON": "1",
+                         "CONAN_DAEMON_TIMEOUT": "60",
+                         "PYTHONPATH": conans_root})
+
+    def tearDown(self):
+        daemon.stop(self.socket)
+
+    def _run(self, command, env=None):
+        env = env or self.env
+        result = subprocess.run([sys.executable, "-m", "conans.conan"] + command.split(),
+                                cwd=self.current_folder, env=env,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        return result.returncode, result.stdout.decode(), result.stderr.decode()
+
+    def test_commands(self):
+        exit_code, out, _ = self._run("new pkg/1.0")
+        self.assertEqual(exit_code, 0)
+        self.assertIn("File saved: conanfile.py", out)
+        self.assertTrue(os.path.exists(os.path.join(self.current_folder, "conanfile.py")))
+        self.assertTrue(os.path.exists(self.socket))
+
+        exit_code, out, _ = self._run("inspect . -a name")
+        self.assertEqual(exit_code, 0)
+        self.assertIn("name: pkg", out)
+
+        exit_code, out, err = self._run("inspect pkg/1.0@ -r missing")
+        self.assertEqual(exit_code, 1)
+        self.assertIn("ERROR: No remote 'missing' defined in remotes", err)
+
+    def test_environment(self):
+        conanfile = textwrap.dedent("""
+            import os
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                description = os.getenv("MY_DESCRIPTION")
+            """)
+        save(os.path.join(self.current_folder, "conanfile.py"), conanfile)
+        for description in ("first", "second"):
+            env = dict(self.env, MY_DESCRIPTION=description)
+            exit_code, out, _ = self._run("inspect . -a description", env)
+            self.assertEqual(exit_code, 0)
+            self.assertIn("description: %s" % description, out)
+
+    def test_star_import(self):
+        conanfile = textwrap.dedent("""
+            from conans import *
+            class Pkg(ConanFile):
+                def source(self):
+                    self.output.info("%s %s" % (CMake.__name__, tools.__name__))
+            """)
+        save(os.path.join(self.current_folder, "conanfile.py"), conanfile)
+        no_daemon_env = {k: v for k, v in self.env.items() if k != "CONAN_DAEMON"}
+        for env in (self.env, no_daemon_env):
+            exit_code, out, _ = self._run("source .", env)
+            self.assertEqual(exit_code, 0)
+            self.assertIn("conanfile.py: CMake conans.tools", out)
+
+    def test_configuration_environment(self):
+        # The commands differ only in the CONAN_ variables read when the app is created
+        save(os.path.join(self.current_folder, "conanfile.py"), str(GenConanfile()))
+        save(os.path.join(self.user_home, ".conan", "hooks", "my_hook.py"), textwrap.dedent("""
+            def pre_export(output, **kwargs):
+                output.info("MY HOOK")
+            """))
+        for hooks in ("", "my_hook", ""):
+            env = dict(self.env, CONAN_HOOKS=hooks)
+            exit_code, out, _ = self._run("export . pkg/1.0@", env)
+            self.assertEqual(exit_code, 0)
+            if hooks:
+                self.assertIn("[HOOK - my_hook.py] pre_export(): MY HOOK", out)
+            else:
+                self.assertNotIn("MY HOOK", out)
+
+    def test_private_socket(self):
+        self._run("--version")
+        folder = os.path.dirname(self.socket)
+        self.assertEqual(stat.S_IMODE(os.stat(folder).st_mode), 0o700)
+        self.assertEqual(os.stat(folder).st_uid, os.getuid())
+
+    def test_stop(self):
+        self._run("--version")
+        self.assertTrue(os.path.exists(self.socket))
+        subprocess.check_call([sys.executable, "-m", "conans.client.daemon", "--stop"],
+                              env=self.env, stdout=subprocess.DEVNULL)
+        self.assertFalse(os.path.exists(self.socket))
+        self.assertFalse(daemon.stop(self.socket))
@@ -1,6 +1,13 @@
+import json
+import os
+import textwrap
+import time
 import unittest
 
-from conans.test.utils.tools import GenConanfile, TestClient
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import GenConanfile, NO_SETTINGS_PACKAGE_ID, TestClient
+from conans.util.files import save
 
 
 class InstallParallelTest(unittest.TestCase):
@@ -28,3 +35,158 @@ class InstallParallelTest(unittest.TestCase):
         self.assertIn("Downloading binary packages in %s parallel threads" % threads, client.out)
         for i in range(counter):
             self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
+
+    def test_basic_parallel_build(self):
+        client = TestClient()
+        client.run("config set general.parallel_build=2")
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("export . pkga/0.1@user/testing")
+        client.save({"conanfile.py": GenConanfile().with_require("pkga/0.1@user/testing")})
+        client.run("export . pkgb/0.1@user/testing")
+        client.run("export . pkgc/0.1@user/testing")
+        client.save({"conanfile.py": GenConanfile().with_require("pkgb/0.1@user/testing")
+                                                   .with_require("pkgc/0.1@user/testing")})
+        client.run("export . pkgd/0.1@user/testing")
+
+        client.run("install pkgd/0.1@user/testing --build")
+        self.assertIn("Building binary packages in 2 parallel processes", client.out)
+        for name in ("pkga", "pkgb", "pkgc", "pkgd"):
+            self.assertIn("%s/0.1@user/testing: Package '" % name, client.out)
+            self.assertIn("%s/0.1@user/testing: Created package revision" % name, client.out)
+        # The output of every build is not interleaved with the others
+        output = str(client.out)
+        self.assertLess(output.index("pkgb/0.1@user/testing: Building your package"),
+                        output.index("pkgb/0.1@user/testing: Created package revision"))
+
+        client.run("install pkgd/0.1@user/testing")
+        for name in ("pkga", "pkgb", "pkgc", "pkgd"):
+            self.assertIn("%s/0.1@user/testing: Already installed!" % name, client.out)
+
+    def test_parallel_build_error(self):
+        client = TestClient()
+        client.run("config set general.parallel_build=2")
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("export . pkga/0.1@user/testing")
+        client.save({"conanfile.py": GenConanfile().with_require("pkga/0.1@user/testing")})
+        client.run("export . pkgb/0.1@user/testing")
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                def build(self):
+                    raise Exception("Build crashed!")
+            """)
+        client.save({"conanfile.py": conanfile})
+        client.run("export . pkgc/0.1@user/testing")
+        client.save({"conanfile.txt": "[requires]\npkgb/0.1@user/testing\npkgc/0.1@user/testing"},
+                    clean_first=True)
+        client.run("install . --build", assert_error=True)
+        self.assertIn("pkgc/0.1@user/testing: Error in build() method, line 5", client.out)
+        self.assertIn("Build crashed!", client.out)
+
+    def test_parallel_build_download_error(self):
+        # The download fails while other package is being built, the build is not left running
+        client = TestClient(default_server_user=True, revisions_enabled=True)
+        client.run("config set general.default_package_id_mode=package_revision_mode")
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . pkgz/0.1@user/testing")
+        client.save({"conanfile.py": GenConanfile().with_require("pkgz/0.1@user/testing")})
+        client.run("create . pkgx/0.1@user/testing")
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+        server_store = client.servers["default"].server_store
+        ref = ConanFileReference.loads("pkgx/0.1@user/testing")
+        ref = ref.copy_with_rev(server_store.get_last_revision(ref).revision)
+        pref = PackageReference(ref, os.listdir(server_store.packages(ref))[0])
+        pref = pref.copy_with_revs(ref.revision,
+                                   server_store.get_last_package_revision(pref).revision)
+        save(os.path.join(server_store.package(pref), "conan_package.tgz"), "corrupted")
+
+        built = os.path.join(temp_folder(), "built.txt")
+        conanfile = textwrap.dedent("""
+            import time
+            from conans import ConanFile
+            from conans.util.files import save
+            class Pkg(ConanFile):
+                def build(self):
+                    time.sleep(3)
+                    save(r"%s", "")
+            """ % built)
+        client.save({"conanfile.py": conanfile})
+        client.run("export . pkga/0.1@user/testing")
+        client.run("config set general.parallel_build=2")
+        # The binary of pkgx is known and downloaded once pkgz is built, while pkga is building
+        client.save({"conanfile.txt": "[requires]\npkga/0.1@user/testing\npkgx/0.1@user/testing"},
+                    clean_first=True)
+        client.run("install . --build=pkga --build=pkgz", assert_error=True)
+        self.assertIn("pkgx/0.1@user/testing: Binary for updated ID from: Download", client.out)
+        self.assertIn("ERROR: Error while downloading/extracting files", client.out)
+        time.sleep(4)
+        self.assertFalse(os.path.exists(built))
+
+    def test_parallel_build_invalid(self):
+        client = TestClient()
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("export . pkga/0.1@user/testing")
+        client.save({"conanfile.txt": "[requires]\npkga/0.1@user/testing"}, clean_first=True)
+        for processes in ("0", "-1"):
+            client.run("config set general.parallel_build=%s" % processes)
+            client.run("install . --build", assert_error=True)
+            self.assertIn("ERROR: The 'parallel_build' processes must be 1 or more", client.out)
+
+    def test_parallel_recipes(self):
+        client = TestClient(default_server_user=True)
+        client.save({"conanfile.py": GenConanfile()})
+        for i in range(3):
+            client.run("create . pkg%s/0.1@user/testing" % i)
+        client.save({"conanfile.py": GenConanfile().with_require("pkg0/0.1@user/testing")})
+        client.run("create . pkg3/0.1@user/testing")
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+
+        client.run("config set general.parallel_download=4")
+        # pkg0 is required by pkg3 too, closing a diamond
+        conanfile = GenConanfile().with_require("pkg3/0.1@user/testing")
+        for i in range(3):
+            conanfile.with_require("pkg%s/0.1@user/testing" % i)
+        client.save({"conanfile.py": conanfile}, clean_first=True)
+        client.run("install . --json=output.json")
+        for i in range(4):
+            self.assertIn("pkg%s/0.1@user/testing from 'default' - Downloaded" % i, client.out)
+            self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
+        output = json.loads(client.load("output.json"))
+        self.assertEqual(len(output["installed"]), 4)
+        for installed in output["installed"]:
+            self.assertTrue(installed["recipe"]["downloaded"])
+
+        client.run("remove * -f")
+        client.save({"conanfile.py": GenConanfile().with_require("pkg0/0.1@user/testing")
+                                                   .with_require("missing/0.1@user/testing")})
+        client.run("install .", assert_error=True)
+        self.assertIn("ERROR: Failed requirement 'missing/0.1@user/testing' from "
+                      "'conanfile.py'", client.out)
+
+    def test_parallel_binaries_query(self):
+        client = TestClient(default_server_user=True)
+        client.save({"conanfile.py": GenConanfile().with_option("shared", [True, False])
+                                                   .with_default_option("shared", False)})
+        for i in range(3):
+            client.run("create . pkg%s/0.1@user/testing" % i)
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+
+        client.run("config set general.parallel_download=4")
+        client.save({"conanfile.txt": "[requires]\npkg0/0.1@user/testing\n"
+                                      "pkg1/0.1@user/testing\npkg2/0.1@user/testing"},
+                    clean_first=True)
+        client.run("install .")
+        for i in range(3):
+            self.assertIn("pkg%s/0.1@user/testing:%s - Download" % (i, NO_SETTINGS_PACKAGE_ID),
+                          client.out)
+        client.run("install . --update")
+        for i in range(3):
+            self.assertIn("pkg%s/0.1@user/testing:%s - Cache" % (i, NO_SETTINGS_PACKAGE_ID),
+                          client.out)
+
+        client.run("install . -o pkg1:shared=True", assert_error=True)
+        self.assertIn("pkg0/0.1@user/testing:%s - Cache" % NO_SETTINGS_PACKAGE_ID, client.out)
+        self.assertIn("ERROR: Missing prebuilt package for 'pkg1/0.1@user/testing'", client.out)
@@ -4,6 +4,7 @@ import unittest
 from collections import OrderedDict
 from time import sleep
 
+from conans.client.tools.env import environment_append
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.paths import CONAN_MANIFEST
 from conans.test.utils.cpp_test_files import cpp_hello_conan_files
@@ -313,3 +314,28 @@ class ConanLib(ConanFile):
         # Try to install ref2, it will try to download the binary for ref1
         client.run("install {}".format(ref2), assert_error=True)
         self.assertIn("ERROR: Error downloading binary package: '{}'".format(pref1), client.out)
+
+    def test_update_check_ttl(self):
+        self.client.save({"conanfile.py": GenConanfile().with_build_msg("REV1")})
+        self.client.run("create . Pkg/0.1@lasote/testing")
+        self.client.run("upload Pkg/0.1@lasote/testing --all -r=myremote")
+
+        client2 = TestClient(servers=self.servers, users={"myremote": [("lasote", "mypass")]})
+        client2.run("config set general.update_check_ttl=3600")
+        client2.run("install Pkg/0.1@lasote/testing --update")
+        client2.run("install Pkg/0.1@lasote/testing --update")
+        self.assertIn("Pkg/0.1@lasote/testing from 'myremote' - Cache", client2.out)
+
+        time.sleep(1)  # Make sure the new timestamp is later
+        self.client.save({"conanfile.py": GenConanfile().with_build_msg("REV2")})
+        self.client.run("create . Pkg/0.1@lasote/testing")
+        self.client.run("upload Pkg/0.1@lasote/testing --all -r=myremote")
+
+        # The previous check of the remote is reused
+        client2.run("install Pkg/0.1@lasote/testing --update --build")
+        self.assertIn("REV1", client2.out)
+        # Unless it is disabled with the environment variable
+        with environment_append({"CONAN_UPDATE_CHECK_TTL": "0"}):
+            client2.run("install Pkg/0.1@lasote/testing --update --build")
+        self.assertIn("REV2", client2.out)
+        self.assertIn("Pkg/0.1@lasote/testing from 'myremote' - Updated", client2.out)
@@ -42,6 +42,21 @@ class RemoveLocksTest(unittest.TestCase):
         self.assertFalse(os.path.exists(conan_folder + ".count"))
         self.assertFalse(os.path.exists(conan_folder + ".count.lock"))
 
+    @unittest.skipIf(platform.system() == "Windows", "fcntl locks not available in Windows")
+    def test_remove_fcntl_locks(self):
+        client = TestClient()
+        client.run("config set general.cache_lock_backend=fcntl")
+        client.save({"conanfile.py": GenConanfile().with_name("Hello").with_version("0.1")})
+        client.run("create . lasote/testing")
+        ref = ConanFileReference.loads("Hello/0.1@lasote/testing")
+        conan_folder = client.cache.package_layout(ref).base_folder()
+        self.assertTrue(os.path.exists(conan_folder + ".lock"))
+        self.assertFalse(os.path.exists(conan_folder + ".count"))
+        client.run("remove --locks")
+        self.assertFalse(os.path.exists(conan_folder + ".lock"))
+        client.run("remove Hello/0.1@lasote/testing -f")
+        self.assertFalse(os.path.exists(conan_folder + ".lock"))
+
 
 class RemoveRegistryTest(unittest.TestCase):
 
@@ -293,11 +308,11 @@ class RemoveTest(unittest.TestCase):
         folders = os.listdir(self.client.storage_folder)
         six.assertCountEqual(self, ["Hello", "Other", "Bye"], folders)
         six.assertCountEqual(self, ["build", "source", "export", "export_source", "metadata.json",
-                                    "metadata.json.lock"],
+                                    "metadata.json.lock", "binaries.json", "binaries.json.lock"],
                              os.listdir(os.path.join(self.client.storage_folder,
                                                      "Hello/1.4.10/myuser/testing")))
         six.assertCountEqual(self, ["build", "source", "export", "export_source", "metadata.json",
-                                    "metadata.json.lock"],
+                                    "metadata.json.lock", "binaries.json", "binaries.json.lock"],
                              os.listdir(os.path.join(self.client.storage_folder,
                                                      "Hello/2.4.11/myuser/testing")))
 
@@ -348,11 +363,13 @@ class RemoveTest(unittest.TestCase):
         folders = os.listdir(self.client.storage_folder)
         six.assertCountEqual(self, ["Hello", "Other", "Bye"], folders)
         six.assertCountEqual(self, ["package", "source", "export", "export_source",
-                                    "metadata.json", "metadata.json.lock"],
+                                    "metadata.json", "metadata.json.lock", "binaries.json",
+                                    "binaries.json.lock"],
                              os.listdir(os.path.join(self.client.storage_folder,
                                                      "Hello/1.4.10/myuser/testing")))
         six.assertCountEqual(self, ["package", "source", "export", "export_source",
-                                    "metadata.json", "metadata.json.lock"],
+                                    "metadata.json", "metadata.json.lock", "binaries.json",
+                                    "binaries.json.lock"],
                              os.listdir(os.path.join(self.client.storage_folder,
                                                      "Hello/2.4.11/myuser/testing")))
 
@@ -367,11 +384,11 @@ class RemoveTest(unittest.TestCase):
         folders = os.listdir(self.client.storage_folder)
         six.assertCountEqual(self, ["Hello", "Other", "Bye"], folders)
         six.assertCountEqual(self, ["package", "build", "export", "export_source", "metadata.json",
-                                    "metadata.json.lock"],
+                                    "metadata.json.lock", "binaries.json", "binaries.json.lock"],
                              os.listdir(os.path.join(self.client.storage_folder,
                                                      "Hello/1.4.10/myuser/testing")))
         six.assertCountEqual(self, ["package", "build", "export", "export_source", "metadata.json",
-                                    "metadata.json.lock"],
+                                    "metadata.json.lock", "binaries.json", "binaries.json.lock"],
                              os.listdir(os.path.join(self.client.storage_folder,
                                                      "Hello/2.4.11/myuser/testing")))
 
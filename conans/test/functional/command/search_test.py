@@ -1381,6 +1381,30 @@ class Test(ConanFile):
         client.run("search lib/1.0@user/testing --raw --revisions")
         self.assertNotIn("Revisions for", client.out)
 
+    def test_search_revisions_after_upload(self):
+        # The server keeps the times of the new revisions in ISO 8601, even if they are timestamps
+        # (as in the revisions files of old servers), the clients can print them
+        test_server = TestServer(users={"user": "password"})
+        client = TestClient(servers={"default": test_server},
+                            users={"default": [("user", "password")]})
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . lib/1.0@user/testing")
+        the_time = time.time()
+        time_str = iso8601_to_str(from_timestamp_to_iso8601(the_time))
+        with patch.object(RevisionList, '_now', return_value=the_time):
+            client.run("upload lib/1.0@user/testing -c --all")
+
+        metadata = client.cache.package_layout(ConanFileReference.loads("lib/1.0@user/testing"))\
+            .load_metadata()
+        rrev = metadata.recipe.revision
+        prev = metadata.packages[NO_SETTINGS_PACKAGE_ID].revision
+
+        client.run("search lib/1.0@user/testing -r default --revisions")
+        self.assertIn("%s (%s)" % (rrev, time_str), client.out)
+        client.run("search lib/1.0@user/testing#%s:%s -r default --revisions"
+                   % (rrev, NO_SETTINGS_PACKAGE_ID))
+        self.assertIn("%s (%s)" % (prev, time_str), client.out)
+
     def test_search_package_revisions(self):
         test_server = TestServer(users={"user": "password"})  # exported users and passwords
         servers = {"default": test_server}
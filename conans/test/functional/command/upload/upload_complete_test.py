@@ -295,6 +295,23 @@ class UploadTest(unittest.TestCase):
         client.run('search lib1/1.0@user/channel -r default')
         self.assertIn("lib1/1.0@user/channel", client.out)
 
+    def test_upload_parallel_packages(self):
+        """Upload several binaries of the same recipe, compressed and transferred in parallel"""
+        client = TestClient(default_server_user=True)
+        client.save({"conanfile.py": GenConanfile().with_setting("build_type")})
+        for build_type in ("Release", "Debug", "RelWithDebInfo", "MinSizeRel"):
+            client.run('create . lib/1.0@user/channel -s build_type=%s' % build_type)
+        client.run('user -p password -r default user')
+        client.run('upload lib* --parallel -c --all -r default')
+        for index in range(4):
+            self.assertIn("Uploading package %s/4" % (index + 1), client.out)
+        self.assertIn("phases time of all threads: compress", client.out)
+
+        client.run('remove * -f')
+        for build_type in ("Release", "Debug", "RelWithDebInfo", "MinSizeRel"):
+            client.run('install lib/1.0@user/channel -s build_type=%s' % build_type)
+            self.assertIn("lib/1.0@user/channel: Package installed", client.out)
+
     def test_upload_parallel_fail_on_interaction(self):
         """Upload 2 packages in parallel and fail because non_interactive forced"""
 
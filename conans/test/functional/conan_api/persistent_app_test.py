@@ -0,0 +1,69 @@
+import os
+import textwrap
+import time
+import unittest
+
+from conans.client.conan_api import ConanAPIV1
+from conans.test.utils.mocks import TestBufferConanOutput
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import save
+
+
+class PersistentAppTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_folder = temp_folder()
+        self.api = ConanAPIV1(cache_folder=self.cache_folder, output=TestBufferConanOutput(),
+                              persistent_app=True)
+
+    def test_reused(self):
+        self.api.remote_list()  # The first call initializes the files of the cache
+        self.api.remote_list()
+        app = self.api.app
+        self.api.remote_list()
+        self.assertIs(app, self.api.app)
+        self.assertIs(app.requester, self.api.app.requester)
+
+        # Changes in the configuration of the cache create a new app
+        self.api.config_set("general.request_timeout", "20")
+        self.api.remote_list()
+        self.assertIsNot(app, self.api.app)
+        app = self.api.app
+        self.api.remote_add("myremote", "http://myremote.url")
+        self.api.remote_list()
+        self.assertIsNot(app, self.api.app)
+
+    def test_not_persistent(self):
+        api = ConanAPIV1(cache_folder=self.cache_folder, output=TestBufferConanOutput())
+        api.remote_list()
+        app = api.app
+        api.remote_list()
+        self.assertIsNot(app, api.app)
+
+    def test_python_requires_updated(self):
+        # The recipes loaded in a call are not reused if they change
+        tmp = temp_folder()
+        pyreq = textwrap.dedent("""
+            from conans import ConanFile
+            message = "%s"
+            class Tool(ConanFile):
+                pass
+            """)
+        consumer = textwrap.dedent("""
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                python_requires = "tool/1.0"
+                def configure(self):
+                    self.output.info("Message: %s" % self.python_requires["tool"].module.message)
+            """)
+        save(os.path.join(tmp, "tool", "conanfile.py"), pyreq % "first")
+        save(os.path.join(tmp, "pkg", "conanfile.py"), consumer)
+        self.api.export(os.path.join(tmp, "tool"), "tool", "1.0", None, None)
+        self.api.create(os.path.join(tmp, "pkg"), "pkg", "1.0")
+        self.assertIn("pkg/1.0: Message: first", self.api.out)
+
+        time.sleep(0.01)
+        save(os.path.join(tmp, "tool", "conanfile.py"), pyreq % "second")
+        self.api.export(os.path.join(tmp, "tool"), "tool", "1.0", None, None)
+        self.api.create(os.path.join(tmp, "pkg"), "pkg", "1.0")
+        self.assertIn("pkg/1.0: Message: second", self.api.out)
@@ -1,10 +1,13 @@
 # coding=utf-8
 
+import json
 import os
+import threading
 import unittest
 
 import six
-from mock import Mock, MagicMock
+from mock import Mock, MagicMock, patch
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
 
 from conans import __version__
 from conans.client.cache.cache import ClientCache
@@ -16,7 +19,7 @@ from conans.errors import ConanException
 from conans.paths import CACERT_FILE
 from conans.test.utils.tools import temp_folder
 from conans.test.utils.mocks import TestBufferConanOutput
-from conans.util.files import normalize
+from conans.util.files import load, normalize
 
 
 class MockRequesterGet(Mock):
@@ -99,3 +102,61 @@ class ConanRequesterHeadersTests(unittest.TestCase):
         requester.get(url="aaa", headers={"User-Agent": "MyUserAgent"})
         headers = mock_http_requester.get.call_args[1]["headers"]
         self.assertEqual("MyUserAgent", headers["User-Agent"])
+
+
+class ConanRequesterConnectionsTests(unittest.TestCase):
+
+    def test_pool_size(self):
+        conan_conf = os.path.join(temp_folder(), "conan.conf")
+        save(conan_conf, "[general]\nparallel_download=64")
+        requester = ConanRequester(ConanClientConfigParser(conan_conf))
+        self.assertEqual(requester._adapter._pool_maxsize, 64)
+
+    def test_connections_reused(self):
+        class KeepAliveHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        try:
+            trace_file = os.path.join(temp_folder(), "trace.log")
+            with environment_append({"CONAN_TRACE_FILE": trace_file}):
+                cache = ClientCache(temp_folder(), TestBufferConanOutput())
+                requester = ConanRequester(cache.config)
+                for _ in range(3):
+                    requester.get("http://127.0.0.1:%d/file" % server.server_port)
+                # The server keeps handling the kept-alive connection until it is closed
+                requester._http_requester.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        calls = [json.loads(line) for line in load(trace_file).splitlines()]
+        self.assertEqual(calls[-1]["connections"], {"opened": 1, "requests": 3})
+
+    def test_connections_not_traced(self):
+        cache = ClientCache(temp_folder(), TestBufferConanOutput())
+        requester = ConanRequester(cache.config, MockRequesterGet())
+        with patch.object(requester, "_connections") as connections:
+            requester.get(url="aaa")
+        self.assertFalse(connections.called)
+
+    def test_connections_evicted_pools(self):
+        requester = ConanRequester(ClientCache(temp_folder(), TestBufferConanOutput()).config)
+        # Evicted by other thread between the listing of the keys and the access to the pool
+        pools = MagicMock()
+        pools.keys.return_value = ["evicted"]
+        pools.__getitem__.side_effect = KeyError
+        requester._adapter.poolmanager.pools = pools
+        self.assertEqual(requester._connections(), {"opened": 0, "requests": 0})
@@ -0,0 +1,67 @@
+import os
+import socket
+import unittest
+
+from nose.plugins.attrib import attr
+from six.moves.http_client import HTTPConnection
+
+from conans.test.utils.server_benchmark import run_benchmark
+from conans.test.utils.server_launcher import TestServerLauncher
+
+
+def _free_port():
+    sock = socket.socket()
+    sock.bind(("localhost", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+@attr('slow')
+class WorkersServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.servers = []
+
+    def tearDown(self):
+        # The workers threads or processes are stopped, and the processes reaped
+        for server in self.servers:
+            server.stop()
+            server.clean()
+
+    def _launch(self, workers_mode):
+        server = TestServerLauncher()
+        server.port = _free_port()
+        server.start(port=server.port, workers_mode=workers_mode, workers=4)
+        self.servers.append(server)
+        return server
+
+    def _check_server(self, server):
+        connection = HTTPConnection("localhost", server.port)
+        for _ in range(2):
+            connection.request("GET", "/v1/ping")
+            response = connection.getresponse()
+            response.read()
+            self.assertEqual(response.status, 200)
+            self.assertIsNone(response.getheader("Connection"))
+            if _ == 0:
+                sock = connection.sock
+        # The connection has been kept alive
+        self.assertIs(connection.sock, sock)
+        connection.request("GET", "/v1/ping", headers={"Connection": "close"})
+        response = connection.getresponse()
+        response.read()
+        self.assertEqual(response.getheader("Connection"), "close")
+        connection.close()
+
+        result = run_benchmark("http://localhost:%s/v1/ping" % server.port, clients=16,
+                               requests_per_client=10)
+        self.assertEqual(result["requests"], 160)
+        self.assertEqual(result["errors"], 0)
+
+    def test_threads(self):
+        self._check_server(self._launch("threads"))
+
+    @unittest.skipUnless(hasattr(os, "fork"), "Requires fork")
+    def test_processes(self):
+        self._check_server(self._launch("processes"))
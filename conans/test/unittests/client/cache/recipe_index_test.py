@@ -0,0 +1,70 @@
+import os
+import unittest
+
+from mock import patch
+
+from conans.client.cache.recipe_index import RecipeIndex
+from conans.model.ref import ConanFileReference
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import rmdir, save
+
+
+class RecipeIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_folder = temp_folder()
+        self.store_folder = os.path.join(self.cache_folder, "data")
+        self.dbfile = os.path.join(self.cache_folder, ".recipes.db")
+
+    def test_build_from_storage(self):
+        save(os.path.join(self.store_folder, "pkg/1.0/user/channel/export/conanfile.py"), "")
+        save(os.path.join(self.store_folder, "pkg/2.0/_/_/export/conanfile.py"), "")
+        index = RecipeIndex(self.dbfile, self.store_folder)
+
+        # The database doesn't exist, it is created from the storage folder
+        self.assertEqual(sorted(index.refs()),
+                         [ConanFileReference.loads("pkg/1.0@user/channel"),
+                          ConanFileReference.loads("pkg/2.0")])
+        self.assertTrue(os.path.isfile(self.dbfile))
+
+        # Recipes added or removed directly in the storage make the index stale
+        save(os.path.join(self.store_folder, "other/1.0/user/channel/export/conanfile.py"), "")
+        self.assertEqual(len(index.refs()), 3)
+        save(os.path.join(self.store_folder, "pkg/3.0/user/channel/export/conanfile.py"), "")
+        self.assertEqual(len(index.refs("pkg")), 3)
+        rmdir(os.path.join(self.store_folder, "other"))
+        self.assertEqual(len(index.refs()), 3)
+        self.assertEqual(index.rebuild(), 3)
+
+    def test_add_not_stale(self):
+        save(os.path.join(self.store_folder, "pkg/1.0/user/channel/export/conanfile.py"), "")
+        index = RecipeIndex(self.dbfile, self.store_folder)
+        self.assertEqual(len(index.refs()), 1)
+
+        # The storage changes done by the operations that update the index don't rebuild it
+        save(os.path.join(self.store_folder, "pkg/2.0/user/channel/export/conanfile.py"), "")
+        index.add(ConanFileReference.loads("pkg/2.0@user/channel"))
+        with patch.object(index, "rebuild") as rebuild:
+            self.assertEqual(len(index.refs()), 2)
+            rmdir(os.path.join(self.store_folder, "pkg", "2.0"))
+            index.remove(ConanFileReference.loads("pkg/2.0@user/channel"))
+            self.assertEqual(index.refs(), [ConanFileReference.loads("pkg/1.0@user/channel")])
+            self.assertFalse(rebuild.called)
+
+    def test_add_remove(self):
+        index = RecipeIndex(self.dbfile, self.store_folder)
+        self.assertEqual(index.refs(), [])
+
+        ref = ConanFileReference.loads("pkg/1.0@user/channel#myrevision")
+        index.add(ref)
+        index.add(ref)
+        index.add(ConanFileReference.loads("Pkg/1.1@user/channel"))
+        index.add(ConanFileReference.loads("other/1.0"))
+        self.assertEqual(len(index.refs()), 3)
+        self.assertEqual(sorted(index.refs("pkg")),
+                         [ConanFileReference.loads("Pkg/1.1@user/channel"),
+                          ConanFileReference.loads("pkg/1.0@user/channel")])
+        self.assertEqual(index.refs("other"), [ConanFileReference.loads("other/1.0")])
+
+        index.remove(ref)
+        self.assertEqual(index.refs("pkg"), [ConanFileReference.loads("Pkg/1.1@user/channel")])
@@ -5,7 +5,7 @@ import unittest
 from collections import OrderedDict
 
 import six
-from mock import Mock
+from mock import Mock, patch
 from mock.mock import call
 from parameterized import parameterized
 
@@ -14,12 +14,13 @@ from conans.client.loader import ConanFileLoader, ConanFileTextLoader,\
     _parse_conanfile
 from conans.client.tools.files import chdir
 from conans.errors import ConanException
+from conans.model.manifest import FileTreeManifest
 from conans.model.options import OptionsValues
 from conans.model.profile import Profile
 from conans.model.requires import Requirements
 from conans.model.settings import Settings
 from conans.test.utils.test_files import temp_folder
-from conans.test.utils.tools import test_profile
+from conans.test.utils.tools import GenConanfile, test_profile
 from conans.test.utils.mocks import TestBufferConanOutput
 from conans.util.files import save
 
@@ -62,6 +63,64 @@ class MyTest(ConanFile):
             result.requirements()
             self.assertEqual("MyPkg/0.1@user/channel", str(result.requires))
 
+    def test_cache_parsed_recipes(self):
+        tmp_dir = temp_folder()
+        conanfile_path = os.path.join(tmp_dir, "conanfile.py")
+        save(conanfile_path, str(GenConanfile().with_name("pkg").with_version("0.1")))
+        manifest = FileTreeManifest.create(tmp_dir)
+        manifest.save(tmp_dir)
+
+        loader = ConanFileLoader(None, TestBufferConanOutput(), ConanPythonRequire(None, None))
+        conanfile = loader.load_basic(conanfile_path)
+        self.assertEqual(conanfile.version, "0.1")
+        self.assertEqual(loader.parses_avoided, 0)
+        loader.load_basic(conanfile_path)
+        self.assertEqual(loader.parses_avoided, 1)
+
+        # Other loader (a new ConanApp) reuses the already imported recipe
+        other_loader = ConanFileLoader(None, TestBufferConanOutput(),
+                                       ConanPythonRequire(None, None))
+        self.assertIs(type(other_loader.load_basic(conanfile_path)), type(conanfile))
+        self.assertEqual(other_loader.parses_avoided, 1)
+
+        # A new revision of the recipe is parsed again by both
+        save(conanfile_path, str(GenConanfile().with_name("pkg").with_version("0.2")))
+        manifest = FileTreeManifest.create(tmp_dir)
+        manifest.time += 1
+        manifest.save(tmp_dir)
+        self.assertEqual(loader.load_basic(conanfile_path).version, "0.2")
+        self.assertEqual(other_loader.load_basic(conanfile_path).version, "0.2")
+        self.assertEqual(loader.parses_avoided, 1)
+        self.assertEqual(other_loader.parses_avoided, 2)
+
+    def test_cache_parsed_recipes_bounded(self):
+        conanfile_paths = []
+        for version in ("0.1", "0.2", "0.3"):
+            tmp_dir = temp_folder()
+            conanfile_paths.append(os.path.join(tmp_dir, "conanfile.py"))
+            save(conanfile_paths[-1], str(GenConanfile().with_name("pkg").with_version(version)))
+            FileTreeManifest.create(tmp_dir).save(tmp_dir)
+
+        def new_loader():
+            return ConanFileLoader(None, TestBufferConanOutput(), ConanPythonRequire(None, None))
+
+        with patch("conans.client.loader._parsed_modules", OrderedDict()), \
+                patch("conans.client.loader._PARSED_MODULES_MAX", 2):
+            loader = new_loader()
+            loader.load_basic(conanfile_paths[0])
+            loader.load_basic(conanfile_paths[1])
+            loader = new_loader()
+            loader.load_basic(conanfile_paths[0])
+            self.assertEqual(loader.parses_avoided, 1)
+            # The least recently used one is evicted
+            loader.load_basic(conanfile_paths[2])
+            loader = new_loader()
+            loader.load_basic(conanfile_paths[0])
+            loader.load_basic(conanfile_paths[2])
+            self.assertEqual(loader.parses_avoided, 2)
+            loader.load_basic(conanfile_paths[1])
+            self.assertEqual(loader.parses_avoided, 2)
+
     def test_package_settings(self):
         # CREATE A CONANFILE TO LOAD
         tmp_dir = temp_folder()
@@ -34,20 +34,26 @@ class MockRequester(object):
     retry = 0
     retry_wait = 0
 
-    def __init__(self, data, chunk_size=None, accept_ranges=True, echo_header=None):
+    def __init__(self, data, chunk_size=None, accept_ranges=True, echo_header=None, etag=None):
         self._data = data
         self._chunk_size = chunk_size if chunk_size is not None else len(data)
         self._accept_ranges = accept_ranges
         self._echo_header = echo_header.copy() if echo_header else {}
+        self._etag = etag
+        self.if_range = []
 
     def get(self, *_args, **kwargs):
         start = 0
         headers = kwargs.get("headers") or {}
         transfer_range = headers.get("range", "")
         match = re.match(r"bytes=([0-9]+)-", transfer_range)
+        if_range = headers.get("If-Range")
+        self.if_range.append(if_range)
         status = 200
         headers = {"Content-Length": len(self._data), "Accept-Ranges": "bytes"}
-        if match and self._accept_ranges:
+        if self._etag:
+            headers["ETag"] = self._etag
+        if match and self._accept_ranges and (if_range is None or if_range == self._etag):
             start = int(match.groups()[0])
             if start < len(self._data):
                 status = 206
@@ -96,6 +102,33 @@ class DownloaderUnitTest(unittest.TestCase):
         actual_content = load(self.target, binary=True)
         self.assertEqual(expected_content, actual_content)
 
+    def test_resume_download_with_etag(self):
+        expected_content = b"some data"
+        requester = MockRequester(expected_content, chunk_size=4, etag='"1234"')
+        downloader = FileDownloader(requester=requester, output=self.out, verify=None,
+                                    config=_ConfigMock())
+        downloader.download("fake_url", file_path=self.target)
+        self.assertEqual(expected_content, load(self.target, binary=True))
+        self.assertEqual(requester.if_range, [None, '"1234"', '"1234"'])
+
+    def test_restart_download_if_changed_while_resuming(self):
+        expected_content = b"some data"
+        requester = MockRequester(expected_content, chunk_size=4, etag='"1234"')
+        downloader = FileDownloader(requester=requester, output=self.out, verify=None,
+                                    config=_ConfigMock())
+        # The file changes after the first part, the next requests get the whole new file
+        original_get = requester.get
+
+        def get(*args, **kwargs):
+            response = original_get(*args, **kwargs)
+            requester._etag = '"5678"'
+            requester._chunk_size = len(expected_content)
+            return response
+        requester.get = get
+        downloader.download("fake_url", file_path=self.target)
+        self.assertEqual(expected_content, load(self.target, binary=True))
+        self.assertEqual(requester.if_range, [None, '"1234"'])
+
     def test_fail_download_to_memory_if_interrupted(self):
         expected_content = b"some data"
         requester = MockRequester(expected_content, chunk_size=4)
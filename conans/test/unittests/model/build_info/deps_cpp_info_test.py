@@ -49,3 +49,33 @@ class DepsCppInfoTestCase(unittest.TestCase):
         self.assertIsInstance(info_for_package.get_name("generator"), six.string_types)
         self.assertIsInstance(info_for_package.version, six.string_types)
         self.assertIsInstance(info_for_package.components, dict)
+
+    def test_merge_order(self):
+        # The lazy merge of the values is the same as merging them for every added dependency
+        def merge_lists(seq1, seq2):
+            return [s for s in seq1 if s not in seq2] + seq2
+
+        deps = [(["a", "b", "a"], ["-D1", "-framework", "X"]),
+                (["c", "b"], ["-D2", "-framework", "Y"]),
+                ([], ["-D1"]),
+                (["a", "d", "d"], ["-D3", "-D3"])]
+        deps_cpp_info = DepsCppInfo()
+        deps_cpp_info.libs.append("mylib")
+        expected_libs = ["mylib"]
+        expected_defines = []
+        for i, (libs, defines) in enumerate(deps):
+            cpp_info = CppInfo("pkg%s" % i, "rootpath")
+            cpp_info.libs = libs
+            cpp_info.defines = defines
+            deps_cpp_info.add("pkg%s" % i, DepCppInfo(cpp_info))
+            expected_libs = merge_lists(expected_libs, libs)
+            expected_defines = merge_lists(defines, expected_defines)
+            if i == 1:  # Read in the middle, the merged values are kept
+                self.assertEqual(expected_libs, deps_cpp_info.libs)
+                deps_cpp_info.defines.append("-DMY")
+                expected_defines.append("-DMY")
+
+        self.assertEqual(["mylib", "c", "b", "a", "d", "d"], deps_cpp_info.libs)
+        self.assertEqual(expected_libs, deps_cpp_info.libs)
+        self.assertEqual(expected_defines, deps_cpp_info.defines)
+        self.assertIs(deps_cpp_info.libs, deps_cpp_info.libs)
@@ -7,8 +7,8 @@ from conans.model.build_info import DepsCppInfo
 from conans.model.env_info import DepsEnvInfo, EnvInfo
 from conans.model.user_info import DepsUserInfo
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import mkdir
-from conans.model.build_info import CppInfo, DepCppInfo
+from conans.util.files import mkdir, save
+from conans.model.build_info import CppInfo, DepCppInfo, DirsCache
 
 
 class BuildInfoTest(unittest.TestCase):
@@ -203,6 +203,33 @@ VAR2=23
         self.assertListEqual(list(info.lib_paths), [os.path.join(folder, "lib"), abs_lib])
         self.assertListEqual(list(info.bin_paths), [abs_bin, os.path.join(folder, "local_bindir")])
 
+    def test_cpp_info_dirs_cache(self):
+        folder = temp_folder()
+        mkdir(os.path.join(folder, "include", "comp"))
+        mkdir(os.path.join(folder, "lib"))
+        save(os.path.join(folder, "bin"), "")  # Not a directory
+        dirs_cache = DirsCache()
+        info = CppInfo("", folder, dirs_cache)
+        info.includedirs.append("Include")
+        info.components["comp"].includedirs = ["include/comp", "include/other"]
+        self.assertListEqual(info.include_paths, [os.path.join(folder, "include")] +
+                             ([os.path.join(folder, "Include")]
+                              if os.path.isdir(os.path.join(folder, "Include")) else []))
+        self.assertListEqual(info.lib_paths, [os.path.join(folder, "lib")])
+        self.assertListEqual(info.bin_paths, [])
+        self.assertListEqual(info.components["comp"].include_paths,
+                             [os.path.join(folder, "include", "comp")])
+
+        # The folders are listed once, until they are invalidated
+        mkdir(os.path.join(folder, "res"))
+        mkdir(os.path.join(folder, "include", "other"))
+        self.assertFalse(dirs_cache.isdir(os.path.join(folder, "res")))
+        self.assertFalse(dirs_cache.isdir(os.path.join(folder, "include", "other")))
+        dirs_cache.invalidate(folder)
+        self.assertTrue(dirs_cache.isdir(os.path.join(folder, "res")))
+        self.assertTrue(dirs_cache.isdir(os.path.join(folder, "include", "other")))
+        self.assertFalse(dirs_cache.isdir(os.path.join(folder, "missing", "include")))
+
     def test_cpp_info_system_libs(self):
         info1 = CppInfo("dep1", "folder1")
         info1.system_libs = ["sysdep1"]
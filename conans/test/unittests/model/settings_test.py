@@ -306,6 +306,31 @@ os: [Windows, Linux]
         self.sut.values_list = [("compiler.arch.speed", "A")]
         self.assertEqual(self.sut.compiler.arch.speed, "A")
 
+    def test_copy(self):
+        self.sut.compiler = "gcc"
+        copy = self.sut.copy()
+        copy.constraint({"compiler": {"gcc": {"version": ["4.9"], "arch": None}}})
+        copy.compiler.arch = "x64"
+        copy.compiler.arch.speed = "D"
+        del copy.compiler.version
+        # The original is not modified by the copy
+        self.assertEqual(self.sut.fields, ["compiler", "os"])
+        self.assertEqual(self.sut.compiler.version.values_range, ["4.8", "4.9"])
+        self.assertEqual(self.sut.compiler.values_range, ["Visual Studio", "gcc"])
+        self.assertEqual(self.sut.values_list, [("compiler", "gcc")])
+        self.assertEqual(copy.values_list, [("compiler", "gcc"), ("compiler.arch", "x64"),
+                                            ("compiler.arch.speed", "D")])
+
+        # Neither the copy by the original
+        self.sut.compiler = "Visual Studio"
+        self.sut.compiler.remove("gcc")
+        self.sut.compiler.runtime = "MT"
+        self.assertEqual(copy.compiler.values_range, ["gcc"])
+        self.assertEqual(copy.values_list, [("compiler", "gcc"), ("compiler.arch", "x64"),
+                                            ("compiler.arch.speed", "D")])
+        self.assertEqual(self.sut.copy().values_list, [("compiler", "Visual Studio"),
+                                                       ("compiler.runtime", "MT")])
+
     def test_constraint(self):
         s2 = {"os": None}
         self.sut.constraint(s2)
@@ -1,10 +1,12 @@
 import os
 import unittest
 
+from mock import patch
+
 from conans.client.cache.cache import ClientCache
 from conans.client.tools import chdir
 from conans.model.info import ConanInfo
-from conans.model.ref import ConanFileReference
+from conans.model.ref import ConanFileReference, PackageReference
 from conans.paths import (BUILD_FOLDER, CONANINFO, EXPORT_FOLDER, PACKAGES_FOLDER)
 from conans.search.search import search_packages, search_recipes
 from conans.test.utils.test_files import temp_folder
@@ -37,6 +39,34 @@ class SearchTest(unittest.TestCase):
             all_artif = [_artif for _artif in sorted(packages)]
             self.assertEqual(all_artif, artifacts)
 
+    def test_binaries_index(self):
+        ref = ConanFileReference.loads("opencv/2.4.10@lasote/testing")
+        layout = self.cache.package_layout(ref)
+        for package_id, os_ in (("a", "Linux"), ("b", "Windows")):
+            save(os.path.join(layout.packages(), package_id, CONANINFO),
+                 "[settings]\nos=%s\n[options]" % os_)
+
+        packages = search_packages(layout, "os=Linux")
+        self.assertEqual(list(packages), ["a"])
+        self.assertEqual(sorted(layout.load_binaries_index()), ["a", "b"])
+
+        # The indexed binaries don't parse their conaninfo.txt again
+        with patch("conans.search.search.ConanInfo.loads") as loads:
+            packages = search_packages(layout, None)
+        self.assertEqual(sorted(packages), ["a", "b"])
+        self.assertEqual(packages["b"]["settings"], {"os": "Windows"})
+        self.assertFalse(loads.called)
+
+        # Replaced and new binaries are indexed in the next search
+        layout.package_remove(PackageReference(ref, "b"))
+        self.assertEqual(sorted(layout.load_binaries_index()), ["a"])
+        for package_id, os_ in (("b", "Macos"), ("c", "Windows")):
+            save(os.path.join(layout.packages(), package_id, CONANINFO),
+                 "[settings]\nos=%s\n[options]" % os_)
+        packages = search_packages(layout, "os=Windows")
+        self.assertEqual(list(packages), ["c"])
+        self.assertEqual(sorted(layout.load_binaries_index()), ["a", "b", "c"])
+
     def test_pattern(self):
         with chdir(self.cache.store):
             references = ["opencv/2.4.%s@lasote/testing" % ref for ref in ("1", "2", "3")]
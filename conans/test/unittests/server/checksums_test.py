@@ -0,0 +1,67 @@
+import os
+import unittest
+from datetime import timedelta
+
+from mock import patch
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.server.crypto.jwt.jwt_updown_manager import JWTUpDownAuthManager
+from conans.server.store import checksums
+from conans.server.store.checksums import load_checksums, save_checksums
+from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.server.store.server_store import ServerStore
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import md5sum, save, sha1sum, sha256sum
+
+
+class ChecksumsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = temp_folder()
+        self.path = os.path.join(self.store, "pkg", "1.0", "user", "channel", "rrev1", "package",
+                                 "id", "prev1", "conan_package.tgz")
+        save(self.path, "contents")
+
+    def _expected(self):
+        return {"md5": md5sum(self.path), "sha1": sha1sum(self.path),
+                "sha256": sha256sum(self.path)}
+
+    def test_computed_once(self):
+        self.assertEqual(save_checksums(self.store, self.path), self._expected())
+        with patch.object(checksums, "file_checksums") as file_checksums:
+            self.assertEqual(load_checksums(self.store, self.path), self._expected())
+        self.assertFalse(file_checksums.called)
+
+        # The file changes without the server, they are computed again
+        save(self.path, "other contents")
+        self.assertEqual(load_checksums(self.store, self.path), self._expected())
+
+    def test_server_store(self):
+        adapter = ServerDiskAdapter("http://url", self.store,
+                                    JWTUpDownAuthManager("secret", timedelta(seconds=200)))
+        server_store = ServerStore(adapter)
+        ref = ConanFileReference.loads("pkg/1.0@user/channel#rrev1")
+        path = os.path.join(server_store.export(ref), "conanfile.py")
+        save(path, "contents")
+        save_checksums(self.store, path)
+        # Out of the export folder, that is listed and downloaded
+        self.assertEqual(os.listdir(server_store.export(ref)), ["conanfile.py"])
+        checksums_export = os.path.join(server_store.base_folder(ref), ".checksums", "export")
+        self.assertEqual(os.listdir(checksums_export), ["conanfile.py.json"])
+
+        self.assertEqual(server_store.get_recipe_file_list(ref), ["conanfile.py"])
+        self.assertEqual(server_store.get_recipe_snapshot(ref),
+                         {"conanfile.py": self._expected()["md5"]})
+        self.assertEqual(server_store.get_recipe_file_checksums(ref),
+                         {"conanfile.py": self._expected()})
+
+        server_store.remove_conanfile_files(ref, ["conanfile.py"])
+        self.assertEqual(os.listdir(checksums_export), [])
+
+        pref = PackageReference(ref, "id", "prev1")
+        server_store.update_last_package_revision(pref)
+        self.assertEqual(server_store.get_package_file_checksums(pref),
+                         {"conan_package.tgz": self._expected()})
+        server_store.remove_packages(ref, [])
+        self.assertFalse(os.path.exists(os.path.join(server_store.base_folder(ref), ".checksums",
+                                                     "package")))
@@ -20,6 +20,8 @@ ssl_enabled: true
 port: 9220
 host_name: localhost
 public_port: 12345
+workers_mode: processes
+workers: 4
 
 
 [write_permissions]
@@ -87,6 +89,10 @@ text=value
         self.assertEqual(config.host_name, "localhost")
         self.assertEqual(config.public_port, 12345)
         self.assertEqual(config.public_url, "https://localhost:12345/v1")
+        self.assertEqual(config.workers_mode, "processes")
+        self.assertEqual(config.workers, 4)
+        self.assertIsNone(config.keep_alive_timeout)
+        self.assertFalse(config.search_index)
 
         # Now check with environments
         tmp_storage = temp_folder()
@@ -98,6 +104,10 @@ text=value
         self.environ["CONAN_SERVER_USERS"] = "lasote:lasotepass,pepe2:pepepass2"
         self.environ["CONAN_HOST_NAME"] = "remotehost"
         self.environ["CONAN_SERVER_PUBLIC_PORT"] = "33333"
+        self.environ["CONAN_SERVER_WORKERS_MODE"] = "threads"
+        self.environ["CONAN_SERVER_WORKERS"] = "16"
+        self.environ["CONAN_SERVER_KEEP_ALIVE_TIMEOUT"] = "5"
+        self.environ["CONAN_SERVER_SEARCH_INDEX"] = "True"
 
         config = ConanServerConfigParser(self.file_path, environment=self.environ)
         self.assertEqual(config.jwt_secret,  "newkey")
@@ -112,3 +122,12 @@ text=value
         self.assertEqual(config.host_name, "remotehost")
         self.assertEqual(config.public_port, 33333)
         self.assertEqual(config.public_url, "http://remotehost:33333/v1")
+        self.assertEqual(config.workers_mode, "threads")
+        self.assertEqual(config.workers, 16)
+        self.assertEqual(config.keep_alive_timeout, 5)
+        self.assertTrue(config.search_index)
+
+        self.environ["CONAN_SERVER_WORKERS_MODE"] = "fibers"
+        config = ConanServerConfigParser(self.file_path, environment=self.environ)
+        with six.assertRaisesRegex(self, ConanException, "Invalid 'workers_mode' value 'fibers'"):
+            config.workers_mode
@@ -1,10 +1,19 @@
+import os
+from datetime import timedelta
 from math import floor
 
 import time
 import unittest
 
+from conans.model.ref import ConanFileReference
+from conans.server.crypto.jwt.jwt_updown_manager import JWTUpDownAuthManager
 from conans.server.revision_list import RevisionList
+from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.server.store.server_store import REVISIONS_FILE, REVISIONS_LOG_FILE, \
+    REVISIONS_LOG_MAX_ENTRIES, ServerStore
+from conans.test.utils.test_files import temp_folder
 from conans.util.dates import from_timestamp_to_iso8601
+from conans.util.files import load, save
 
 
 class RevisionListTest(unittest.TestCase):
@@ -40,3 +49,54 @@ class RevisionListTest(unittest.TestCase):
         r_list = RevisionList.loads(old_contents)
         when = r_list.get_time("rev1")
         self.assertEqual(when, iso)
+
+    def test_log(self):
+        rev = RevisionList()
+        rev.add_revision("rev1")
+        rev.add_revision("rev2")
+        log = "".join(RevisionList.dumps_entry(e) for e in (RevisionList().add_revision("rev3"),
+                                                             RevisionList().add_revision("rev1")))
+        # An interrupted write of the log is ignored
+        loaded = RevisionList.loads(rev.dumps(), log + '{"revision": "rev4", "ti')
+        self.assertEqual([e.revision for e in loaded.as_list()], ["rev1", "rev3", "rev2"])
+
+
+class ServerStoreRevisionsTest(unittest.TestCase):
+
+    def setUp(self):
+        adapter = ServerDiskAdapter("http://url", temp_folder(),
+                                    JWTUpDownAuthManager("secret", timedelta(seconds=200)))
+        self.server_store = ServerStore(adapter)
+        self.ref = ConanFileReference.loads("pkg/1.0@user/channel")
+        self.folder = self.server_store.conan_revisions_root(self.ref)
+
+    def test_append_and_compact(self):
+        for i in range(REVISIONS_LOG_MAX_ENTRIES - 1):
+            self.server_store.update_last_revision(self.ref.copy_with_rev("rev%d" % i))
+            self.server_store.update_last_revision(self.ref.copy_with_rev("rev%d" % i))
+        self.assertFalse(os.path.exists(os.path.join(self.folder, REVISIONS_FILE)))
+        log = load(os.path.join(self.folder, REVISIONS_LOG_FILE))
+        self.assertEqual(len(log.splitlines()), REVISIONS_LOG_MAX_ENTRIES - 1)
+        self.assertEqual(self.server_store.get_last_revision(self.ref).revision,
+                         "rev%d" % (REVISIONS_LOG_MAX_ENTRIES - 2))
+
+        # The log is full, all the revisions are written to the revisions file
+        self.server_store.update_last_revision(self.ref.copy_with_rev("rev0"))
+        self.assertFalse(os.path.exists(os.path.join(self.folder, REVISIONS_LOG_FILE)))
+        revisions = self.server_store.get_recipe_revisions(self.ref)
+        self.assertEqual(len(revisions), REVISIONS_LOG_MAX_ENTRIES - 1)
+        self.assertEqual(revisions[0].revision, "rev0")
+        self.assertEqual(revisions[1].revision, "rev%d" % (REVISIONS_LOG_MAX_ENTRIES - 2))
+
+    def test_remove(self):
+        for revision in ("rev1", "rev2"):
+            ref = self.ref.copy_with_rev(revision)
+            save(os.path.join(self.server_store.export(ref), "conanfile.py"), "")
+            self.server_store.update_last_revision(ref)
+        self.server_store.remove_conanfile(self.ref.copy_with_rev("rev2"))
+        self.assertEqual(self.server_store.get_last_revision(self.ref).revision, "rev1")
+        self.assertFalse(os.path.exists(os.path.join(self.folder, REVISIONS_LOG_FILE)))
+
+        # Modified without the server, the cached revisions are read again
+        save(os.path.join(self.folder, REVISIONS_FILE), '{"revisions": []}')
+        self.assertIsNone(self.server_store.get_last_revision(self.ref))
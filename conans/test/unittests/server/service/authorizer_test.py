@@ -193,3 +193,22 @@ class AuthorizerTest(unittest.TestCase):
         for u in ['user1','user2','user3']:
             authorizer.check_read_conan(u, self.openssl_ref)
 
+    def test_rules_order(self):
+        """The first rule that applies decides, no matter the name of the rules"""
+        read_perms = [("*/*@lasote/testing", "user1"), ("openssl/*@*/*", "user2"),
+                      ("zlib/*@*/*", "user3"), ("*/*@*/*", "*")]
+        authorizer = BasicAuthorizer(read_perms, [])
+        authorizer.check_read_conan("user1", self.openssl_ref)
+        self.assertRaises(ForbiddenException,
+                          authorizer.check_read_conan, "user2", self.openssl_ref)
+        authorizer.check_read_conan("user2", ConanFileReference.loads("openssl/1.0@other/ch"))
+        authorizer.check_read_conan("user3", ConanFileReference.loads("bzip2/1.0@other/ch"))
+
+    def test_permissions_changed(self):
+        authorizer = BasicAuthorizer([("openssl/*@lasote/testing", "pepe")], [])
+        for _ in range(2):  # The second time the result is cached
+            self.assertRaises(ForbiddenException,
+                              authorizer.check_read_conan, "juan", self.openssl_ref)
+        # The new configuration is applied
+        authorizer.read_permissions = [("openssl/*@lasote/testing", "pepe, juan")]
+        authorizer.check_read_conan("juan", self.openssl_ref)
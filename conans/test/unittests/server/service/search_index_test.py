@@ -0,0 +1,111 @@
+import os
+import unittest
+from datetime import timedelta
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import CONANINFO
+from conans.server.crypto.jwt.jwt_updown_manager import JWTUpDownAuthManager
+from conans.server.service.authorize import BasicAuthorizer
+from conans.server.service.common.common import CommonService
+from conans.server.service.common.search import SearchService
+from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.server.store.search_index import SEARCH_INDEX_FILE, SearchIndex
+from conans.server.store.server_store import ServerStore
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import save
+
+
+class SearchIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = temp_folder()
+        authorizer = BasicAuthorizer([("*/*@*/*", "*")], [])
+        updown_auth_manager = JWTUpDownAuthManager("secret", timedelta(seconds=200))
+        adapter = ServerDiskAdapter("http://url", self.tmp_dir, updown_auth_manager)
+        self.search_index = SearchIndex.create(os.path.join(self.tmp_dir, SEARCH_INDEX_FILE))
+        self.server_store = ServerStore(adapter, self.search_index)
+        self.search_service = SearchService(authorizer, self.server_store, "lasote")
+
+        self.ref = ConanFileReference.loads("openssl/2.0.3@lasote/testing#rrev1")
+        self.pref = PackageReference(self.ref, "123123123", "prev1")
+
+    def _upload_recipe(self, ref):
+        save(os.path.join(self.server_store.export(ref), "conanfile.py"), "")
+        self.server_store.update_last_revision(ref)
+
+    def _upload_package(self, pref, use_qt):
+        save(os.path.join(self.server_store.package(pref), CONANINFO),
+             "[options]\n    use_Qt=%s\n" % use_qt)
+        self.server_store.update_last_package_revision(pref)
+
+    def _options(self, ref):
+        info = self.search_service.search_packages(ref, None)
+        return {package_id: values["options"] for package_id, values in info.items()}
+
+    def test_search(self):
+        ref2 = ConanFileReference.loads("Assimp/1.10@fenix/stable#rrev1")
+        ref3 = ConanFileReference.loads("zlib/1.2.11#rrev1")
+        for ref in (self.ref, ref2, ref3):
+            self._upload_recipe(ref)
+        self._upload_package(self.pref, "True")
+
+        self.assertEqual(self.search_service.search(),
+                         [r.copy_clear_rev() for r in (ref2, self.ref, ref3)])
+        self.assertEqual(self.search_service.search(pattern="assimp*"), [ref2.copy_clear_rev()])
+        self.assertEqual(self.search_service.search(pattern="zlib/*"), [ref3.copy_clear_rev()])
+        self.assertEqual(self._options(self.ref), {"123123123": {"use_Qt": "True"}})
+
+        # Without the storage, the index knows the recipes
+        os.rename(os.path.join(self.tmp_dir, "zlib"), os.path.join(self.tmp_dir, "moved"))
+        self.assertIn(ref3.copy_clear_rev(), self.search_service.search())
+
+    def test_package_info_changes(self):
+        self._upload_recipe(self.ref)
+        self._upload_package(self.pref, "True")
+        self.assertEqual(self._options(self.ref), {"123123123": {"use_Qt": "True"}})
+        self.assertIsNotNone(self.search_index.packages(self.ref)["123123123"][2])
+
+        # A new package revision
+        self._upload_package(self.pref.copy_with_revs("rrev1", "prev2"), "False")
+        self.assertEqual(self._options(self.ref), {"123123123": {"use_Qt": "False"}})
+
+        # Modified without the server (the size changes)
+        save(os.path.join(self.server_store.package(self.pref.copy_with_revs("rrev1", "prev2")),
+                          CONANINFO), "[options]\n    use_Qt=Other\n")
+        self.assertEqual(self._options(self.ref), {"123123123": {"use_Qt": "Other"}})
+
+    def test_remove(self):
+        ref2 = self.ref.copy_with_rev("rrev2")
+        self._upload_recipe(self.ref)
+        self._upload_recipe(ref2)
+        self._upload_package(self.pref, "True")
+        self._upload_package(self.pref.copy_with_revs("rrev1", "prev2"), "False")
+        self._upload_package(PackageReference(self.ref, "456", "prev1"), "True")
+        service = CommonService()
+        service._server_store = self.server_store
+
+        # The previous package revision is the latest again
+        self.server_store.remove_package(self.pref.copy_with_revs("rrev1", "prev2"))
+        self.assertEqual(self._options(self.ref), {"123123123": {"use_Qt": "True"},
+                                                   "456": {"use_Qt": "True"}})
+        self.server_store.remove_packages(self.ref, ["456"])
+        self.assertEqual(list(self._options(self.ref)), ["123123123"])
+        self.server_store.remove_all_packages(self.ref)
+        self.assertEqual(self._options(self.ref), {})
+
+        self.server_store.remove_conanfile(self.ref)
+        self.assertEqual(self.search_index.recipe_revisions(), [ref2])
+        self.server_store.remove_conanfile(self.ref.copy_clear_rev())
+        self.assertEqual(self.search_service.search(), [])
+
+    def test_rebuild(self):
+        self._upload_recipe(self.ref)
+        self._upload_package(self.pref, "True")
+        # Storage restored from somewhere else
+        self.search_index.remove_recipe(self.ref.copy_clear_rev())
+        self.assertEqual(self.search_service.search(), [])
+
+        self.assertEqual(self.search_index.rebuild(self.server_store), (1, 1))
+        self.assertEqual(self.search_service.search(), [self.ref.copy_clear_rev()])
+        self.assertEqual(self.search_index.packages(self.ref)["123123123"][0], "prev1")
+        self.assertEqual(self._options(self.ref), {"123123123": {"use_Qt": "True"}})
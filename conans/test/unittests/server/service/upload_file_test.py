@@ -0,0 +1,53 @@
+import os
+import unittest
+from io import BytesIO
+
+from conans.errors import RequestErrorException
+from conans.server.service.upload_file import _BodyReader, expected_checksums, save_upload
+from conans.server.store.checksums import checksums_folder, load_checksums
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, sha1sum, save
+
+
+class SaveUploadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = temp_folder()
+        self.folder = os.path.join(self.store, "pkg", "1.0", "user", "channel", "rrev1", "package",
+                                   "id", "prev1")
+        self.path = os.path.join(self.folder, "conan_package.tgz")
+        self.contents = b"contents" * 100000
+        save(self.path, self.contents)
+        self.sha1 = sha1sum(self.path)
+        os.remove(self.path)
+
+    def _checksums_files(self):
+        return os.listdir(checksums_folder(self.store, self.folder))
+
+    def test_upload(self):
+        checksums = expected_checksums({"X-Checksum-Sha1": self.sha1.upper()})
+        self.assertEqual(checksums, {"sha1": self.sha1})
+        save_upload(BytesIO(self.contents), self.store, self.path, checksums)
+        self.assertEqual(load(self.path, binary=True), self.contents)
+        self.assertEqual(load_checksums(self.store, self.path)["sha1"], self.sha1)
+        self.assertEqual(self._checksums_files(), ["conan_package.tgz.json"])
+        self.assertEqual(os.listdir(self.folder), ["conan_package.tgz"])
+
+    def test_checksum_mismatch(self):
+        save(self.path, "previous")
+        with self.assertRaisesRegexp(RequestErrorException, "The sha1 checksum of the uploaded "
+                                                            "file 'conan_package.tgz' doesn't match"):
+            save_upload(BytesIO(self.contents[1:]), self.store, self.path, {"sha1": self.sha1})
+        self.assertEqual(load(self.path), "previous")
+        self.assertEqual(self._checksums_files(), [])
+
+    def test_incomplete_body(self):
+        body = _BodyReader(BytesIO(self.contents[:1000]), len(self.contents))
+        with self.assertRaisesRegexp(RequestErrorException, "Incomplete upload"):
+            save_upload(body, self.store, self.path)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(self._checksums_files(), [])
+
+        body = _BodyReader(BytesIO(self.contents + b"more"), len(self.contents))
+        save_upload(body, self.store, self.path)
+        self.assertEqual(load(self.path, binary=True), self.contents)
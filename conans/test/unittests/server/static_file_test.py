@@ -0,0 +1,70 @@
+import os
+import unittest
+
+from bottle import request
+
+from conans.server.service.static_file import file_etag, static_file
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import save
+
+
+class StaticFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(temp_folder(), "conan_package.tgz")
+        save(self.path, "0123456789")
+        self.etag = file_etag(os.stat(self.path))
+
+    def _get(self, **headers):
+        environ = {"REQUEST_METHOD": "GET"}
+        environ.update({"HTTP_%s" % name.upper(): value for name, value in headers.items()})
+        request.bind(environ)
+        response = static_file(self.path, mimetype="application/octet-stream")
+        body = response.body.read() if hasattr(response.body, "read") else response.body
+        if hasattr(response.body, "close"):
+            response.body.close()
+        return response, body
+
+    def test_whole_file(self):
+        response, body = self._get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body, b"0123456789")
+        self.assertEqual(response.headers["ETag"], self.etag)
+        self.assertEqual(response.headers["Accept-Ranges"], "bytes")
+        self.assertEqual(response.headers["Content-Length"], "10")
+
+    def test_range(self):
+        response, body = self._get(range="bytes=4-")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(body, b"456789")
+        self.assertEqual(response.headers["Content-Range"], "bytes 4-9/10")
+        self.assertEqual(response.headers["Content-Length"], "6")
+
+        response, body = self._get(range="bytes=2-4", if_range=self.etag)
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(body, b"234")
+
+    def test_range_of_changed_file(self):
+        response, body = self._get(range="bytes=4-", if_range='"other-etag"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body, b"0123456789")
+        self.assertNotIn("Content-Range", response.headers)
+
+    def test_invalid_range(self):
+        response, _ = self._get(range="bytes=20-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response.headers["Content-Range"], "bytes */10")
+
+    def test_not_modified(self):
+        response, body = self._get(if_none_match=self.etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(body)
+
+        response, body = self._get(if_none_match='"other-etag"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body, b"0123456789")
+
+    def test_not_found(self):
+        os.remove(self.path)
+        response, _ = self._get()
+        self.assertEqual(response.status_code, 404)
@@ -4,11 +4,12 @@ import os
 import platform
 import tarfile
 import unittest
+from io import BytesIO
 
 from conans.client.tools.files import chdir
 from conans.model.manifest import gather_files
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import tar_extract, gzopen_without_timestamps, save
+from conans.util.files import tar_extract, gzopen_without_timestamps, load, save
 
 
 class TarExtractTest(unittest.TestCase):
@@ -61,3 +62,66 @@ class TarExtractTest(unittest.TestCase):
             with open(self.tgz_file, 'rb') as file_handler:
                 tar_extract(file_handler, destination_dir)
             check_files(destination_dir)
+
+    @unittest.skipIf(platform.system() == "Windows", "Symlinks and permissions")
+    def test_members(self):
+        tgz_file = os.path.join(self.tmp_folder, "members.tgz")
+        with open(tgz_file, "wb") as tgz_handle:
+            tgz = gzopen_without_timestamps("name", mode="w", fileobj=tgz_handle)
+
+            def add(name, contents=b"", **attrs):
+                info = tarfile.TarInfo(name=name)
+                info.size = len(contents)
+                for k, v in attrs.items():
+                    setattr(info, k, v)
+                tgz.addfile(tarinfo=info, fileobj=BytesIO(contents))
+
+            add("include", type=tarfile.DIRTYPE, mode=0o755)
+            add("include/header.h", b"header", mode=0o644, mtime=1000)
+            add("bin/exe", b"exe", mode=0o755)
+            add("big/file", b"big" * 1024 * 1024)
+            add("lib/liba.so.1", b"lib")
+            add("lib/liba.so", type=tarfile.SYMTYPE, linkname="liba.so.1")
+            add("windows\\path\\file.txt", b"windows")
+            add("../outside.txt", b"bad")
+            add("/absolute.txt", b"bad")
+            add("evil", type=tarfile.SYMTYPE, linkname=self.tmp_folder)
+            add("evil/outside.txt", b"bad")
+            add("include/header.h", b"header2", mode=0o644, mtime=1000)
+            tgz.close()
+
+        destination_dir = os.path.join(self.tmp_folder, "dest")
+        with open(tgz_file, "rb") as file_handler:
+            tar_extract(file_handler, destination_dir, threads=4)
+
+        self.assertEqual(load(os.path.join(destination_dir, "include/header.h")), "header2")
+        self.assertEqual(os.path.getmtime(os.path.join(destination_dir, "include/header.h")),
+                         1000)
+        self.assertTrue(os.access(os.path.join(destination_dir, "bin/exe"), os.X_OK))
+        self.assertEqual(len(load(os.path.join(destination_dir, "big/file"))), 3 * 1024 * 1024)
+        self.assertEqual(os.readlink(os.path.join(destination_dir, "lib/liba.so")), "liba.so.1")
+        self.assertEqual(load(os.path.join(destination_dir, "lib/liba.so")), "lib")
+        self.assertEqual(load(os.path.join(destination_dir, "windows/path/file.txt")), "windows")
+        self.assertFalse(os.path.exists(os.path.join(self.tmp_folder, "outside.txt")))
+        self.assertFalse(os.path.exists(os.path.join(destination_dir, "absolute.txt")))
+
+    def test_many_files(self):
+        # Many small files, as the ones of big libraries headers, written by the threads pool
+        ori_folder = os.path.join(self.tmp_folder, "many")
+        for i in range(2000):
+            save(os.path.join(ori_folder, "include", "folder%d" % (i % 50), "header%d.h" % i),
+                 "#define HEADER%d %s\n" % (i, "x" * (i % 2000)))
+        tgz_file = os.path.join(self.tmp_folder, "many.tgz")
+        with open(tgz_file, "wb") as tgz_handle:
+            tgz = gzopen_without_timestamps("name", mode="w", fileobj=tgz_handle)
+            tgz.add(ori_folder, arcname=".")
+            tgz.close()
+
+        destination_dir = os.path.join(self.tmp_folder, "dest")
+        with open(tgz_file, "rb") as file_handler:
+            tar_extract(file_handler, destination_dir, threads=4)
+
+        files, _ = gather_files(ori_folder)
+        self.assertEqual(sorted(gather_files(destination_dir)[0]), sorted(files))
+        for relative, abs_path in files.items():
+            self.assertEqual(load(os.path.join(destination_dir, relative)), load(abs_path))
@@ -0,0 +1,70 @@
+import os
+import platform
+import threading
+import time
+import unittest
+
+from conans.test.utils.mocks import TestBufferConanOutput
+from conans.test.utils.test_files import temp_folder
+from conans.util.locks import FcntlReadLock, FcntlWriteLock, Lock
+
+
+@unittest.skipIf(platform.system() == "Windows", "fcntl locks not available in Windows")
+class FcntlLocksTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = os.path.join(temp_folder(), "pkg", "1.0", "user", "channel")
+        self.output = TestBufferConanOutput()
+
+    def _lock(self, lock_class):
+        return lock_class(self.folder, "pkg/1.0@user/channel", self.output)
+
+    def _locked_in_thread(self, lock_class, events):
+        def locked():
+            with self._lock(lock_class):
+                events.append("locked")
+
+        thread = threading.Thread(target=locked)
+        thread.start()
+        return thread
+
+    def test_readers_share(self):
+        events = []
+        with self._lock(FcntlReadLock):
+            thread = self._locked_in_thread(FcntlReadLock, events)
+            thread.join(10)
+            self.assertEqual(events, ["locked"])
+        self.assertNotIn("is locked by another concurrent conan process", self.output)
+        self.assertEqual(self._lock(FcntlReadLock).files, (self.folder + ".lock", ))
+
+    def test_writer_waits(self):
+        events = []
+        with self._lock(FcntlReadLock):
+            thread = self._locked_in_thread(FcntlWriteLock, events)
+            time.sleep(0.2)
+            self.assertEqual(events, [])
+            events.append("unlocked")
+        thread.join(10)
+        self.assertEqual(events, ["unlocked", "locked"])
+        self.assertIn("pkg/1.0@user/channel is locked by another concurrent conan process",
+                      self.output)
+
+        events = []
+        with self._lock(FcntlWriteLock):
+            thread = self._locked_in_thread(FcntlReadLock, events)
+            time.sleep(0.2)
+            events.append("unlocked")
+        thread.join(10)
+        self.assertEqual(events, ["unlocked", "locked"])
+
+    def test_lock_file_removed(self):
+        events = []
+        with self._lock(FcntlWriteLock):
+            thread = self._locked_in_thread(FcntlWriteLock, events)
+            time.sleep(0.2)
+            # As "conan remove --locks" does, the waiting lock mustn't keep the removed file
+            Lock.clean(self.folder)
+            self.assertFalse(os.path.exists(self.folder + ".lock"))
+        thread.join(10)
+        self.assertEqual(events, ["locked"])
+        self.assertTrue(os.path.exists(self.folder + ".lock"))
@@ -0,0 +1,66 @@
+import gzip
+import os
+import random
+import tarfile
+import unittest
+
+import six
+
+from conans.client.tools import environment_append
+from conans.errors import ConanException
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import gzopen_without_timestamps, load, save
+from conans.util.parallel_gzip import BLOCK_SIZE, ParallelGzipFile
+
+
+@unittest.skipUnless(six.PY3, "Parallel compression is only used in Python 3")
+class ParallelGzipTest(unittest.TestCase):
+
+    def setUp(self):
+        rand = random.Random(42)
+        words = [b"conan", b"package", b"binary", b"recipe", b"compress", b"\n"]
+        self.data = b" ".join(rand.choice(words) for _ in range(5 * BLOCK_SIZE // 6))
+        self.data += bytes(bytearray(rand.getrandbits(8) for _ in range(BLOCK_SIZE)))
+
+    def _compress(self, threads, chunk_size):
+        filename = os.path.join(temp_folder(), "file.gz")
+        with open(filename, "wb") as f:
+            gz = ParallelGzipFile(filename, f, 9, threads)
+            for i in range(0, len(self.data), chunk_size):
+                gz.write(self.data[i:i + chunk_size])
+            self.assertEqual(gz.tell(), len(self.data))
+            gz.close()
+        with open(filename, "rb") as f:
+            return f.read()
+
+    def test_deterministic(self):
+        compressed = self._compress(threads=4, chunk_size=10000)
+        self.assertEqual(gzip.decompress(compressed), self.data)
+        self.assertEqual(compressed, self._compress(threads=2, chunk_size=BLOCK_SIZE))
+        self.assertEqual(compressed, self._compress(threads=8, chunk_size=len(self.data)))
+
+    def test_empty(self):
+        self.data = b""
+        self.assertEqual(gzip.decompress(self._compress(threads=2, chunk_size=1)), b"")
+
+    def test_tgz(self):
+        tmp = temp_folder()
+        save(os.path.join(tmp, "src", "file.txt"), "contents")
+        tgz = os.path.join(tmp, "conan_package.tgz")
+        with environment_append({"CONAN_COMPRESSION_THREADS": "4"}):
+            with open(tgz, "wb") as tgz_handle:
+                tar = gzopen_without_timestamps("conan_package.tgz", mode="w", fileobj=tgz_handle)
+                tar.add(os.path.join(tmp, "src", "file.txt"), "file.txt")
+                tar.close()
+
+        with tarfile.open(tgz) as tar:
+            tar.extractall(os.path.join(tmp, "dst"))
+        self.assertEqual(load(os.path.join(tmp, "dst", "file.txt")), "contents")
+
+    def test_tgz_invalid_threads(self):
+        tgz = os.path.join(temp_folder(), "conan_package.tgz")
+        with environment_append({"CONAN_COMPRESSION_THREADS": "many"}):
+            with open(tgz, "wb") as tgz_handle:
+                with six.assertRaisesRegex(self, ConanException, "Specify a numeric parameter "
+                                                                 "for 'compression_threads'"):
+                    gzopen_without_timestamps("conan_package.tgz", mode="w", fileobj=tgz_handle)
@@ -0,0 +1,86 @@
+""" Benchmark of the aggregation of the DepsCppInfo of synthetic graphs, like the installer does:
+every package adds the DepCppInfo of all the packages of its closure, and then all the fields
+of the aggregated DepsCppInfo are read, as a generator would do.
+
+    python -m conans.test.utils.deps_cpp_info_benchmark --packages 400 --components 5
+
+The "deep" graph is a chain, every package requires the previous one. In the "wide" graph,
+every package requires the "--width" previous ones
+"""
+import argparse
+import time
+
+from conans.model.build_info import CppInfo, DepCppInfo, DepsCppInfo
+
+_FIELDS = ("system_libs", "include_paths", "lib_paths", "bin_paths", "build_paths", "res_paths",
+           "src_paths", "framework_paths", "build_modules_paths", "libs", "frameworks", "defines",
+           "cxxflags", "cflags", "sharedlinkflags", "exelinkflags", "requires")
+
+
+def _dep_cpp_info(index, components):
+    name = "pkg%s" % index
+    # Paths are not filtered, they don't need to exist
+    cpp_info = CppInfo(name, "/path/to/%s" % name)
+    cpp_info.filter_empty = False
+    cpp_info.defines = ["%s_DEFINE" % name.upper(), "COMMON_DEFINE"]
+    cpp_info.cxxflags = ["-fPIC", "-Wall"]
+    cpp_info.system_libs = ["pthread", "m"]
+    for c in range(components):
+        component = cpp_info.components["comp%s" % c]
+        component.filter_empty = False
+        component.libs = ["%s_comp%s" % (name, c)]
+        component.includedirs = ["include/comp%s" % c]
+        component.defines = ["%s_COMP%s" % (name.upper(), c)]
+        if c:
+            component.requires = ["comp%s" % (c - 1)]
+    return DepCppInfo(cpp_info)
+
+
+def _closures(packages, width):
+    """ The closure of every package of the graph, the packages it depends on, in order
+    """
+    closures = []
+    for index in range(packages):
+        closure = {}
+        for dep in range(max(0, index - width), index):
+            closure[dep] = None
+            for transitive in closures[dep]:
+                closure[transitive] = None
+        closures.append(list(closure))
+    return closures
+
+
+def run_benchmark(packages, components, width):
+    """ returns the time to aggregate and read the DepsCppInfo of all the packages of the graph
+    """
+    dep_cpp_infos = [_dep_cpp_info(i, components) for i in range(packages)]
+    closures = _closures(packages, width)
+    start = time.time()
+    adds = 0
+    for closure in closures:
+        deps_cpp_info = DepsCppInfo()
+        for dep in closure:
+            deps_cpp_info.add("pkg%s" % dep, dep_cpp_infos[dep])
+        adds += len(closure)
+        for field in _FIELDS:
+            getattr(deps_cpp_info, field)
+    return {"adds": adds,
+            "time": time.time() - start}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of the DepsCppInfo aggregation")
+    parser.add_argument("--packages", type=int, default=400, help="Packages of the graph")
+    parser.add_argument("--components", type=int, default=5, help="Components of every package")
+    parser.add_argument("--width", type=int, default=4,
+                        help="Direct requirements of every package of the wide graph")
+    args = parser.parse_args()
+
+    for graph, width in (("deep", 1), ("wide", args.width)):
+        result = run_benchmark(args.packages, args.components, width)
+        print("%s graph: %d packages, %d DepsCppInfo.add() in %.2fs"
+              % (graph, args.packages, result["adds"], result["time"]))
+
+
+if __name__ == "__main__":
+    main()
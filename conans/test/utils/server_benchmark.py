@@ -0,0 +1,96 @@
+""" Benchmark of the conan_server serving modes: N concurrent clients, each one with its own
+keep-alive session, send requests to a server and the requests/s and latencies are reported.
+
+    python -m conans.test.utils.server_benchmark --clients 32 --requests 200 --workers-mode threads
+
+Without --url, a local server is launched in this process with the given serving mode
+"""
+import argparse
+import threading
+import time
+
+import requests
+
+from conans.test.utils.server_launcher import TestServerLauncher
+
+
+def _percentile(sorted_values, percent):
+    index = int(round(percent / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def run_benchmark(url, clients, requests_per_client):
+    """ returns a dict with the results of "clients" threads doing "requests_per_client"
+    GET requests of the url
+    """
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def client():
+        session = requests.Session()
+        client_latencies = []
+        client_errors = 0
+        for _ in range(requests_per_client):
+            start = time.time()
+            try:
+                response = session.get(url)
+                response.content  # noqa, the whole response is part of the latency
+                if not response.ok:
+                    client_errors += 1
+            except requests.RequestException:
+                client_errors += 1
+            client_latencies.append(time.time() - start)
+        with lock:
+            latencies.extend(client_latencies)
+            errors.append(client_errors)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.time() - start
+
+    latencies.sort()
+    return {"requests": len(latencies),
+            "errors": sum(errors),
+            "time": elapsed,
+            "requests_per_second": len(latencies) / elapsed,
+            "p50": _percentile(latencies, 50),
+            "p99": _percentile(latencies, 99),
+            "max": latencies[-1]}
+
+
+def launch_server(workers_mode=None, workers=None):
+    server = TestServerLauncher()
+    server.start(workers_mode=workers_mode, workers=workers)
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of concurrent clients of "
+                                                 "conan_server")
+    parser.add_argument("--url", help="URL to request, by default the ping of a local server")
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=100, help="Requests of every client")
+    parser.add_argument("--workers-mode", choices=["threads", "processes"],
+                        help="Serving mode of the local server, single threaded by default")
+    parser.add_argument("--workers", type=int, help="Workers of the local server")
+    args = parser.parse_args()
+
+    url = args.url
+    if not url:
+        server = launch_server(args.workers_mode, args.workers)
+        url = "http://localhost:%s/v1/ping" % server.port
+    result = run_benchmark(url, args.clients, args.requests)
+    print("%d requests (%d errors) from %d clients in %.2fs"
+          % (result["requests"], result["errors"], args.clients, result["time"]))
+    print("Requests/s: %.1f" % result["requests_per_second"])
+    print("Latency p50: %.2fms, p99: %.2fms, max: %.2fms"
+          % (result["p50"] * 1000, result["p99"] * 1000, result["max"] * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -41,7 +41,8 @@ class TestServerLauncher(object):
                                                    server_config.authorize_timeout)
         base_url = base_url or server_config.public_url
         self.server_store = get_server_store(server_config.disk_storage_path,
-                                             base_url, updown_auth_manager)
+                                             base_url, updown_auth_manager,
+                                             search_index=server_config.search_index)
 
         # Prepare some test users
         if not read_permissions:
@@ -70,7 +71,7 @@ class TestServerLauncher(object):
             self.ra.api_v1.install(plugin)
             self.ra.api_v2.install(plugin)
 
-    def start(self, daemon=True):
+    def start(self, daemon=True, **run_kwargs):
         """from multiprocessing import Process
         self.p1 = Process(target=ra.run, kwargs={"host": "0.0.0.0"})
         self.p1.start()
@@ -83,21 +84,25 @@ class TestServerLauncher(object):
 
             def __init__(self, *args, **kwargs):
                 super(StoppableThread, self).__init__(*args, **kwargs)
-                self._stop = threading.Event()
+                self._stop_event = threading.Event()  # Thread._stop() is used by join()
 
             def stop(self):
-                self._stop.set()
+                self._stop_event.set()
 
             def stopped(self):
-                return self._stop.isSet()
+                return self._stop_event.isSet()
 
-        self.t1 = StoppableThread(target=self.ra.run, kwargs={"host": "0.0.0.0", "quiet": True})
+        run_kwargs.update({"host": "0.0.0.0", "quiet": True})
+        self.t1 = StoppableThread(target=self.ra.run, kwargs=run_kwargs)
         self.t1.daemon = daemon
         self.t1.start()
         time.sleep(1)
 
     def stop(self):
         self.ra.root_app.close()
+        if self.ra.workers_server is not None:  # It can be stopped, waiting for its workers
+            self.ra.workers_server.stop()
+            self.t1.join()
         self.t1.stop()
 
     def clean(self):
@@ -0,0 +1,67 @@
+""" Benchmark of the extraction of a tarball with many small files, like the ones of the headers
+of big libraries, comparing tar_extract() with the plain TarFile.extractall():
+
+    python -m conans.test.utils.tar_extract_benchmark --files 100000 --threads 8
+
+With a single CPU the files are written sequentially, like extractall() does, so the times should
+be similar. The best time of some interleaved runs of each one is reported, the disk timings are
+noisy
+"""
+import argparse
+import os
+import tarfile
+import time
+
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import gzopen_without_timestamps, save, tar_extract
+
+
+def _create_tgz(folder, files):
+    ori_folder = os.path.join(folder, "ori")
+    for i in range(files):
+        save(os.path.join(ori_folder, "include", "folder%d" % (i % 500), "header%d.h" % i),
+             "#define HEADER%d %s\n" % (i, "x" * (i % 2000)))
+    tgz_file = os.path.join(folder, "files.tgz")
+    with open(tgz_file, "wb") as tgz_handle:
+        tgz = gzopen_without_timestamps("name", mode="w", fileobj=tgz_handle)
+        tgz.add(ori_folder, arcname=".")
+        tgz.close()
+    return tgz_file
+
+
+def run_benchmark(files, threads, runs):
+    """ returns the best times of extractall() and tar_extract() for a tarball of "files" files
+    """
+    folder = temp_folder()
+    tgz_file = _create_tgz(folder, files)
+    extractall_times, tar_extract_times = [], []
+    for run in range(runs):
+        start = time.time()
+        with tarfile.open(tgz_file) as the_tar:
+            the_tar.extractall(os.path.join(folder, "extractall%d" % run))
+        extractall_times.append(time.time() - start)
+
+        start = time.time()
+        with open(tgz_file, "rb") as file_handler:
+            tar_extract(file_handler, os.path.join(folder, "tar_extract%d" % run),
+                        threads=threads)
+        tar_extract_times.append(time.time() - start)
+    return {"extractall": min(extractall_times),
+            "tar_extract": min(tar_extract_times)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of the tarballs extraction")
+    parser.add_argument("--files", type=int, default=100000, help="Files of the tarball")
+    parser.add_argument("--threads", type=int, default=None,
+                        help="Threads of tar_extract(), by default depending on the CPUs")
+    parser.add_argument("--runs", type=int, default=2, help="Runs of each extraction")
+    args = parser.parse_args()
+
+    result = run_benchmark(args.files, args.threads, args.runs)
+    print("%d files: extractall() %.2fs, tar_extract() %.2fs"
+          % (args.files, result["extractall"], result["tar_extract"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import errno
 import hashlib
+import multiprocessing
 import os
 import platform
 import re
@@ -10,13 +11,17 @@ import tarfile
 import tempfile
 
 
-from os.path import abspath, join as joinpath, realpath
+from collections import OrderedDict
 from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
+from os.path import abspath, join as joinpath, realpath
 
 import six
 
 from conans.util.log import logger
 
+_PARALLEL_EXTRACT_MAX_SIZE = 1024 * 1024  # bigger files are extracted streaming, not in memory
+
 
 def walk(top, **kwargs):
     if six.PY2:
@@ -321,7 +326,16 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None,
         raise CompressionError("gzip module is not available")
 
     try:
-        fileobj = gzip.GzipFile(name, mode, compresslevel, fileobj, mtime=0)
+        compression_threads = int(os.getenv("CONAN_COMPRESSION_THREADS") or 0)
+    except ValueError:
+        from conans.errors import ConanException
+        raise ConanException("Specify a numeric parameter for 'compression_threads'")
+    try:
+        if mode == "w" and compression_threads > 1 and six.PY3:
+            from conans.util.parallel_gzip import ParallelGzipFile
+            fileobj = ParallelGzipFile(name, fileobj, compresslevel, compression_threads)
+        else:
+            fileobj = gzip.GzipFile(name, mode, compresslevel, fileobj, mtime=0)
     except OSError:
         if fileobj is not None and mode == 'r':
             raise ReadError("not a gzip file")
@@ -343,31 +357,115 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None,
     return t
 
 
-def tar_extract(fileobj, destination_dir):
-    """Extract tar file controlling not absolute paths and fixing the routes
-    if the tar was zipped in windows"""
-    def badpath(path, base):
-        # joinpath will ignore base if path is absolute
-        return not realpath(abspath(joinpath(base, path))).startswith(base)
+def _set_tar_member_attrs(the_tar, member, target):
+    """ owner, permissions and modification time, ignoring the errors as extractall() does
+    """
+    try:
+        if six.PY2:
+            the_tar.chown(member, target)
+        else:
+            the_tar.chown(member, target, False)
+        the_tar.chmod(member, target)
+        the_tar.utime(member, target)
+    except tarfile.ExtractError as e:
+        logger.debug("tar: %s" % str(e))
 
-    def safemembers(members):
-        base = realpath(abspath(destination_dir))
 
-        for finfo in members:
-            if badpath(finfo.name, base) or finfo.islnk():
-                logger.warning("file:%s is skipped since it's not safe." % str(finfo.name))
-                continue
-            else:
-                # Fixes unzip a windows zipped file in linux
-                finfo.name = finfo.name.replace("\\", "/")
-                yield finfo
+def _write_tar_member(the_tar, member, target, data):
+    with open(target, "wb") as f:
+        f.write(data)
+    _set_tar_member_attrs(the_tar, member, target)
+
 
+def tar_extract(fileobj, destination_dir, threads=None):
+    """Extract tar file controlling not absolute paths and fixing the routes
+    if the tar was zipped in windows.
+    The tar is read and decompressed sequentially in this thread, while the contents of the
+    small regular files are written to disk by a pool of threads"""
+    destination = abspath(destination_dir)
+    base = realpath(destination)
+    safe_folders = {}  # realpath() checks are cached per folder, not per file
+    links = set()
+
+    def badpath(path):
+        folder, name = os.path.split(path)
+        if name == ".." or path in links:
+            # joinpath will ignore base if path is absolute
+            return not realpath(abspath(joinpath(base, path))).startswith(base)
+        safe = safe_folders.get(folder)
+        if safe is None:
+            safe = realpath(abspath(joinpath(base, folder))).startswith(base)
+            safe_folders[folder] = safe
+        return not safe
+
+    threads = threads or min(8, multiprocessing.cpu_count())
+    # With a single thread, handing the files to another thread only adds overhead
+    pool = ThreadPool(threads) if threads > 1 else None
+    pending = OrderedDict()  # {target: AsyncResult} of the files being written
+    max_pending = 4 * threads
+    created_folders = set()
+    directories = []
+
+    # The compression is detected seeking back to the start, but then the members are read in
+    # order, so the tar is decompressed sequentially
     the_tar = tarfile.open(fileobj=fileobj)
     # NOTE: The errorlevel=2 has been removed because it was failing in Win10, it didn't allow to
     # "could not change modification time", with time=0
     # the_tar.errorlevel = 2  # raise exception if any error
-    the_tar.extractall(path=destination_dir, members=safemembers(the_tar))
-    the_tar.close()
+    try:
+        for member in the_tar:
+            # Fixes unzip a windows zipped file in linux
+            name = member.name.replace("\\", "/")
+            if badpath(name) or member.islnk():
+                logger.warning("file:%s is skipped since it's not safe." % str(member.name))
+                continue
+            member.name = name
+            target = os.path.normpath(joinpath(destination, name))
+            if target in pending:  # Repeated member in the tar, the last one wins
+                pending.pop(target).get()
+
+            if member.isdir():
+                folders, parent = [target], target
+                directories.append((member, target))
+            else:
+                folders, parent = [], os.path.dirname(target)
+            while parent not in created_folders and parent != os.path.dirname(parent):
+                folders.append(parent)
+                parent = os.path.dirname(parent)
+            for folder in reversed(folders):
+                if not os.path.isdir(folder):
+                    os.makedirs(folder)
+                created_folders.add(folder)
+
+            if member.isdir():
+                continue
+            elif member.isreg() and member.size <= _PARALLEL_EXTRACT_MAX_SIZE:
+                data = the_tar.extractfile(member).read()
+                if pool is None:
+                    _write_tar_member(the_tar, member, target, data)
+                    continue
+                pending[target] = pool.apply_async(_write_tar_member,
+                                                   (the_tar, member, target, data))
+                while len(pending) > max_pending:
+                    pending.popitem(last=False)[1].get()
+            else:
+                if member.issym():
+                    links.add(name)
+                    safe_folders.clear()
+                the_tar.extract(member, destination)
+        for result in pending.values():
+            result.get()
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        the_tar.close()
+
+    # Set the attributes of the folders at the end, as extractall() does, the files inside
+    # would change their modification time
+    directories.sort(key=lambda d: d[0].name, reverse=True)
+    for member, target in directories:
+        _set_tar_member_attrs(the_tar, member, target)
 
 
 def list_folder_subdirs(basedir, level):
@@ -3,6 +3,11 @@ import time
 
 import fasteners
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 from conans.util.files import load, save
 from conans.util.log import logger
 
@@ -40,6 +45,8 @@ class Lock(object):
             os.remove(folder + ".count")
         if os.path.exists(folder + ".count.lock"):
             os.remove(folder + ".count.lock")
+        if os.path.exists(folder + ".lock"):
+            os.remove(folder + ".lock")
 
     def __init__(self, folder, locked_item, output):
         self._count_file = folder + ".count"
@@ -59,6 +66,12 @@ class Lock(object):
                               % str(self._locked_item))
             self._output.info("If not the case, quit, and do 'conan remove --locks'")
 
+    def _log_wait(self, kind, start):
+        waited = time.time() - start
+        if waited > 0.001:
+            logger.debug("LOCK: Waited %.3fs for the %s lock of %s"
+                         % (waited, kind, str(self._locked_item)))
+
     def _readers(self):
         try:
             return int(load(self._count_file))
@@ -72,6 +85,7 @@ class Lock(object):
 class ReadLock(Lock):
 
     def __enter__(self):
+        start = time.time()
         while True:
             with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
                 readers = self._readers()
@@ -80,6 +94,7 @@ class ReadLock(Lock):
                     break
             self._info_locked()
             time.sleep(READ_BUSY_DELAY)
+        self._log_wait("read", start)
 
     def __exit__(self, exc_type, exc_val, exc_tb):   # @UnusedVariable
         with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
@@ -90,6 +105,7 @@ class ReadLock(Lock):
 class WriteLock(Lock):
 
     def __enter__(self):
+        start = time.time()
         while True:
             with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
                 readers = self._readers()
@@ -98,6 +114,7 @@ class WriteLock(Lock):
                     break
             self._info_locked()
             time.sleep(WRITE_BUSY_DELAY)
+        self._log_wait("write", start)
 
     def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
         with fasteners.InterProcessLock(self._count_lock_file, logger=logger):
@@ -118,3 +135,69 @@ class WriteLock(Lock):
                     path = os.path.dirname(path)
             except Exception:
                 pass
+
+
+class FcntlLock(Lock):
+    """ Shared (read) or exclusive (write) lock of a single file with flock(), the process
+    waiting for it is blocked by the kernel until it is released, without polling nor rewriting
+    any counter file. flock() locks belong to the open file, so they also exclude the threads of
+    the same process. Only for platforms with fcntl (not Windows)
+    """
+    _kind = None
+    _operation = None
+
+    def __init__(self, folder, locked_item, output):
+        super(FcntlLock, self).__init__(folder, locked_item, output)
+        self._lock_file = folder + ".lock"
+        self._fd = None
+
+    @property
+    def files(self):
+        return (self._lock_file, )
+
+    def _open(self):
+        folder = os.path.dirname(self._lock_file)
+        if folder and not os.path.exists(folder):
+            try:
+                os.makedirs(folder)
+            except OSError:  # Concurrently created
+                pass
+        return os.open(self._lock_file, os.O_RDWR | os.O_CREAT, 0o666)
+
+    def __enter__(self):
+        start = time.time()
+        while True:
+            fd = self._open()
+            try:
+                try:
+                    fcntl.flock(fd, self._operation | fcntl.LOCK_NB)
+                except (IOError, OSError):
+                    self._info_locked()
+                    fcntl.flock(fd, self._operation)
+                # The file could have been removed (conan remove) while waiting for it, then the
+                # lock is useless, as new comers will lock a new file
+                if os.path.samestat(os.fstat(fd), os.stat(self._lock_file)):
+                    break
+            except OSError:  # The lock file doesn't exist anymore
+                pass
+            except BaseException:
+                os.close(fd)
+                raise
+            os.close(fd)
+        self._fd = fd
+        self._log_wait(self._kind, start)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
+        fd, self._fd = self._fd, None
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+class FcntlReadLock(FcntlLock):
+    _kind = "read"
+    _operation = getattr(fcntl, "LOCK_SH", None)
+
+
+class FcntlWriteLock(FcntlLock):
+    _kind = "write"
+    _operation = getattr(fcntl, "LOCK_EX", None)
@@ -0,0 +1,108 @@
+import os
+import struct
+import zlib
+from collections import deque
+from multiprocessing.pool import ThreadPool
+
+BLOCK_SIZE = 128 * 1024
+DICTIONARY_SIZE = 32 * 1024  # deflate window
+
+
+def _compress_block(data, dictionary, compresslevel, last):
+    if dictionary:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                      zlib.DEF_MEM_LEVEL, zlib.Z_DEFAULT_STRATEGY, dictionary)
+    else:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+    # The SYNC_FLUSH ends the block at a byte boundary, without marking the end of the stream,
+    # so the next block raw deflate data can be just concatenated
+    return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if last
+                                                        else zlib.Z_SYNC_FLUSH)
+
+
+class ParallelGzipFile(object):
+    """ Write-only file object that produces a standard gzip stream, compressing blocks of
+    BLOCK_SIZE bytes in parallel threads (zlib releases the GIL), as "pigz" does. Every block is
+    compressed using the previous block last 32KB as the deflate dictionary. The result only
+    depends on the data and the compression level, not on the number of threads, so it is
+    deterministic. Like the GzipFile used in gzopen_without_timestamps(), the header has no
+    timestamp.
+    """
+
+    def __init__(self, name, fileobj, compresslevel, threads):
+        self.name = name
+        self._myfileobj = None
+        if fileobj is None:
+            fileobj = self._myfileobj = open(name, "wb")
+        self._fileobj = fileobj
+        self._compresslevel = compresslevel
+        self._pool = ThreadPool(threads)
+        self._max_pending = 2 * threads
+        self._pending = deque()
+        self._buffer = []
+        self._buffer_size = 0
+        self._dictionary = b""
+        self._crc = zlib.crc32(b"")
+        self._size = 0
+        self._closed = False
+        self._write_header()
+
+    def _write_header(self):
+        fname = os.path.basename(self.name or "")
+        if not isinstance(fname, bytes):
+            fname = fname.encode("latin-1")
+        if fname.endswith(b".gz"):
+            fname = fname[:-3]
+        flags = 0x08 if fname else 0  # FNAME
+        xfl = 2 if self._compresslevel == 9 else (4 if self._compresslevel == 1 else 0)
+        header = b"\037\213\010" + struct.pack("<BLBB", flags, 0, xfl, 255)
+        if fname:
+            header += fname + b"\000"
+        self._fileobj.write(header)
+
+    def tell(self):
+        return self._size
+
+    def write(self, data):
+        data = bytes(data)
+        written = len(data)
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += written
+        self._buffer.append(data)
+        self._buffer_size += written
+        if self._buffer_size >= BLOCK_SIZE:
+            data = b"".join(self._buffer)
+            # Always the same blocks for the same data, whatever the size of write() calls
+            for start in range(0, len(data) - BLOCK_SIZE + 1, BLOCK_SIZE):
+                self._submit(data[start:start + BLOCK_SIZE], last=False)
+            remaining = data[len(data) - len(data) % BLOCK_SIZE:]
+            self._buffer = [remaining] if remaining else []
+            self._buffer_size = len(remaining)
+        return written
+
+    def _submit(self, block, last):
+        result = self._pool.apply_async(_compress_block, (block, self._dictionary,
+                                                          self._compresslevel, last))
+        self._pending.append(result)
+        self._dictionary = (self._dictionary + block)[-DICTIONARY_SIZE:]
+        while len(self._pending) > self._max_pending:
+            self._fileobj.write(self._pending.popleft().get())
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._submit(b"".join(self._buffer), last=True)
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().get())
+            self._fileobj.write(struct.pack("<LL", self._crc & 0xffffffff,
+                                            self._size & 0xffffffff))
+        finally:
+            self._pool.terminate()
+            self._pool.join()
+            if self._myfileobj is not None:
+                self._myfileobj.close()
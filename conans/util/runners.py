@@ -6,8 +6,8 @@ from contextlib import contextmanager
 
 import six
 
-from conans.client.tools.files import load
 from conans.errors import CalledProcessErrorWithStderr
+from conans.util.files import load
 from conans.util.log import logger
 
 
@@ -136,7 +136,7 @@ def log_package_built(pref, duration, log_run=None):
                    {"_id": repr(pref.copy_clear_revs()), "duration": duration, "log": log_run})
 
 
-def log_client_rest_api_call(url, method, duration, headers):
+def log_client_rest_api_call(url, method, duration, headers, connections=None):
     headers = copy.copy(headers)
     if "Authorization" in headers:
         headers["Authorization"] = MASKED_FIELD
@@ -144,8 +144,10 @@ def log_client_rest_api_call(url, method, duration, headers):
         headers["X-Client-Anonymous-Id"] = MASKED_FIELD
     if "signature=" in url:
         url = url.split("signature=")[0] + "signature=%s" % MASKED_FIELD
-    _append_action("REST_API_CALL", {"method": method, "url": url,
-                                     "duration": duration, "headers": headers})
+    data = {"method": method, "url": url, "duration": duration, "headers": headers}
+    if connections is not None:
+        data["connections"] = connections
+    _append_action("REST_API_CALL", data)
 
 
 def log_command(name, parameters):